@@ -0,0 +1,89 @@
+# CMAKE generated file: DO NOT EDIT!
+# Generated by "Unix Makefiles" Generator, CMake Version 3.25
+
+# The generator used is:
+set(CMAKE_DEPENDS_GENERATOR "Unix Makefiles")
+
+# The top level Makefile was generated from the following files:
+set(CMAKE_MAKEFILE_DEPENDS
+  "CMakeCache.txt"
+  "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/pybind11/share/cmake/pybind11/FindPythonLibsNew.cmake"
+  "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/pybind11/share/cmake/pybind11/pybind11Common.cmake"
+  "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/pybind11/share/cmake/pybind11/pybind11Config.cmake"
+  "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/pybind11/share/cmake/pybind11/pybind11ConfigVersion.cmake"
+  "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/pybind11/share/cmake/pybind11/pybind11Targets.cmake"
+  "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/pybind11/share/cmake/pybind11/pybind11Tools.cmake"
+  "CMakeFiles/3.25.1/CMakeCCompiler.cmake"
+  "CMakeFiles/3.25.1/CMakeCXXCompiler.cmake"
+  "CMakeFiles/3.25.1/CMakeSystem.cmake"
+  "/root/package/CMakeLists.txt"
+  "/root/package/cmake/ONNXConfig.cmake.in"
+  "/root/package/cmake/ONNXConfigVersion.cmake.in"
+  "/root/package/cmake/Utils.cmake"
+  "/root/package/cmake/summary.cmake"
+  "/root/package/tools/protoc-gen-mypy.sh.in"
+  "/usr/share/cmake-3.25/Modules/CMakeCInformation.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeCXXInformation.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeCheckCompilerFlagCommonPatterns.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeCommonLanguageInclude.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeFindFrameworks.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeGenericSystem.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeInitializeConfigs.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeLanguageInformation.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeSystemSpecificInformation.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeSystemSpecificInitialize.cmake"
+  "/usr/share/cmake-3.25/Modules/CheckCSourceCompiles.cmake"
+  "/usr/share/cmake-3.25/Modules/CheckCXXCompilerFlag.cmake"
+  "/usr/share/cmake-3.25/Modules/CheckCXXSourceCompiles.cmake"
+  "/usr/share/cmake-3.25/Modules/CheckIncludeFile.cmake"
+  "/usr/share/cmake-3.25/Modules/CheckLibraryExists.cmake"
+  "/usr/share/cmake-3.25/Modules/Compiler/CMakeCommonCompilerMacros.cmake"
+  "/usr/share/cmake-3.25/Modules/Compiler/GNU-C.cmake"
+  "/usr/share/cmake-3.25/Modules/Compiler/GNU-CXX.cmake"
+  "/usr/share/cmake-3.25/Modules/Compiler/GNU.cmake"
+  "/usr/share/cmake-3.25/Modules/FindPackageHandleStandardArgs.cmake"
+  "/usr/share/cmake-3.25/Modules/FindPackageMessage.cmake"
+  "/usr/share/cmake-3.25/Modules/FindProtobuf.cmake"
+  "/usr/share/cmake-3.25/Modules/FindPythonInterp.cmake"
+  "/usr/share/cmake-3.25/Modules/FindPythonLibs.cmake"
+  "/usr/share/cmake-3.25/Modules/FindThreads.cmake"
+  "/usr/share/cmake-3.25/Modules/GNUInstallDirs.cmake"
+  "/usr/share/cmake-3.25/Modules/Internal/CheckCompilerFlag.cmake"
+  "/usr/share/cmake-3.25/Modules/Internal/CheckFlagCommonConfig.cmake"
+  "/usr/share/cmake-3.25/Modules/Internal/CheckSourceCompiles.cmake"
+  "/usr/share/cmake-3.25/Modules/Platform/Linux-GNU-C.cmake"
+  "/usr/share/cmake-3.25/Modules/Platform/Linux-GNU-CXX.cmake"
+  "/usr/share/cmake-3.25/Modules/Platform/Linux-GNU.cmake"
+  "/usr/share/cmake-3.25/Modules/Platform/Linux.cmake"
+  "/usr/share/cmake-3.25/Modules/Platform/UnixPaths.cmake"
+  "/usr/share/cmake-3.25/Modules/SelectLibraryConfigurations.cmake"
+  )
+
+# The corresponding makefile is:
+set(CMAKE_MAKEFILE_OUTPUTS
+  "Makefile"
+  "CMakeFiles/cmake.check_cache"
+  )
+
+# Byproducts of CMake generate step:
+set(CMAKE_MAKEFILE_PRODUCTS
+  "/root/package/tools/protoc-gen-mypy.sh"
+  "/root/package/tools/protoc-gen-mypy.sh"
+  "/root/package/tools/protoc-gen-mypy.sh"
+  "ONNXConfigVersion.cmake"
+  "ONNXConfig.cmake"
+  "CMakeFiles/CMakeDirectoryInformation.cmake"
+  )
+
+# Dependency information for all targets:
+set(CMAKE_DEPEND_INFO_FILES
+  "CMakeFiles/gen_onnx_proto.dir/DependInfo.cmake"
+  "CMakeFiles/gen_onnx_operators_proto.dir/DependInfo.cmake"
+  "CMakeFiles/gen_onnx_data_proto.dir/DependInfo.cmake"
+  "CMakeFiles/onnx_proto.dir/DependInfo.cmake"
+  "CMakeFiles/onnx.dir/DependInfo.cmake"
+  "CMakeFiles/onnx_cpp2py_export.dir/DependInfo.cmake"
+  "CMakeFiles/onnxifi_loader.dir/DependInfo.cmake"
+  "CMakeFiles/onnxifi_wrapper.dir/DependInfo.cmake"
+  "CMakeFiles/onnxifi_dummy.dir/DependInfo.cmake"
+  )
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/gen_onnx_data_proto"
+  "onnx/onnx-data.pb.cc"
+  "onnx/onnx-data.pb.h"
+  "onnx/onnx-data.proto"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang )
+  include(CMakeFiles/gen_onnx_data_proto.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/gen_onnx_operators_proto"
+  "onnx/onnx-operators-ml.pb.cc"
+  "onnx/onnx-operators-ml.pb.h"
+  "onnx/onnx-operators-ml.proto"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang )
+  include(CMakeFiles/gen_onnx_operators_proto.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
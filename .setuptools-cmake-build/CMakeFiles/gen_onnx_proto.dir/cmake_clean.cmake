@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/gen_onnx_proto"
+  "onnx/onnx-ml.pb.cc"
+  "onnx/onnx-ml.pb.h"
+  "onnx/onnx-ml.proto"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang )
+  include(CMakeFiles/gen_onnx_proto.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,65 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/onnx/checker.cc" "CMakeFiles/onnx.dir/onnx/checker.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/checker.cc.o.d"
+  "/root/package/onnx/common/assertions.cc" "CMakeFiles/onnx.dir/onnx/common/assertions.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/common/assertions.cc.o.d"
+  "/root/package/onnx/common/interned_strings.cc" "CMakeFiles/onnx.dir/onnx/common/interned_strings.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/common/interned_strings.cc.o.d"
+  "/root/package/onnx/common/ir_pb_converter.cc" "CMakeFiles/onnx.dir/onnx/common/ir_pb_converter.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/common/ir_pb_converter.cc.o.d"
+  "/root/package/onnx/common/model_helpers.cc" "CMakeFiles/onnx.dir/onnx/common/model_helpers.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/common/model_helpers.cc.o.d"
+  "/root/package/onnx/common/path.cc" "CMakeFiles/onnx.dir/onnx/common/path.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/common/path.cc.o.d"
+  "/root/package/onnx/common/status.cc" "CMakeFiles/onnx.dir/onnx/common/status.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/common/status.cc.o.d"
+  "/root/package/onnx/defs/attr_proto_util.cc" "CMakeFiles/onnx.dir/onnx/defs/attr_proto_util.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/attr_proto_util.cc.o.d"
+  "/root/package/onnx/defs/controlflow/defs.cc" "CMakeFiles/onnx.dir/onnx/defs/controlflow/defs.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/controlflow/defs.cc.o.d"
+  "/root/package/onnx/defs/controlflow/old.cc" "CMakeFiles/onnx.dir/onnx/defs/controlflow/old.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/controlflow/old.cc.o.d"
+  "/root/package/onnx/defs/data_type_utils.cc" "CMakeFiles/onnx.dir/onnx/defs/data_type_utils.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/data_type_utils.cc.o.d"
+  "/root/package/onnx/defs/function.cc" "CMakeFiles/onnx.dir/onnx/defs/function.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/function.cc.o.d"
+  "/root/package/onnx/defs/generator/defs.cc" "CMakeFiles/onnx.dir/onnx/defs/generator/defs.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/generator/defs.cc.o.d"
+  "/root/package/onnx/defs/generator/old.cc" "CMakeFiles/onnx.dir/onnx/defs/generator/old.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/generator/old.cc.o.d"
+  "/root/package/onnx/defs/logical/defs.cc" "CMakeFiles/onnx.dir/onnx/defs/logical/defs.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/logical/defs.cc.o.d"
+  "/root/package/onnx/defs/logical/old.cc" "CMakeFiles/onnx.dir/onnx/defs/logical/old.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/logical/old.cc.o.d"
+  "/root/package/onnx/defs/math/defs.cc" "CMakeFiles/onnx.dir/onnx/defs/math/defs.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/math/defs.cc.o.d"
+  "/root/package/onnx/defs/math/old.cc" "CMakeFiles/onnx.dir/onnx/defs/math/old.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/math/old.cc.o.d"
+  "/root/package/onnx/defs/nn/defs.cc" "CMakeFiles/onnx.dir/onnx/defs/nn/defs.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/nn/defs.cc.o.d"
+  "/root/package/onnx/defs/nn/old.cc" "CMakeFiles/onnx.dir/onnx/defs/nn/old.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/nn/old.cc.o.d"
+  "/root/package/onnx/defs/object_detection/defs.cc" "CMakeFiles/onnx.dir/onnx/defs/object_detection/defs.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/object_detection/defs.cc.o.d"
+  "/root/package/onnx/defs/object_detection/old.cc" "CMakeFiles/onnx.dir/onnx/defs/object_detection/old.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/object_detection/old.cc.o.d"
+  "/root/package/onnx/defs/optional/defs.cc" "CMakeFiles/onnx.dir/onnx/defs/optional/defs.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/optional/defs.cc.o.d"
+  "/root/package/onnx/defs/parser.cc" "CMakeFiles/onnx.dir/onnx/defs/parser.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/parser.cc.o.d"
+  "/root/package/onnx/defs/printer.cc" "CMakeFiles/onnx.dir/onnx/defs/printer.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/printer.cc.o.d"
+  "/root/package/onnx/defs/quantization/defs.cc" "CMakeFiles/onnx.dir/onnx/defs/quantization/defs.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/quantization/defs.cc.o.d"
+  "/root/package/onnx/defs/quantization/old.cc" "CMakeFiles/onnx.dir/onnx/defs/quantization/old.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/quantization/old.cc.o.d"
+  "/root/package/onnx/defs/reduction/defs.cc" "CMakeFiles/onnx.dir/onnx/defs/reduction/defs.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/reduction/defs.cc.o.d"
+  "/root/package/onnx/defs/reduction/old.cc" "CMakeFiles/onnx.dir/onnx/defs/reduction/old.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/reduction/old.cc.o.d"
+  "/root/package/onnx/defs/rnn/defs.cc" "CMakeFiles/onnx.dir/onnx/defs/rnn/defs.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/rnn/defs.cc.o.d"
+  "/root/package/onnx/defs/rnn/old.cc" "CMakeFiles/onnx.dir/onnx/defs/rnn/old.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/rnn/old.cc.o.d"
+  "/root/package/onnx/defs/schema.cc" "CMakeFiles/onnx.dir/onnx/defs/schema.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/schema.cc.o.d"
+  "/root/package/onnx/defs/sequence/defs.cc" "CMakeFiles/onnx.dir/onnx/defs/sequence/defs.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/sequence/defs.cc.o.d"
+  "/root/package/onnx/defs/shape_inference.cc" "CMakeFiles/onnx.dir/onnx/defs/shape_inference.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/shape_inference.cc.o.d"
+  "/root/package/onnx/defs/tensor/defs.cc" "CMakeFiles/onnx.dir/onnx/defs/tensor/defs.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/tensor/defs.cc.o.d"
+  "/root/package/onnx/defs/tensor/old.cc" "CMakeFiles/onnx.dir/onnx/defs/tensor/old.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/tensor/old.cc.o.d"
+  "/root/package/onnx/defs/tensor/utils.cc" "CMakeFiles/onnx.dir/onnx/defs/tensor/utils.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/tensor/utils.cc.o.d"
+  "/root/package/onnx/defs/tensor_proto_util.cc" "CMakeFiles/onnx.dir/onnx/defs/tensor_proto_util.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/tensor_proto_util.cc.o.d"
+  "/root/package/onnx/defs/tensor_util.cc" "CMakeFiles/onnx.dir/onnx/defs/tensor_util.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/tensor_util.cc.o.d"
+  "/root/package/onnx/defs/traditionalml/defs.cc" "CMakeFiles/onnx.dir/onnx/defs/traditionalml/defs.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/traditionalml/defs.cc.o.d"
+  "/root/package/onnx/defs/traditionalml/old.cc" "CMakeFiles/onnx.dir/onnx/defs/traditionalml/old.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/traditionalml/old.cc.o.d"
+  "/root/package/onnx/defs/training/defs.cc" "CMakeFiles/onnx.dir/onnx/defs/training/defs.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/defs/training/defs.cc.o.d"
+  "/root/package/onnx/onnxifi_utils.cc" "CMakeFiles/onnx.dir/onnx/onnxifi_utils.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/onnxifi_utils.cc.o.d"
+  "/root/package/onnx/shape_inference/implementation.cc" "CMakeFiles/onnx.dir/onnx/shape_inference/implementation.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/shape_inference/implementation.cc.o.d"
+  "/root/package/onnx/version_converter/convert.cc" "CMakeFiles/onnx.dir/onnx/version_converter/convert.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/version_converter/convert.cc.o.d"
+  "/root/package/onnx/version_converter/helper.cc" "CMakeFiles/onnx.dir/onnx/version_converter/helper.cc.o" "gcc" "CMakeFiles/onnx.dir/onnx/version_converter/helper.cc.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  "/root/package/.setuptools-cmake-build/CMakeFiles/onnx_proto.dir/DependInfo.cmake"
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
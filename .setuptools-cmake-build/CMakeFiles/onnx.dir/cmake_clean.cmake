@@ -0,0 +1,101 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/onnx.dir/onnx/checker.cc.o"
+  "CMakeFiles/onnx.dir/onnx/checker.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/common/assertions.cc.o"
+  "CMakeFiles/onnx.dir/onnx/common/assertions.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/common/interned_strings.cc.o"
+  "CMakeFiles/onnx.dir/onnx/common/interned_strings.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/common/ir_pb_converter.cc.o"
+  "CMakeFiles/onnx.dir/onnx/common/ir_pb_converter.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/common/model_helpers.cc.o"
+  "CMakeFiles/onnx.dir/onnx/common/model_helpers.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/common/path.cc.o"
+  "CMakeFiles/onnx.dir/onnx/common/path.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/common/status.cc.o"
+  "CMakeFiles/onnx.dir/onnx/common/status.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/attr_proto_util.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/attr_proto_util.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/controlflow/defs.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/controlflow/defs.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/controlflow/old.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/controlflow/old.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/data_type_utils.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/data_type_utils.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/function.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/function.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/generator/defs.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/generator/defs.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/generator/old.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/generator/old.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/logical/defs.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/logical/defs.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/logical/old.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/logical/old.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/math/defs.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/math/defs.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/math/old.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/math/old.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/nn/defs.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/nn/defs.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/nn/old.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/nn/old.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/object_detection/defs.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/object_detection/defs.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/object_detection/old.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/object_detection/old.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/optional/defs.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/optional/defs.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/parser.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/parser.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/printer.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/printer.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/quantization/defs.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/quantization/defs.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/quantization/old.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/quantization/old.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/reduction/defs.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/reduction/defs.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/reduction/old.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/reduction/old.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/rnn/defs.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/rnn/defs.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/rnn/old.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/rnn/old.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/schema.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/schema.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/sequence/defs.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/sequence/defs.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/shape_inference.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/shape_inference.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/tensor/defs.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/tensor/defs.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/tensor/old.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/tensor/old.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/tensor/utils.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/tensor/utils.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/tensor_proto_util.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/tensor_proto_util.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/tensor_util.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/tensor_util.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/traditionalml/defs.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/traditionalml/defs.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/traditionalml/old.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/traditionalml/old.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/defs/training/defs.cc.o"
+  "CMakeFiles/onnx.dir/onnx/defs/training/defs.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/onnxifi_utils.cc.o"
+  "CMakeFiles/onnx.dir/onnx/onnxifi_utils.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/shape_inference/implementation.cc.o"
+  "CMakeFiles/onnx.dir/onnx/shape_inference/implementation.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/version_converter/convert.cc.o"
+  "CMakeFiles/onnx.dir/onnx/version_converter/convert.cc.o.d"
+  "CMakeFiles/onnx.dir/onnx/version_converter/helper.cc.o"
+  "CMakeFiles/onnx.dir/onnx/version_converter/helper.cc.o.d"
+  "libonnx.a"
+  "libonnx.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/onnx.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
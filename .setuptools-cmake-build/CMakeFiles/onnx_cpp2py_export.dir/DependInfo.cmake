@@ -0,0 +1,21 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/onnx/cpp2py_export.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/cpp2py_export.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/cpp2py_export.cc.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  "/root/package/.setuptools-cmake-build/CMakeFiles/onnx.dir/DependInfo.cmake"
+  "/root/package/.setuptools-cmake-build/CMakeFiles/onnx_proto.dir/DependInfo.cmake"
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
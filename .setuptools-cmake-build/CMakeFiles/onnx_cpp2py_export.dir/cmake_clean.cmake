@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/onnx_cpp2py_export.dir/onnx/cpp2py_export.cc.o"
+  "CMakeFiles/onnx_cpp2py_export.dir/onnx/cpp2py_export.cc.o.d"
+  "onnx_cpp2py_export.cpython-311-x86_64-linux-gnu.so"
+  "onnx_cpp2py_export.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/onnx_cpp2py_export.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
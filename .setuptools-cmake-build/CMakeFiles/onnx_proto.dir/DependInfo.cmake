@@ -0,0 +1,29 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/.setuptools-cmake-build/onnx/onnx-data.pb.cc" "CMakeFiles/onnx_proto.dir/onnx/onnx-data.pb.cc.o" "gcc" "CMakeFiles/onnx_proto.dir/onnx/onnx-data.pb.cc.o.d"
+  "/root/package/.setuptools-cmake-build/onnx/onnx-ml.pb.cc" "CMakeFiles/onnx_proto.dir/onnx/onnx-ml.pb.cc.o" "gcc" "CMakeFiles/onnx_proto.dir/onnx/onnx-ml.pb.cc.o.d"
+  "/root/package/.setuptools-cmake-build/onnx/onnx-operators-ml.pb.cc" "CMakeFiles/onnx_proto.dir/onnx/onnx-operators-ml.pb.cc.o" "gcc" "CMakeFiles/onnx_proto.dir/onnx/onnx-operators-ml.pb.cc.o.d"
+  )
+
+# Pairs of files generated by the same build rule.
+set(CMAKE_MULTIPLE_OUTPUT_PAIRS
+  "/root/package/.setuptools-cmake-build/onnx/onnx-data.pb.h" "/root/package/.setuptools-cmake-build/onnx/onnx-data.pb.cc"
+  "/root/package/.setuptools-cmake-build/onnx/onnx-ml.pb.h" "/root/package/.setuptools-cmake-build/onnx/onnx-ml.pb.cc"
+  "/root/package/.setuptools-cmake-build/onnx/onnx-operators-ml.pb.h" "/root/package/.setuptools-cmake-build/onnx/onnx-operators-ml.pb.cc"
+  )
+
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,24 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/onnx_proto.dir/onnx/onnx-data.pb.cc.o"
+  "CMakeFiles/onnx_proto.dir/onnx/onnx-data.pb.cc.o.d"
+  "CMakeFiles/onnx_proto.dir/onnx/onnx-ml.pb.cc.o"
+  "CMakeFiles/onnx_proto.dir/onnx/onnx-ml.pb.cc.o.d"
+  "CMakeFiles/onnx_proto.dir/onnx/onnx-operators-ml.pb.cc.o"
+  "CMakeFiles/onnx_proto.dir/onnx/onnx-operators-ml.pb.cc.o.d"
+  "libonnx_proto.a"
+  "libonnx_proto.pdb"
+  "onnx/onnx-data.pb.cc"
+  "onnx/onnx-data.pb.h"
+  "onnx/onnx-data.proto"
+  "onnx/onnx-ml.pb.cc"
+  "onnx/onnx-ml.pb.h"
+  "onnx/onnx-ml.proto"
+  "onnx/onnx-operators-ml.pb.cc"
+  "onnx/onnx-operators-ml.pb.h"
+  "onnx/onnx-operators-ml.proto"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/onnx_proto.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
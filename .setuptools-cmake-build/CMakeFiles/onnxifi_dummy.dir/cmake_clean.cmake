@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/onnxifi_dummy.dir/onnx/onnxifi_dummy.c.o"
+  "CMakeFiles/onnxifi_dummy.dir/onnx/onnxifi_dummy.c.o.d"
+  "libonnxifi_dummy.pdb"
+  "libonnxifi_dummy.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/onnxifi_dummy.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/onnxifi_loader.dir/onnx/onnxifi_loader.c.o"
+  "CMakeFiles/onnxifi_loader.dir/onnx/onnxifi_loader.c.o.d"
+  "libonnxifi_loader.a"
+  "libonnxifi_loader.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/onnxifi_loader.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
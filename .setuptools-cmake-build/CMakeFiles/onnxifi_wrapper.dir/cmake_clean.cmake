@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/onnxifi_wrapper.dir/onnx/onnxifi_wrapper.c.o"
+  "CMakeFiles/onnxifi_wrapper.dir/onnx/onnxifi_wrapper.c.o.d"
+  "libonnxifi.pdb"
+  "libonnxifi.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/onnxifi_wrapper.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
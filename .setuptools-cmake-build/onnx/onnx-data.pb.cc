@@ -0,0 +1,1582 @@
+// Generated by the protocol buffer compiler.  DO NOT EDIT!
+// source: onnx/onnx-data.proto
+
+#include "onnx/onnx-data.pb.h"
+
+#include <algorithm>
+
+#include <google/protobuf/io/coded_stream.h>
+#include <google/protobuf/extension_set.h>
+#include <google/protobuf/wire_format_lite.h>
+#include <google/protobuf/descriptor.h>
+#include <google/protobuf/generated_message_reflection.h>
+#include <google/protobuf/reflection_ops.h>
+#include <google/protobuf/wire_format.h>
+// @@protoc_insertion_point(includes)
+#include <google/protobuf/port_def.inc>
+
+PROTOBUF_PRAGMA_INIT_SEG
+
+namespace _pb = ::PROTOBUF_NAMESPACE_ID;
+namespace _pbi = _pb::internal;
+
+namespace onnx {
+PROTOBUF_CONSTEXPR SequenceProto::SequenceProto(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.tensor_values_)*/{}
+  , /*decltype(_impl_.sparse_tensor_values_)*/{}
+  , /*decltype(_impl_.sequence_values_)*/{}
+  , /*decltype(_impl_.map_values_)*/{}
+  , /*decltype(_impl_.optional_values_)*/{}
+  , /*decltype(_impl_.name_)*/{&::_pbi::fixed_address_empty_string, ::_pbi::ConstantInitialized{}}
+  , /*decltype(_impl_.elem_type_)*/0} {}
+struct SequenceProtoDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR SequenceProtoDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~SequenceProtoDefaultTypeInternal() {}
+  union {
+    SequenceProto _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 SequenceProtoDefaultTypeInternal _SequenceProto_default_instance_;
+PROTOBUF_CONSTEXPR MapProto::MapProto(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.keys_)*/{}
+  , /*decltype(_impl_.string_keys_)*/{}
+  , /*decltype(_impl_.name_)*/{&::_pbi::fixed_address_empty_string, ::_pbi::ConstantInitialized{}}
+  , /*decltype(_impl_.values_)*/nullptr
+  , /*decltype(_impl_.key_type_)*/0} {}
+struct MapProtoDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR MapProtoDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~MapProtoDefaultTypeInternal() {}
+  union {
+    MapProto _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 MapProtoDefaultTypeInternal _MapProto_default_instance_;
+PROTOBUF_CONSTEXPR OptionalProto::OptionalProto(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.name_)*/{&::_pbi::fixed_address_empty_string, ::_pbi::ConstantInitialized{}}
+  , /*decltype(_impl_.tensor_value_)*/nullptr
+  , /*decltype(_impl_.sparse_tensor_value_)*/nullptr
+  , /*decltype(_impl_.sequence_value_)*/nullptr
+  , /*decltype(_impl_.map_value_)*/nullptr
+  , /*decltype(_impl_.optional_value_)*/nullptr
+  , /*decltype(_impl_.elem_type_)*/0} {}
+struct OptionalProtoDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR OptionalProtoDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~OptionalProtoDefaultTypeInternal() {}
+  union {
+    OptionalProto _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 OptionalProtoDefaultTypeInternal _OptionalProto_default_instance_;
+}  // namespace onnx
+static ::_pb::Metadata file_level_metadata_onnx_2fonnx_2ddata_2eproto[3];
+static const ::_pb::EnumDescriptor* file_level_enum_descriptors_onnx_2fonnx_2ddata_2eproto[2];
+static constexpr ::_pb::ServiceDescriptor const** file_level_service_descriptors_onnx_2fonnx_2ddata_2eproto = nullptr;
+
+const uint32_t TableStruct_onnx_2fonnx_2ddata_2eproto::offsets[] PROTOBUF_SECTION_VARIABLE(protodesc_cold) = {
+  PROTOBUF_FIELD_OFFSET(::onnx::SequenceProto, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::onnx::SequenceProto, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::onnx::SequenceProto, _impl_.name_),
+  PROTOBUF_FIELD_OFFSET(::onnx::SequenceProto, _impl_.elem_type_),
+  PROTOBUF_FIELD_OFFSET(::onnx::SequenceProto, _impl_.tensor_values_),
+  PROTOBUF_FIELD_OFFSET(::onnx::SequenceProto, _impl_.sparse_tensor_values_),
+  PROTOBUF_FIELD_OFFSET(::onnx::SequenceProto, _impl_.sequence_values_),
+  PROTOBUF_FIELD_OFFSET(::onnx::SequenceProto, _impl_.map_values_),
+  PROTOBUF_FIELD_OFFSET(::onnx::SequenceProto, _impl_.optional_values_),
+  0,
+  1,
+  ~0u,
+  ~0u,
+  ~0u,
+  ~0u,
+  ~0u,
+  PROTOBUF_FIELD_OFFSET(::onnx::MapProto, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::onnx::MapProto, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::onnx::MapProto, _impl_.name_),
+  PROTOBUF_FIELD_OFFSET(::onnx::MapProto, _impl_.key_type_),
+  PROTOBUF_FIELD_OFFSET(::onnx::MapProto, _impl_.keys_),
+  PROTOBUF_FIELD_OFFSET(::onnx::MapProto, _impl_.string_keys_),
+  PROTOBUF_FIELD_OFFSET(::onnx::MapProto, _impl_.values_),
+  0,
+  2,
+  ~0u,
+  ~0u,
+  1,
+  PROTOBUF_FIELD_OFFSET(::onnx::OptionalProto, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::onnx::OptionalProto, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::onnx::OptionalProto, _impl_.name_),
+  PROTOBUF_FIELD_OFFSET(::onnx::OptionalProto, _impl_.elem_type_),
+  PROTOBUF_FIELD_OFFSET(::onnx::OptionalProto, _impl_.tensor_value_),
+  PROTOBUF_FIELD_OFFSET(::onnx::OptionalProto, _impl_.sparse_tensor_value_),
+  PROTOBUF_FIELD_OFFSET(::onnx::OptionalProto, _impl_.sequence_value_),
+  PROTOBUF_FIELD_OFFSET(::onnx::OptionalProto, _impl_.map_value_),
+  PROTOBUF_FIELD_OFFSET(::onnx::OptionalProto, _impl_.optional_value_),
+  0,
+  6,
+  1,
+  2,
+  3,
+  4,
+  5,
+};
+static const ::_pbi::MigrationSchema schemas[] PROTOBUF_SECTION_VARIABLE(protodesc_cold) = {
+  { 0, 13, -1, sizeof(::onnx::SequenceProto)},
+  { 20, 31, -1, sizeof(::onnx::MapProto)},
+  { 36, 49, -1, sizeof(::onnx::OptionalProto)},
+};
+
+static const ::_pb::Message* const file_default_instances[] = {
+  &::onnx::_SequenceProto_default_instance_._instance,
+  &::onnx::_MapProto_default_instance_._instance,
+  &::onnx::_OptionalProto_default_instance_._instance,
+};
+
+const char descriptor_table_protodef_onnx_2fonnx_2ddata_2eproto[] PROTOBUF_SECTION_VARIABLE(protodesc_cold) =
+  "\n\024onnx/onnx-data.proto\022\004onnx\032\022onnx/onnx-"
+  "ml.proto\"\360\002\n\rSequenceProto\022\014\n\004name\030\001 \001(\t"
+  "\022\021\n\telem_type\030\002 \001(\005\022(\n\rtensor_values\030\003 \003"
+  "(\0132\021.onnx.TensorProto\0225\n\024sparse_tensor_v"
+  "alues\030\004 \003(\0132\027.onnx.SparseTensorProto\022,\n\017"
+  "sequence_values\030\005 \003(\0132\023.onnx.SequencePro"
+  "to\022\"\n\nmap_values\030\006 \003(\0132\016.onnx.MapProto\022,"
+  "\n\017optional_values\030\007 \003(\0132\023.onnx.OptionalP"
+  "roto\"]\n\010DataType\022\r\n\tUNDEFINED\020\000\022\n\n\006TENSO"
+  "R\020\001\022\021\n\rSPARSE_TENSOR\020\002\022\014\n\010SEQUENCE\020\003\022\007\n\003"
+  "MAP\020\004\022\014\n\010OPTIONAL\020\005\"r\n\010MapProto\022\014\n\004name\030"
+  "\001 \001(\t\022\020\n\010key_type\030\002 \001(\005\022\014\n\004keys\030\003 \003(\003\022\023\n"
+  "\013string_keys\030\004 \003(\014\022#\n\006values\030\005 \001(\0132\023.onn"
+  "x.SequenceProto\"\353\002\n\rOptionalProto\022\014\n\004nam"
+  "e\030\001 \001(\t\022\021\n\telem_type\030\002 \001(\005\022\'\n\014tensor_val"
+  "ue\030\003 \001(\0132\021.onnx.TensorProto\0224\n\023sparse_te"
+  "nsor_value\030\004 \001(\0132\027.onnx.SparseTensorProt"
+  "o\022+\n\016sequence_value\030\005 \001(\0132\023.onnx.Sequenc"
+  "eProto\022!\n\tmap_value\030\006 \001(\0132\016.onnx.MapProt"
+  "o\022+\n\016optional_value\030\007 \001(\0132\023.onnx.Optiona"
+  "lProto\"]\n\010DataType\022\r\n\tUNDEFINED\020\000\022\n\n\006TEN"
+  "SOR\020\001\022\021\n\rSPARSE_TENSOR\020\002\022\014\n\010SEQUENCE\020\003\022\007"
+  "\n\003MAP\020\004\022\014\n\010OPTIONAL\020\005"
+  ;
+static const ::_pbi::DescriptorTable* const descriptor_table_onnx_2fonnx_2ddata_2eproto_deps[1] = {
+  &::descriptor_table_onnx_2fonnx_2dml_2eproto,
+};
+static ::_pbi::once_flag descriptor_table_onnx_2fonnx_2ddata_2eproto_once;
+const ::_pbi::DescriptorTable descriptor_table_onnx_2fonnx_2ddata_2eproto = {
+    false, false, 901, descriptor_table_protodef_onnx_2fonnx_2ddata_2eproto,
+    "onnx/onnx-data.proto",
+    &descriptor_table_onnx_2fonnx_2ddata_2eproto_once, descriptor_table_onnx_2fonnx_2ddata_2eproto_deps, 1, 3,
+    schemas, file_default_instances, TableStruct_onnx_2fonnx_2ddata_2eproto::offsets,
+    file_level_metadata_onnx_2fonnx_2ddata_2eproto, file_level_enum_descriptors_onnx_2fonnx_2ddata_2eproto,
+    file_level_service_descriptors_onnx_2fonnx_2ddata_2eproto,
+};
+PROTOBUF_ATTRIBUTE_WEAK const ::_pbi::DescriptorTable* descriptor_table_onnx_2fonnx_2ddata_2eproto_getter() {
+  return &descriptor_table_onnx_2fonnx_2ddata_2eproto;
+}
+
+// Force running AddDescriptors() at dynamic initialization time.
+PROTOBUF_ATTRIBUTE_INIT_PRIORITY2 static ::_pbi::AddDescriptorsRunner dynamic_init_dummy_onnx_2fonnx_2ddata_2eproto(&descriptor_table_onnx_2fonnx_2ddata_2eproto);
+namespace onnx {
+const ::PROTOBUF_NAMESPACE_ID::EnumDescriptor* SequenceProto_DataType_descriptor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&descriptor_table_onnx_2fonnx_2ddata_2eproto);
+  return file_level_enum_descriptors_onnx_2fonnx_2ddata_2eproto[0];
+}
+bool SequenceProto_DataType_IsValid(int value) {
+  switch (value) {
+    case 0:
+    case 1:
+    case 2:
+    case 3:
+    case 4:
+    case 5:
+      return true;
+    default:
+      return false;
+  }
+}
+
+#if (__cplusplus < 201703) && (!defined(_MSC_VER) || (_MSC_VER >= 1900 && _MSC_VER < 1912))
+constexpr SequenceProto_DataType SequenceProto::UNDEFINED;
+constexpr SequenceProto_DataType SequenceProto::TENSOR;
+constexpr SequenceProto_DataType SequenceProto::SPARSE_TENSOR;
+constexpr SequenceProto_DataType SequenceProto::SEQUENCE;
+constexpr SequenceProto_DataType SequenceProto::MAP;
+constexpr SequenceProto_DataType SequenceProto::OPTIONAL;
+constexpr SequenceProto_DataType SequenceProto::DataType_MIN;
+constexpr SequenceProto_DataType SequenceProto::DataType_MAX;
+constexpr int SequenceProto::DataType_ARRAYSIZE;
+#endif  // (__cplusplus < 201703) && (!defined(_MSC_VER) || (_MSC_VER >= 1900 && _MSC_VER < 1912))
+const ::PROTOBUF_NAMESPACE_ID::EnumDescriptor* OptionalProto_DataType_descriptor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&descriptor_table_onnx_2fonnx_2ddata_2eproto);
+  return file_level_enum_descriptors_onnx_2fonnx_2ddata_2eproto[1];
+}
+bool OptionalProto_DataType_IsValid(int value) {
+  switch (value) {
+    case 0:
+    case 1:
+    case 2:
+    case 3:
+    case 4:
+    case 5:
+      return true;
+    default:
+      return false;
+  }
+}
+
+#if (__cplusplus < 201703) && (!defined(_MSC_VER) || (_MSC_VER >= 1900 && _MSC_VER < 1912))
+constexpr OptionalProto_DataType OptionalProto::UNDEFINED;
+constexpr OptionalProto_DataType OptionalProto::TENSOR;
+constexpr OptionalProto_DataType OptionalProto::SPARSE_TENSOR;
+constexpr OptionalProto_DataType OptionalProto::SEQUENCE;
+constexpr OptionalProto_DataType OptionalProto::MAP;
+constexpr OptionalProto_DataType OptionalProto::OPTIONAL;
+constexpr OptionalProto_DataType OptionalProto::DataType_MIN;
+constexpr OptionalProto_DataType OptionalProto::DataType_MAX;
+constexpr int OptionalProto::DataType_ARRAYSIZE;
+#endif  // (__cplusplus < 201703) && (!defined(_MSC_VER) || (_MSC_VER >= 1900 && _MSC_VER < 1912))
+
+// ===================================================================
+
+class SequenceProto::_Internal {
+ public:
+  using HasBits = decltype(std::declval<SequenceProto>()._impl_._has_bits_);
+  static void set_has_name(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_elem_type(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+};
+
+void SequenceProto::clear_tensor_values() {
+  _impl_.tensor_values_.Clear();
+}
+void SequenceProto::clear_sparse_tensor_values() {
+  _impl_.sparse_tensor_values_.Clear();
+}
+SequenceProto::SequenceProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:onnx.SequenceProto)
+}
+SequenceProto::SequenceProto(const SequenceProto& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  SequenceProto* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.tensor_values_){from._impl_.tensor_values_}
+    , decltype(_impl_.sparse_tensor_values_){from._impl_.sparse_tensor_values_}
+    , decltype(_impl_.sequence_values_){from._impl_.sequence_values_}
+    , decltype(_impl_.map_values_){from._impl_.map_values_}
+    , decltype(_impl_.optional_values_){from._impl_.optional_values_}
+    , decltype(_impl_.name_){}
+    , decltype(_impl_.elem_type_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  _impl_.name_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.name_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (from._internal_has_name()) {
+    _this->_impl_.name_.Set(from._internal_name(), 
+      _this->GetArenaForAllocation());
+  }
+  _this->_impl_.elem_type_ = from._impl_.elem_type_;
+  // @@protoc_insertion_point(copy_constructor:onnx.SequenceProto)
+}
+
+inline void SequenceProto::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.tensor_values_){arena}
+    , decltype(_impl_.sparse_tensor_values_){arena}
+    , decltype(_impl_.sequence_values_){arena}
+    , decltype(_impl_.map_values_){arena}
+    , decltype(_impl_.optional_values_){arena}
+    , decltype(_impl_.name_){}
+    , decltype(_impl_.elem_type_){0}
+  };
+  _impl_.name_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.name_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+
+SequenceProto::~SequenceProto() {
+  // @@protoc_insertion_point(destructor:onnx.SequenceProto)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void SequenceProto::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.tensor_values_.~RepeatedPtrField();
+  _impl_.sparse_tensor_values_.~RepeatedPtrField();
+  _impl_.sequence_values_.~RepeatedPtrField();
+  _impl_.map_values_.~RepeatedPtrField();
+  _impl_.optional_values_.~RepeatedPtrField();
+  _impl_.name_.Destroy();
+}
+
+void SequenceProto::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void SequenceProto::Clear() {
+// @@protoc_insertion_point(message_clear_start:onnx.SequenceProto)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.tensor_values_.Clear();
+  _impl_.sparse_tensor_values_.Clear();
+  _impl_.sequence_values_.Clear();
+  _impl_.map_values_.Clear();
+  _impl_.optional_values_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000001u) {
+    _impl_.name_.ClearNonDefaultToEmpty();
+  }
+  _impl_.elem_type_ = 0;
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* SequenceProto::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // optional string name = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 10)) {
+          auto str = _internal_mutable_name();
+          ptr = ::_pbi::InlineGreedyStringParser(str, ptr, ctx);
+          CHK_(ptr);
+          #ifndef NDEBUG
+          ::_pbi::VerifyUTF8(str, "onnx.SequenceProto.name");
+          #endif  // !NDEBUG
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 elem_type = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_elem_type(&has_bits);
+          _impl_.elem_type_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .onnx.TensorProto tensor_values = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 26)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_tensor_values(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<26>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .onnx.SparseTensorProto sparse_tensor_values = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 34)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_sparse_tensor_values(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<34>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .onnx.SequenceProto sequence_values = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 42)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_sequence_values(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<42>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .onnx.MapProto map_values = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 50)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_map_values(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<50>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .onnx.OptionalProto optional_values = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_optional_values(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* SequenceProto::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:onnx.SequenceProto)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // optional string name = 1;
+  if (cached_has_bits & 0x00000001u) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::VerifyUTF8StringNamedField(
+      this->_internal_name().data(), static_cast<int>(this->_internal_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SERIALIZE,
+      "onnx.SequenceProto.name");
+    target = stream->WriteStringMaybeAliased(
+        1, this->_internal_name(), target);
+  }
+
+  // optional int32 elem_type = 2;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(2, this->_internal_elem_type(), target);
+  }
+
+  // repeated .onnx.TensorProto tensor_values = 3;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_tensor_values_size()); i < n; i++) {
+    const auto& repfield = this->_internal_tensor_values(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(3, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // repeated .onnx.SparseTensorProto sparse_tensor_values = 4;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_sparse_tensor_values_size()); i < n; i++) {
+    const auto& repfield = this->_internal_sparse_tensor_values(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(4, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // repeated .onnx.SequenceProto sequence_values = 5;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_sequence_values_size()); i < n; i++) {
+    const auto& repfield = this->_internal_sequence_values(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(5, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // repeated .onnx.MapProto map_values = 6;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_map_values_size()); i < n; i++) {
+    const auto& repfield = this->_internal_map_values(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(6, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // repeated .onnx.OptionalProto optional_values = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_optional_values_size()); i < n; i++) {
+    const auto& repfield = this->_internal_optional_values(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:onnx.SequenceProto)
+  return target;
+}
+
+size_t SequenceProto::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:onnx.SequenceProto)
+  size_t total_size = 0;
+
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .onnx.TensorProto tensor_values = 3;
+  total_size += 1UL * this->_internal_tensor_values_size();
+  for (const auto& msg : this->_impl_.tensor_values_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  // repeated .onnx.SparseTensorProto sparse_tensor_values = 4;
+  total_size += 1UL * this->_internal_sparse_tensor_values_size();
+  for (const auto& msg : this->_impl_.sparse_tensor_values_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  // repeated .onnx.SequenceProto sequence_values = 5;
+  total_size += 1UL * this->_internal_sequence_values_size();
+  for (const auto& msg : this->_impl_.sequence_values_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  // repeated .onnx.MapProto map_values = 6;
+  total_size += 1UL * this->_internal_map_values_size();
+  for (const auto& msg : this->_impl_.map_values_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  // repeated .onnx.OptionalProto optional_values = 7;
+  total_size += 1UL * this->_internal_optional_values_size();
+  for (const auto& msg : this->_impl_.optional_values_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000003u) {
+    // optional string name = 1;
+    if (cached_has_bits & 0x00000001u) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+          this->_internal_name());
+    }
+
+    // optional int32 elem_type = 2;
+    if (cached_has_bits & 0x00000002u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_elem_type());
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData SequenceProto::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    SequenceProto::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*SequenceProto::GetClassData() const { return &_class_data_; }
+
+
+void SequenceProto::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<SequenceProto*>(&to_msg);
+  auto& from = static_cast<const SequenceProto&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:onnx.SequenceProto)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.tensor_values_.MergeFrom(from._impl_.tensor_values_);
+  _this->_impl_.sparse_tensor_values_.MergeFrom(from._impl_.sparse_tensor_values_);
+  _this->_impl_.sequence_values_.MergeFrom(from._impl_.sequence_values_);
+  _this->_impl_.map_values_.MergeFrom(from._impl_.map_values_);
+  _this->_impl_.optional_values_.MergeFrom(from._impl_.optional_values_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000003u) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_internal_set_name(from._internal_name());
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.elem_type_ = from._impl_.elem_type_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void SequenceProto::CopyFrom(const SequenceProto& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:onnx.SequenceProto)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool SequenceProto::IsInitialized() const {
+  return true;
+}
+
+void SequenceProto::InternalSwap(SequenceProto* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.tensor_values_.InternalSwap(&other->_impl_.tensor_values_);
+  _impl_.sparse_tensor_values_.InternalSwap(&other->_impl_.sparse_tensor_values_);
+  _impl_.sequence_values_.InternalSwap(&other->_impl_.sequence_values_);
+  _impl_.map_values_.InternalSwap(&other->_impl_.map_values_);
+  _impl_.optional_values_.InternalSwap(&other->_impl_.optional_values_);
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr::InternalSwap(
+      &_impl_.name_, lhs_arena,
+      &other->_impl_.name_, rhs_arena
+  );
+  swap(_impl_.elem_type_, other->_impl_.elem_type_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata SequenceProto::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_onnx_2fonnx_2ddata_2eproto_getter, &descriptor_table_onnx_2fonnx_2ddata_2eproto_once,
+      file_level_metadata_onnx_2fonnx_2ddata_2eproto[0]);
+}
+
+// ===================================================================
+
+class MapProto::_Internal {
+ public:
+  using HasBits = decltype(std::declval<MapProto>()._impl_._has_bits_);
+  static void set_has_name(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_key_type(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static const ::onnx::SequenceProto& values(const MapProto* msg);
+  static void set_has_values(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+};
+
+const ::onnx::SequenceProto&
+MapProto::_Internal::values(const MapProto* msg) {
+  return *msg->_impl_.values_;
+}
+MapProto::MapProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:onnx.MapProto)
+}
+MapProto::MapProto(const MapProto& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  MapProto* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.keys_){from._impl_.keys_}
+    , decltype(_impl_.string_keys_){from._impl_.string_keys_}
+    , decltype(_impl_.name_){}
+    , decltype(_impl_.values_){nullptr}
+    , decltype(_impl_.key_type_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  _impl_.name_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.name_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (from._internal_has_name()) {
+    _this->_impl_.name_.Set(from._internal_name(), 
+      _this->GetArenaForAllocation());
+  }
+  if (from._internal_has_values()) {
+    _this->_impl_.values_ = new ::onnx::SequenceProto(*from._impl_.values_);
+  }
+  _this->_impl_.key_type_ = from._impl_.key_type_;
+  // @@protoc_insertion_point(copy_constructor:onnx.MapProto)
+}
+
+inline void MapProto::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.keys_){arena}
+    , decltype(_impl_.string_keys_){arena}
+    , decltype(_impl_.name_){}
+    , decltype(_impl_.values_){nullptr}
+    , decltype(_impl_.key_type_){0}
+  };
+  _impl_.name_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.name_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+
+MapProto::~MapProto() {
+  // @@protoc_insertion_point(destructor:onnx.MapProto)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void MapProto::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.keys_.~RepeatedField();
+  _impl_.string_keys_.~RepeatedPtrField();
+  _impl_.name_.Destroy();
+  if (this != internal_default_instance()) delete _impl_.values_;
+}
+
+void MapProto::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void MapProto::Clear() {
+// @@protoc_insertion_point(message_clear_start:onnx.MapProto)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.keys_.Clear();
+  _impl_.string_keys_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000003u) {
+    if (cached_has_bits & 0x00000001u) {
+      _impl_.name_.ClearNonDefaultToEmpty();
+    }
+    if (cached_has_bits & 0x00000002u) {
+      GOOGLE_DCHECK(_impl_.values_ != nullptr);
+      _impl_.values_->Clear();
+    }
+  }
+  _impl_.key_type_ = 0;
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* MapProto::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // optional string name = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 10)) {
+          auto str = _internal_mutable_name();
+          ptr = ::_pbi::InlineGreedyStringParser(str, ptr, ctx);
+          CHK_(ptr);
+          #ifndef NDEBUG
+          ::_pbi::VerifyUTF8(str, "onnx.MapProto.name");
+          #endif  // !NDEBUG
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 key_type = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_key_type(&has_bits);
+          _impl_.key_type_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated int64 keys = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 24)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            _internal_add_keys(::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr));
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<24>(ptr));
+        } else if (static_cast<uint8_t>(tag) == 26) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::PackedInt64Parser(_internal_mutable_keys(), ptr, ctx);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated bytes string_keys = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 34)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            auto str = _internal_add_string_keys();
+            ptr = ::_pbi::InlineGreedyStringParser(str, ptr, ctx);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<34>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional .onnx.SequenceProto values = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 42)) {
+          ptr = ctx->ParseMessage(_internal_mutable_values(), ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* MapProto::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:onnx.MapProto)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // optional string name = 1;
+  if (cached_has_bits & 0x00000001u) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::VerifyUTF8StringNamedField(
+      this->_internal_name().data(), static_cast<int>(this->_internal_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SERIALIZE,
+      "onnx.MapProto.name");
+    target = stream->WriteStringMaybeAliased(
+        1, this->_internal_name(), target);
+  }
+
+  // optional int32 key_type = 2;
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(2, this->_internal_key_type(), target);
+  }
+
+  // repeated int64 keys = 3;
+  for (int i = 0, n = this->_internal_keys_size(); i < n; i++) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt64ToArray(3, this->_internal_keys(i), target);
+  }
+
+  // repeated bytes string_keys = 4;
+  for (int i = 0, n = this->_internal_string_keys_size(); i < n; i++) {
+    const auto& s = this->_internal_string_keys(i);
+    target = stream->WriteBytes(4, s, target);
+  }
+
+  // optional .onnx.SequenceProto values = 5;
+  if (cached_has_bits & 0x00000002u) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessage(5, _Internal::values(this),
+        _Internal::values(this).GetCachedSize(), target, stream);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:onnx.MapProto)
+  return target;
+}
+
+size_t MapProto::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:onnx.MapProto)
+  size_t total_size = 0;
+
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated int64 keys = 3;
+  {
+    size_t data_size = ::_pbi::WireFormatLite::
+      Int64Size(this->_impl_.keys_);
+    total_size += 1 *
+                  ::_pbi::FromIntSize(this->_internal_keys_size());
+    total_size += data_size;
+  }
+
+  // repeated bytes string_keys = 4;
+  total_size += 1 *
+      ::PROTOBUF_NAMESPACE_ID::internal::FromIntSize(_impl_.string_keys_.size());
+  for (int i = 0, n = _impl_.string_keys_.size(); i < n; i++) {
+    total_size += ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::BytesSize(
+      _impl_.string_keys_.Get(i));
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000007u) {
+    // optional string name = 1;
+    if (cached_has_bits & 0x00000001u) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+          this->_internal_name());
+    }
+
+    // optional .onnx.SequenceProto values = 5;
+    if (cached_has_bits & 0x00000002u) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+          *_impl_.values_);
+    }
+
+    // optional int32 key_type = 2;
+    if (cached_has_bits & 0x00000004u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_key_type());
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData MapProto::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    MapProto::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*MapProto::GetClassData() const { return &_class_data_; }
+
+
+void MapProto::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<MapProto*>(&to_msg);
+  auto& from = static_cast<const MapProto&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:onnx.MapProto)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.keys_.MergeFrom(from._impl_.keys_);
+  _this->_impl_.string_keys_.MergeFrom(from._impl_.string_keys_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000007u) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_internal_set_name(from._internal_name());
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_internal_mutable_values()->::onnx::SequenceProto::MergeFrom(
+          from._internal_values());
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.key_type_ = from._impl_.key_type_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void MapProto::CopyFrom(const MapProto& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:onnx.MapProto)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool MapProto::IsInitialized() const {
+  return true;
+}
+
+void MapProto::InternalSwap(MapProto* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.keys_.InternalSwap(&other->_impl_.keys_);
+  _impl_.string_keys_.InternalSwap(&other->_impl_.string_keys_);
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr::InternalSwap(
+      &_impl_.name_, lhs_arena,
+      &other->_impl_.name_, rhs_arena
+  );
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(MapProto, _impl_.key_type_)
+      + sizeof(MapProto::_impl_.key_type_)
+      - PROTOBUF_FIELD_OFFSET(MapProto, _impl_.values_)>(
+          reinterpret_cast<char*>(&_impl_.values_),
+          reinterpret_cast<char*>(&other->_impl_.values_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata MapProto::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_onnx_2fonnx_2ddata_2eproto_getter, &descriptor_table_onnx_2fonnx_2ddata_2eproto_once,
+      file_level_metadata_onnx_2fonnx_2ddata_2eproto[1]);
+}
+
+// ===================================================================
+
+class OptionalProto::_Internal {
+ public:
+  using HasBits = decltype(std::declval<OptionalProto>()._impl_._has_bits_);
+  static void set_has_name(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_elem_type(HasBits* has_bits) {
+    (*has_bits)[0] |= 64u;
+  }
+  static const ::onnx::TensorProto& tensor_value(const OptionalProto* msg);
+  static void set_has_tensor_value(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static const ::onnx::SparseTensorProto& sparse_tensor_value(const OptionalProto* msg);
+  static void set_has_sparse_tensor_value(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static const ::onnx::SequenceProto& sequence_value(const OptionalProto* msg);
+  static void set_has_sequence_value(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static const ::onnx::MapProto& map_value(const OptionalProto* msg);
+  static void set_has_map_value(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static const ::onnx::OptionalProto& optional_value(const OptionalProto* msg);
+  static void set_has_optional_value(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+};
+
+const ::onnx::TensorProto&
+OptionalProto::_Internal::tensor_value(const OptionalProto* msg) {
+  return *msg->_impl_.tensor_value_;
+}
+const ::onnx::SparseTensorProto&
+OptionalProto::_Internal::sparse_tensor_value(const OptionalProto* msg) {
+  return *msg->_impl_.sparse_tensor_value_;
+}
+const ::onnx::SequenceProto&
+OptionalProto::_Internal::sequence_value(const OptionalProto* msg) {
+  return *msg->_impl_.sequence_value_;
+}
+const ::onnx::MapProto&
+OptionalProto::_Internal::map_value(const OptionalProto* msg) {
+  return *msg->_impl_.map_value_;
+}
+const ::onnx::OptionalProto&
+OptionalProto::_Internal::optional_value(const OptionalProto* msg) {
+  return *msg->_impl_.optional_value_;
+}
+void OptionalProto::clear_tensor_value() {
+  if (_impl_.tensor_value_ != nullptr) _impl_.tensor_value_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+void OptionalProto::clear_sparse_tensor_value() {
+  if (_impl_.sparse_tensor_value_ != nullptr) _impl_.sparse_tensor_value_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000004u;
+}
+OptionalProto::OptionalProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:onnx.OptionalProto)
+}
+OptionalProto::OptionalProto(const OptionalProto& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  OptionalProto* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.name_){}
+    , decltype(_impl_.tensor_value_){nullptr}
+    , decltype(_impl_.sparse_tensor_value_){nullptr}
+    , decltype(_impl_.sequence_value_){nullptr}
+    , decltype(_impl_.map_value_){nullptr}
+    , decltype(_impl_.optional_value_){nullptr}
+    , decltype(_impl_.elem_type_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  _impl_.name_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.name_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (from._internal_has_name()) {
+    _this->_impl_.name_.Set(from._internal_name(), 
+      _this->GetArenaForAllocation());
+  }
+  if (from._internal_has_tensor_value()) {
+    _this->_impl_.tensor_value_ = new ::onnx::TensorProto(*from._impl_.tensor_value_);
+  }
+  if (from._internal_has_sparse_tensor_value()) {
+    _this->_impl_.sparse_tensor_value_ = new ::onnx::SparseTensorProto(*from._impl_.sparse_tensor_value_);
+  }
+  if (from._internal_has_sequence_value()) {
+    _this->_impl_.sequence_value_ = new ::onnx::SequenceProto(*from._impl_.sequence_value_);
+  }
+  if (from._internal_has_map_value()) {
+    _this->_impl_.map_value_ = new ::onnx::MapProto(*from._impl_.map_value_);
+  }
+  if (from._internal_has_optional_value()) {
+    _this->_impl_.optional_value_ = new ::onnx::OptionalProto(*from._impl_.optional_value_);
+  }
+  _this->_impl_.elem_type_ = from._impl_.elem_type_;
+  // @@protoc_insertion_point(copy_constructor:onnx.OptionalProto)
+}
+
+inline void OptionalProto::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.name_){}
+    , decltype(_impl_.tensor_value_){nullptr}
+    , decltype(_impl_.sparse_tensor_value_){nullptr}
+    , decltype(_impl_.sequence_value_){nullptr}
+    , decltype(_impl_.map_value_){nullptr}
+    , decltype(_impl_.optional_value_){nullptr}
+    , decltype(_impl_.elem_type_){0}
+  };
+  _impl_.name_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.name_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+
+OptionalProto::~OptionalProto() {
+  // @@protoc_insertion_point(destructor:onnx.OptionalProto)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void OptionalProto::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.name_.Destroy();
+  if (this != internal_default_instance()) delete _impl_.tensor_value_;
+  if (this != internal_default_instance()) delete _impl_.sparse_tensor_value_;
+  if (this != internal_default_instance()) delete _impl_.sequence_value_;
+  if (this != internal_default_instance()) delete _impl_.map_value_;
+  if (this != internal_default_instance()) delete _impl_.optional_value_;
+}
+
+void OptionalProto::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void OptionalProto::Clear() {
+// @@protoc_insertion_point(message_clear_start:onnx.OptionalProto)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _impl_.name_.ClearNonDefaultToEmpty();
+    }
+    if (cached_has_bits & 0x00000002u) {
+      GOOGLE_DCHECK(_impl_.tensor_value_ != nullptr);
+      _impl_.tensor_value_->Clear();
+    }
+    if (cached_has_bits & 0x00000004u) {
+      GOOGLE_DCHECK(_impl_.sparse_tensor_value_ != nullptr);
+      _impl_.sparse_tensor_value_->Clear();
+    }
+    if (cached_has_bits & 0x00000008u) {
+      GOOGLE_DCHECK(_impl_.sequence_value_ != nullptr);
+      _impl_.sequence_value_->Clear();
+    }
+    if (cached_has_bits & 0x00000010u) {
+      GOOGLE_DCHECK(_impl_.map_value_ != nullptr);
+      _impl_.map_value_->Clear();
+    }
+    if (cached_has_bits & 0x00000020u) {
+      GOOGLE_DCHECK(_impl_.optional_value_ != nullptr);
+      _impl_.optional_value_->Clear();
+    }
+  }
+  _impl_.elem_type_ = 0;
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* OptionalProto::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // optional string name = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 10)) {
+          auto str = _internal_mutable_name();
+          ptr = ::_pbi::InlineGreedyStringParser(str, ptr, ctx);
+          CHK_(ptr);
+          #ifndef NDEBUG
+          ::_pbi::VerifyUTF8(str, "onnx.OptionalProto.name");
+          #endif  // !NDEBUG
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 elem_type = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_elem_type(&has_bits);
+          _impl_.elem_type_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional .onnx.TensorProto tensor_value = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 26)) {
+          ptr = ctx->ParseMessage(_internal_mutable_tensor_value(), ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional .onnx.SparseTensorProto sparse_tensor_value = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 34)) {
+          ptr = ctx->ParseMessage(_internal_mutable_sparse_tensor_value(), ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional .onnx.SequenceProto sequence_value = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 42)) {
+          ptr = ctx->ParseMessage(_internal_mutable_sequence_value(), ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional .onnx.MapProto map_value = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 50)) {
+          ptr = ctx->ParseMessage(_internal_mutable_map_value(), ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional .onnx.OptionalProto optional_value = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr = ctx->ParseMessage(_internal_mutable_optional_value(), ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* OptionalProto::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:onnx.OptionalProto)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // optional string name = 1;
+  if (cached_has_bits & 0x00000001u) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::VerifyUTF8StringNamedField(
+      this->_internal_name().data(), static_cast<int>(this->_internal_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SERIALIZE,
+      "onnx.OptionalProto.name");
+    target = stream->WriteStringMaybeAliased(
+        1, this->_internal_name(), target);
+  }
+
+  // optional int32 elem_type = 2;
+  if (cached_has_bits & 0x00000040u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(2, this->_internal_elem_type(), target);
+  }
+
+  // optional .onnx.TensorProto tensor_value = 3;
+  if (cached_has_bits & 0x00000002u) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessage(3, _Internal::tensor_value(this),
+        _Internal::tensor_value(this).GetCachedSize(), target, stream);
+  }
+
+  // optional .onnx.SparseTensorProto sparse_tensor_value = 4;
+  if (cached_has_bits & 0x00000004u) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessage(4, _Internal::sparse_tensor_value(this),
+        _Internal::sparse_tensor_value(this).GetCachedSize(), target, stream);
+  }
+
+  // optional .onnx.SequenceProto sequence_value = 5;
+  if (cached_has_bits & 0x00000008u) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessage(5, _Internal::sequence_value(this),
+        _Internal::sequence_value(this).GetCachedSize(), target, stream);
+  }
+
+  // optional .onnx.MapProto map_value = 6;
+  if (cached_has_bits & 0x00000010u) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessage(6, _Internal::map_value(this),
+        _Internal::map_value(this).GetCachedSize(), target, stream);
+  }
+
+  // optional .onnx.OptionalProto optional_value = 7;
+  if (cached_has_bits & 0x00000020u) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessage(7, _Internal::optional_value(this),
+        _Internal::optional_value(this).GetCachedSize(), target, stream);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:onnx.OptionalProto)
+  return target;
+}
+
+size_t OptionalProto::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:onnx.OptionalProto)
+  size_t total_size = 0;
+
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    // optional string name = 1;
+    if (cached_has_bits & 0x00000001u) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+          this->_internal_name());
+    }
+
+    // optional .onnx.TensorProto tensor_value = 3;
+    if (cached_has_bits & 0x00000002u) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+          *_impl_.tensor_value_);
+    }
+
+    // optional .onnx.SparseTensorProto sparse_tensor_value = 4;
+    if (cached_has_bits & 0x00000004u) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+          *_impl_.sparse_tensor_value_);
+    }
+
+    // optional .onnx.SequenceProto sequence_value = 5;
+    if (cached_has_bits & 0x00000008u) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+          *_impl_.sequence_value_);
+    }
+
+    // optional .onnx.MapProto map_value = 6;
+    if (cached_has_bits & 0x00000010u) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+          *_impl_.map_value_);
+    }
+
+    // optional .onnx.OptionalProto optional_value = 7;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+          *_impl_.optional_value_);
+    }
+
+    // optional int32 elem_type = 2;
+    if (cached_has_bits & 0x00000040u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_elem_type());
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData OptionalProto::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    OptionalProto::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*OptionalProto::GetClassData() const { return &_class_data_; }
+
+
+void OptionalProto::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<OptionalProto*>(&to_msg);
+  auto& from = static_cast<const OptionalProto&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:onnx.OptionalProto)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_internal_set_name(from._internal_name());
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_internal_mutable_tensor_value()->::onnx::TensorProto::MergeFrom(
+          from._internal_tensor_value());
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_internal_mutable_sparse_tensor_value()->::onnx::SparseTensorProto::MergeFrom(
+          from._internal_sparse_tensor_value());
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_internal_mutable_sequence_value()->::onnx::SequenceProto::MergeFrom(
+          from._internal_sequence_value());
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_internal_mutable_map_value()->::onnx::MapProto::MergeFrom(
+          from._internal_map_value());
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_internal_mutable_optional_value()->::onnx::OptionalProto::MergeFrom(
+          from._internal_optional_value());
+    }
+    if (cached_has_bits & 0x00000040u) {
+      _this->_impl_.elem_type_ = from._impl_.elem_type_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void OptionalProto::CopyFrom(const OptionalProto& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:onnx.OptionalProto)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool OptionalProto::IsInitialized() const {
+  return true;
+}
+
+void OptionalProto::InternalSwap(OptionalProto* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr::InternalSwap(
+      &_impl_.name_, lhs_arena,
+      &other->_impl_.name_, rhs_arena
+  );
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(OptionalProto, _impl_.elem_type_)
+      + sizeof(OptionalProto::_impl_.elem_type_)
+      - PROTOBUF_FIELD_OFFSET(OptionalProto, _impl_.tensor_value_)>(
+          reinterpret_cast<char*>(&_impl_.tensor_value_),
+          reinterpret_cast<char*>(&other->_impl_.tensor_value_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata OptionalProto::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_onnx_2fonnx_2ddata_2eproto_getter, &descriptor_table_onnx_2fonnx_2ddata_2eproto_once,
+      file_level_metadata_onnx_2fonnx_2ddata_2eproto[2]);
+}
+
+// @@protoc_insertion_point(namespace_scope)
+}  // namespace onnx
+PROTOBUF_NAMESPACE_OPEN
+template<> PROTOBUF_NOINLINE ::onnx::SequenceProto*
+Arena::CreateMaybeMessage< ::onnx::SequenceProto >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::onnx::SequenceProto >(arena);
+}
+template<> PROTOBUF_NOINLINE ::onnx::MapProto*
+Arena::CreateMaybeMessage< ::onnx::MapProto >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::onnx::MapProto >(arena);
+}
+template<> PROTOBUF_NOINLINE ::onnx::OptionalProto*
+Arena::CreateMaybeMessage< ::onnx::OptionalProto >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::onnx::OptionalProto >(arena);
+}
+PROTOBUF_NAMESPACE_CLOSE
+
+// @@protoc_insertion_point(global_scope)
+#include <google/protobuf/port_undef.inc>
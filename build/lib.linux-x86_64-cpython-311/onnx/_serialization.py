@@ -0,0 +1,295 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""onnx serialization
+
+Parsing of serialized protos, and serialization of models one field at a time,
+with their tensors optionally replaced by stubs that hold no data.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import functools
+import io
+
+import google.protobuf.message
+
+from onnx import mapping
+from .onnx_pb import AttributeProto, FunctionProto, GraphProto, ModelProto, NodeProto, SparseTensorProto, TensorProto
+
+from typing import Any, Callable, IO, List, Optional, Set, Text, Tuple, TypeVar, cast
+
+
+# Models whose initializers hold less data than this are serialized in one call. Streaming
+# them field by field would save little memory and cost a Python call per node.
+_STREAM_SIZE_THRESHOLD = 64 * 1024 * 1024
+
+
+def _serialize_to_stream(proto, stream):  # type: (ModelProto, IO[bytes]) -> None
+    '''
+    Write a serialized ModelProto to a stream
+
+    Models with large initializers are written one node, initializer, etc. at a time, so the
+    serialized model is never held in memory as a whole. The bytes written are the same as
+    proto.SerializeToString().
+
+    @params
+    proto is a in-memory ModelProto
+    stream is a writable binary stream
+    '''
+    pieces = None
+    if _initializer_data_size(proto) >= _STREAM_SIZE_THRESHOLD:
+        pieces = _serialized_pieces(proto)
+    if pieces is None:
+        stream.write(proto.SerializeToString())
+    else:
+        _write_pieces(pieces, stream)
+
+
+def _initializer_data_size(proto):  # type: (ModelProto) -> int
+    '''
+    Estimate the size of the data of the initializers of the main graph from their shapes,
+    without serializing them. Tensors stored externally are not counted.
+    '''
+    graph = proto.graph
+    tensors = list(graph.initializer) + [sparse.values for sparse in graph.sparse_initializer]
+    size = 0
+    for tensor in tensors:
+        if tensor.data_location != TensorProto.EXTERNAL and tensor.data_type in mapping.TENSOR_TYPE_TO_NP_TYPE:
+            size += _num_elements(tensor) * mapping.TENSOR_TYPE_TO_NP_TYPE[tensor.data_type].itemsize
+    return size
+
+
+def _encode_varint(value):  # type: (int) -> bytes
+    result = bytearray()
+    while value > 0x7f:
+        result.append((value & 0x7f) | 0x80)
+        value >>= 7
+    result.append(value)
+    return bytes(result)
+
+
+def _has_unknown_fields(proto):  # type: (google.protobuf.message.Message) -> bool
+    try:
+        from google.protobuf.unknown_fields import UnknownFieldSet
+        return len(UnknownFieldSet(proto)) > 0
+    except ImportError:
+        return len(proto.UnknownFields()) > 0  # type: ignore
+
+
+def _serialized_pieces(proto, tensor_stub=None):  # type: (google.protobuf.message.Message, Optional[Callable[[TensorProto], TensorProto]]) -> Optional[List[Tuple[int, Any]]]
+    '''
+    Split proto into the pieces of its serialized form, in field order. Each piece is a
+    (size, value) pair, where value is bytes, a message to serialize, or the pieces of a GraphProto.
+    If tensor_stub is given, every tensor in proto but the indices of sparse tensors is written
+    as the tensor tensor_stub returns for it. Returns None if proto has unknown fields, which
+    cannot be written field by field.
+    '''
+    if _has_unknown_fields(proto):
+        return None
+    pieces = []  # type: List[Tuple[int, Any]]
+    for field, value in proto.ListFields():
+        if field.type != field.TYPE_MESSAGE:
+            partial = type(proto)()
+            if field.label == field.LABEL_REPEATED:
+                getattr(partial, field.name).extend(value)
+            else:
+                setattr(partial, field.name, value)
+            data = partial.SerializeToString()
+            pieces.append((len(data), data))
+            continue
+        for element in (value if field.label == field.LABEL_REPEATED else [value]):
+            element_pieces = None
+            if tensor_stub is not None and isinstance(element, TensorProto):
+                # The checker reads the values of sparse tensor indices
+                if not (isinstance(proto, SparseTensorProto) and field.name == 'indices'):
+                    element = tensor_stub(element)
+            elif isinstance(element, GraphProto) or (tensor_stub is not None and _may_hold_tensors(element)):
+                element_pieces = _serialized_pieces(element, tensor_stub)
+            if element_pieces is None:
+                size = element.ByteSize()
+                piece = element  # type: Any
+            else:
+                size = sum(piece_size for (piece_size, _) in element_pieces)
+                piece = element_pieces
+            # Length-delimited field: tag with wire type 2, then the length
+            header = _encode_varint(field.number << 3 | 2) + _encode_varint(size)
+            pieces.append((len(header), header))
+            pieces.append((size, piece))
+    return pieces
+
+
+# Fields of TensorProto holding its data
+_TENSOR_DATA_FIELDS = frozenset(['float_data', 'int32_data', 'string_data', 'int64_data',
+                                 'raw_data', 'double_data', 'uint64_data'])
+
+# Attribute types whose values may contain tensors
+_TENSOR_ATTRIBUTE_TYPES = frozenset([AttributeProto.TENSOR, AttributeProto.TENSORS,
+                                     AttributeProto.SPARSE_TENSOR, AttributeProto.SPARSE_TENSORS,
+                                     AttributeProto.GRAPH, AttributeProto.GRAPHS])
+
+
+def _num_elements(tensor):  # type: (TensorProto) -> int
+    return functools.reduce(lambda x, y: x * y, tensor.dims, 1)
+
+
+def _may_hold_tensors(proto):  # type: (google.protobuf.message.Message) -> bool
+    if isinstance(proto, NodeProto):
+        return any(attr.type in _TENSOR_ATTRIBUTE_TYPES for attr in proto.attribute)
+    return isinstance(proto, (AttributeProto, FunctionProto, SparseTensorProto))
+
+
+def _tensor_header(tensor):  # type: (TensorProto) -> TensorProto
+    '''
+    Copy every field of tensor but its data, without reading the data
+    '''
+    header = TensorProto()
+    for field in TensorProto.DESCRIPTOR.fields:
+        if field.name in _TENSOR_DATA_FIELDS:
+            continue
+        if field.label == field.LABEL_REPEATED:
+            getattr(header, field.name).extend(getattr(tensor, field.name))
+        elif tensor.HasField(field.name):
+            if field.type == field.TYPE_MESSAGE:
+                getattr(header, field.name).CopyFrom(getattr(tensor, field.name))
+            else:
+                setattr(header, field.name, getattr(tensor, field.name))
+    return header
+
+
+def _tensor_placeholder(tensor):  # type: (TensorProto) -> TensorProto
+    '''
+    Copy the header of tensor, with a single value in each data field tensor uses. The checker
+    only looks at which data fields a tensor uses, so it gives the same result for both.
+    '''
+    typed_fields = [name for name in _TENSOR_DATA_FIELDS if name != 'raw_data' and len(getattr(tensor, name))]
+    if _num_elements(tensor) == 0 or (typed_fields and tensor.HasField('raw_data')):
+        return tensor
+    placeholder = _tensor_header(tensor)
+    for name in typed_fields:
+        getattr(placeholder, name).append(b'' if name == 'string_data' else 0)
+    # Reading raw_data would copy it: an empty raw_data takes 2 bytes (its tag and length)
+    if tensor.HasField('raw_data') and tensor.ByteSize() > placeholder.ByteSize() + 2:
+        placeholder.raw_data = b'\0'
+    return placeholder
+
+
+# Initializers with fewer elements than this are passed to shape inference whole: stubbing
+# them would save little, and shape inference may read small tensors of any type, such as
+# the scales of a Resize
+_SHAPE_DATA_SIZE_LIMIT = 1024
+
+# Types of the large tensors whose data shape inference may read, such as the shape input of a Reshape
+_SHAPE_DATA_TYPES = frozenset([TensorProto.INT32, TensorProto.INT64])
+
+
+def _unread_initializers(proto):  # type: (ModelProto) -> List[TensorProto]
+    '''
+    Return the large initializers of the main graph whose data shape inference never reads:
+    those that no node of the graph or of its subgraphs consumes, and the consumed ones of types
+    other than INT32 and INT64, such as float weights. Shape inference only reads the data of
+    small tensors and of the integer tensors a node consumes.
+    '''
+    graph = proto.graph
+    consumed = _consumed_names(graph)
+    tensors = list(graph.initializer) + [sparse.values for sparse in graph.sparse_initializer]
+    return [tensor for tensor in tensors
+            if _num_elements(tensor) >= _SHAPE_DATA_SIZE_LIMIT
+            and (tensor.name not in consumed or tensor.data_type not in _SHAPE_DATA_TYPES)]
+
+
+def _consumed_names(graph):  # type: (GraphProto) -> Set[Text]
+    names = set()  # type: Set[Text]
+    for node in graph.node:
+        names.update(node.input)
+        for attr in node.attribute:
+            if attr.type == AttributeProto.GRAPH:
+                names.update(_consumed_names(attr.g))
+            elif attr.type == AttributeProto.GRAPHS:
+                for subgraph in attr.graphs:
+                    names.update(_consumed_names(subgraph))
+    return names
+
+
+def _stub_only(tensors, tensor_stub):  # type: (List[TensorProto], Callable[[TensorProto], TensorProto]) -> Callable[[TensorProto], TensorProto]
+    '''
+    Return a tensor_stub that replaces the given tensors by the stubs tensor_stub returns,
+    and writes every other tensor whole
+    '''
+    # The tensors are held, so their ids are not reused while the stub is alive
+    stubbed = {id(tensor): tensor for tensor in tensors}
+
+    def stub(tensor):  # type: (TensorProto) -> TensorProto
+        if stubbed.get(id(tensor)) is tensor:
+            return tensor_stub(tensor)
+        return tensor
+    return stub
+
+
+def _serialize_with_tensor_stubs(proto, tensor_stub):  # type: (ModelProto, Callable[[TensorProto], TensorProto]) -> bytes
+    '''
+    Serialize a ModelProto with its tensors replaced by stubs, in initializers, attributes,
+    subgraphs and functions alike. The model itself is not copied or modified.
+
+    @params
+    proto is a in-memory ModelProto
+    tensor_stub returns the tensor to write in place of a tensor, such as _tensor_header
+
+    @return
+    Serialized proto in bytes. If proto has unknown fields, it is serialized whole.
+    '''
+    pieces = _serialized_pieces(proto, tensor_stub)
+    if pieces is None:
+        return cast(bytes, proto.SerializeToString())
+    stream = io.BytesIO()
+    _write_pieces(pieces, stream)
+    return stream.getvalue()
+
+
+def _write_pieces(pieces, stream):  # type: (List[Tuple[int, Any]], IO[bytes]) -> None
+    for (_, piece) in pieces:
+        if isinstance(piece, bytes):
+            stream.write(piece)
+        elif isinstance(piece, list):
+            _write_pieces(piece, stream)
+        else:
+            stream.write(piece.SerializeToString())
+
+
+_Proto = TypeVar('_Proto', bound=google.protobuf.message.Message)
+
+
+def _deserialize(s, proto):  # type: (Any, _Proto) -> _Proto
+    '''
+    Parse bytes into a in-memory proto
+
+    @params
+    s is bytes, or any object supporting the buffer protocol (bytearray, memoryview, mmap, ...),
+    containing serialized proto. Buffers are parsed in place without being copied to bytes first.
+    proto is a in-memory proto object
+
+    @return
+    The proto instance filled in by s
+    '''
+    if not (hasattr(proto, 'ParseFromString') and callable(proto.ParseFromString)):
+        raise ValueError('No ParseFromString method is detected. '
+                         '\ntype is {}'.format(type(proto)))
+
+    if isinstance(s, bytes):
+        return _parse(s, len(s), proto)
+    try:
+        view = memoryview(s)
+    except TypeError:
+        raise ValueError('Parameter s must be bytes or support the buffer protocol, but got type: {}'.format(type(s)))
+    with view, view.cast('B') as flat:
+        return _parse(flat, flat.nbytes, proto)
+
+
+def _parse(s, size, proto):  # type: (Any, int, _Proto) -> _Proto
+    decoded = cast(Optional[int], proto.ParseFromString(s))
+    if decoded is not None and decoded != size:
+        raise google.protobuf.message.DecodeError(
+            "Protobuf decoding consumed too few bytes: {} out of {}".format(
+                decoded, size))
+    return proto
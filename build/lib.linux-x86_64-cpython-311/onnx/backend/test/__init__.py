@@ -0,0 +1,9 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+# for backward compatibility
+from .runner import Runner as BackendTest # noqa
@@ -0,0 +1 @@
+BxJ?7?N?w}?H>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=p=<&U?H5G?^?z?L?G>G?9=#?4>q?ڗ?N>s>.4F?>?<\?N?c?yq?Ƌ.?k>>2?v=9*?+?nW>A>>L8>j?a>}?=U>R.%>2'?p>I>Jz>
\ No newline at end of file
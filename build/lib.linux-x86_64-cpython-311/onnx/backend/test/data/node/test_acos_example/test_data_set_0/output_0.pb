@@ -0,0 +1,3 @@
+ByJ
+@?
+?
\ No newline at end of file
@@ -0,0 +1 @@
+ByJ@D{,@#@@8@&@v@8@[m=@@22@*@@>;@?ZT?/?5@81@Վ7@P>@&2@@d1@\<?N&@}2?G<@6@@?0@@@?j[$@#@sK$@=9<@o)@@@+@V?5(@a(@յ?(ճ?V@k@@\@>@^??O?n'@?<<@YZ?
\ No newline at end of file
@@ -0,0 +1 @@
+BX_newJb?
\ No newline at end of file
@@ -0,0 +1 @@
+BH_newJ@?@
\ No newline at end of file
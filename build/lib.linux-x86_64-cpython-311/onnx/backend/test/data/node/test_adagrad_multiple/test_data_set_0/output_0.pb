@@ -0,0 +1 @@
+BX1_newJb?
\ No newline at end of file
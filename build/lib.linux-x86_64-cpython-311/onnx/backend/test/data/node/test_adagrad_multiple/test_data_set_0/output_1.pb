@@ -0,0 +1 @@
+BX2_newJ@?7@
\ No newline at end of file
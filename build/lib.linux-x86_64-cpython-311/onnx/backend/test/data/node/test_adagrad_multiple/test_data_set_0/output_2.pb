@@ -0,0 +1 @@
+BH1_newJ@?@
\ No newline at end of file
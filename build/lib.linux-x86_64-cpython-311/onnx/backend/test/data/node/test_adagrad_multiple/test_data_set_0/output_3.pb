@@ -0,0 +1 @@
+BH2_newJ@A
\ No newline at end of file
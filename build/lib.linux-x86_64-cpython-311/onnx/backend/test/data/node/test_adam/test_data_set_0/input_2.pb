@@ -0,0 +1 @@
+BXJ?333@
\ No newline at end of file
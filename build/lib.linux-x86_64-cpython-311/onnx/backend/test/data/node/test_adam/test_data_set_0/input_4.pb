@@ -0,0 +1 @@
+BVJ?fff@
\ No newline at end of file
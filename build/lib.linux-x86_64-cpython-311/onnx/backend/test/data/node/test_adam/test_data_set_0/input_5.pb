@@ -0,0 +1 @@
+BHJ==
\ No newline at end of file
@@ -0,0 +1 @@
+BX_newJd4?\N*@
\ No newline at end of file
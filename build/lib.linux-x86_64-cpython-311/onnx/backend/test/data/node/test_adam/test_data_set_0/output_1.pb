@@ -0,0 +1 @@
+BV_newJ1?R@
\ No newline at end of file
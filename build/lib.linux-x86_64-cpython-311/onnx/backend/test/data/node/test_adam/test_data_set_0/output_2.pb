@@ -0,0 +1 @@
+BH_newJ9M?@
\ No newline at end of file
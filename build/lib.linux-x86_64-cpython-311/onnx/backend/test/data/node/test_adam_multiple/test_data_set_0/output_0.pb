@@ -0,0 +1 @@
+BX1_newJVB?
\ No newline at end of file
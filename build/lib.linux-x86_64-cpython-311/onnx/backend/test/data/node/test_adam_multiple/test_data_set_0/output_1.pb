@@ -0,0 +1 @@
+BX2_newJd ?6?
\ No newline at end of file
@@ -0,0 +1 @@
+BV1_newJp?
\ No newline at end of file
@@ -0,0 +1 @@
+BH2_newJZ?;A
\ No newline at end of file
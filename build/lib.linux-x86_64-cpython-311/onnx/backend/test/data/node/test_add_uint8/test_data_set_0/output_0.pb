@@ -0,0 +1 @@
+BsumJ<&,$!"' ,$'"
\ No newline at end of file
@@ -0,0 +1 @@
+BdataJ`y?@@Ie?qÿ:@Ɵ@A_A1;@&?1?0AD	^o@4@@j(A$v@9E扳@
\ No newline at end of file
@@ -0,0 +1 @@
+ByJø?OL?(%??>3?J>?8s?l{>i?? ?_?=ت=<{?"Hd???fm?C>E@e?[=1?M>`H?T?>>Zb?%>$?c<tm*?(?3*??B@?{H>]>kE?9v=::?p-<?Y>c>N>X>S?/x>L?)Z=yW>%>06?>a>|>
\ No newline at end of file
@@ -0,0 +1 @@
+ByJɚ?>%]?,?(?~]{X?ngӽ'>>?A3?b=c>ѧ><?Pȝ>!<FWտ??>H?/q?\;=>V=??	>AG>L\t>!?M=?wPj$P馿?JپP	7?LϠD<X4N4u>cQ-s漎> =>ߵ
\ No newline at end of file
@@ -0,0 +1 @@
+ByJ#?>OF?V?"?F܂B?~pҽz>4~>|w?&?=>> {?4OW>=4F3?{6?r#z?mwK;={=}#~?%y?j>>998l>fc?0`?3N Ou4m?jSfӾHec.)?dVA:(>Q&8^s3>=b>ٵt*
\ No newline at end of file
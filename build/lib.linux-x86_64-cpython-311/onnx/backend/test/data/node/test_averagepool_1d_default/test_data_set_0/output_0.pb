@@ -0,0 +1 @@
+ByJi?0?p?nx@f>`^y>W`>>L?Ǎ?v>ǐ>>i?\$?\=ЀڿsOB?Piz=C?T>>M4ѐx<,?#?DO?y>ږ	$)Ľh}1?ఛ?P>,ȿ_=v8?4jnX,[s־GiA1}XojL>\}>$<>E)?|Cmcjھ>>eZ"?@nCվ$G9f4bU.?	ļƕ?`?>3 >>!7?C?*?h?
\ No newline at end of file
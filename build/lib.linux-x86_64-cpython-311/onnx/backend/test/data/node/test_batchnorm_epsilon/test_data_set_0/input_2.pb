@@ -0,0 +1 @@
+BbiasJ=?ttK
\ No newline at end of file
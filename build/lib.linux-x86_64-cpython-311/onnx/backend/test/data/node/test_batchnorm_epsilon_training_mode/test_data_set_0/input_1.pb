@@ -0,0 +1 @@
+BsJ6?a:V?
\ No newline at end of file
@@ -0,0 +1 @@
+BmeanJDf<
\ No newline at end of file
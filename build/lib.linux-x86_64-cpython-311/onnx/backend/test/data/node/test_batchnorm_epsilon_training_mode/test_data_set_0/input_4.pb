@@ -0,0 +1 @@
+BvarJc6=lL?W=
\ No newline at end of file
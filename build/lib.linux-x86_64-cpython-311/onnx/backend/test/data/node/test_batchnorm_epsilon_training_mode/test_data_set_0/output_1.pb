@@ -0,0 +1 @@
+Boutput_meanJX	2
\ No newline at end of file
@@ -0,0 +1,2 @@
+B
+output_varJ>X?!>
\ No newline at end of file
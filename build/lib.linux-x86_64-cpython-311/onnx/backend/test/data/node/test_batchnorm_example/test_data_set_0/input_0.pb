@@ -0,0 +1 @@
+BxJx?h>z?j@$?.z8s?bhdӽ9>(>%?^B?0=B>]ת>=?RiJ>Z/d#S'?K]?=C@(Hm;= ?2??>>Ec! >*z??Oƾmǚ6&õgڿ?xFKྙ[	G?4οYL=e> kQN>.:=ݚ>b"6^&,Z[*Pܿ35>;;Wп>DhT=:?>ב?>O/^~/Ѓf=#f?Ok>Ŀ??@?7>8lF?5mξy?	FU>z?u>4?G,<h?>>>?^Ab*x?(?Ӿ3Y?"??,?g?Iy\}?7mM?r?N4?l?
\ No newline at end of file
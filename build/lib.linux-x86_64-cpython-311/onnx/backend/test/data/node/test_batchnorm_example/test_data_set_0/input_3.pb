@@ -0,0 +1 @@
+BmeanJr޾?,?
\ No newline at end of file
@@ -0,0 +1 @@
+BbiasJǩ?319
\ No newline at end of file
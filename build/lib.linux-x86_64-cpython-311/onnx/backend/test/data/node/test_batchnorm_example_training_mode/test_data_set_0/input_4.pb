@@ -0,0 +1 @@
+BvarJǻy?[?n?<
\ No newline at end of file
@@ -0,0 +1 @@
+Boutput_meanJ¾u?N2?
\ No newline at end of file
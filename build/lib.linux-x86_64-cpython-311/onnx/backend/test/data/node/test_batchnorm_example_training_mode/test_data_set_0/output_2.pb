@@ -0,0 +1,2 @@
+B
+output_varJ`v?/c?P	>
\ No newline at end of file
@@ -0,0 +1,2 @@
+
+BxJP_V?3`?KnkI?cۮo?)?[!*?Yam?:g?63IS?BKN?
\ No newline at end of file
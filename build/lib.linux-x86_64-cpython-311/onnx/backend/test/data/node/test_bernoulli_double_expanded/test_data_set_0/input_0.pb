@@ -0,0 +1,2 @@
+
+BxJ(?7?N?w}?H>QY%?n><Kd?v?rR>
\ No newline at end of file
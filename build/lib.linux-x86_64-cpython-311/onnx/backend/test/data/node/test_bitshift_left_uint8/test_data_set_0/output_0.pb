@@ -0,0 +1 @@
+BzJ 
\ No newline at end of file
@@ -0,0 +1 @@
+BoutputJ0>L8>j?a>}?=U>R.%>2'?p>I>Jz>
\ No newline at end of file
@@ -0,0 +1,2 @@
+
+BinputJ/90;-86<42:L78$8
\ No newline at end of file
@@ -0,0 +1 @@
+BoutputJ>>>Q?>Q?W>9?
\ No newline at end of file
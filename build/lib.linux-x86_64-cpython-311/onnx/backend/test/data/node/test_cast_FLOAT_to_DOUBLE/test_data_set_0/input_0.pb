@@ -0,0 +1 @@
+BinputJ0^k?l?Z{=p=<&U?H5G?^?z?L?G>G?
\ No newline at end of file
@@ -0,0 +1,6 @@
+2	0.97676112	0.60484552	0.739263620.0391877932
+0.282806962
+0.120196562	0.29614022
+0.118727722
+0.317983182
+0.4142629820.0641474952	0.6924721Boutput
\ No newline at end of file
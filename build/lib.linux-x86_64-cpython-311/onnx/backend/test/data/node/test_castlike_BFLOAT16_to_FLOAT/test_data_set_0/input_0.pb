@@ -0,0 +1 @@
+BinputJ>>>Q?>Q?W>9?
\ No newline at end of file
@@ -0,0 +1,2 @@
+
+BlikeJ1
\ No newline at end of file
@@ -0,0 +1,2 @@
+
+BoutputJ1/@9l0J25:7.:&.;7
\ No newline at end of file
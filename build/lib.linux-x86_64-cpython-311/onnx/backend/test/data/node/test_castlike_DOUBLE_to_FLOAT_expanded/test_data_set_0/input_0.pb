@@ -0,0 +1 @@
+BinputJ`Rd/?\	G?X'L??F?+ ?ԛ?|3):y?<Oʥ?SnC?zP5?4.#	?yVI?
\ No newline at end of file
@@ -0,0 +1,2 @@
+
+BinputJ88;t9569+V9]92 0
\ No newline at end of file
@@ -0,0 +1 @@
+BlikeJ>
\ No newline at end of file
@@ -0,0 +1,2 @@
+
+BlikeJd8
\ No newline at end of file
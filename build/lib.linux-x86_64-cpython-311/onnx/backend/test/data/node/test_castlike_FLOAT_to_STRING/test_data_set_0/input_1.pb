@@ -0,0 +1 @@
+2	0.9767611Blike
\ No newline at end of file
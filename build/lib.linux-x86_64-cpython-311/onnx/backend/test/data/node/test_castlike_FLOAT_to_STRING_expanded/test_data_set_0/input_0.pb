@@ -0,0 +1 @@
+BinputJ0z?(?a@=?a =̐>)=>'=΢>G>_=E1?
\ No newline at end of file
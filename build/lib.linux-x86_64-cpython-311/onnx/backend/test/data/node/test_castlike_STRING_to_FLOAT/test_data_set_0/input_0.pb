@@ -0,0 +1,7 @@
+2
+0.478925472
+0.480336672
+0.499684872
+0.819105452
+0.4703124820.8164682
+0.210871952	0.72290382NaN2INF2+INF2-INFBinput
\ No newline at end of file
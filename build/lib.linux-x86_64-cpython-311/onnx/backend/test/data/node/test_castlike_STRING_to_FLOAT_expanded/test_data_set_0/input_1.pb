@@ -0,0 +1 @@
+BlikeJ5>
\ No newline at end of file
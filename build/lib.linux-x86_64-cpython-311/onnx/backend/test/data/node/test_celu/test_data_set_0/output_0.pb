@@ -0,0 +1,2 @@
+BYJlNX??o=<>?9K?2p?ldt?5>>t>,?j<[?̐l?Ux?=W>Bi??Q?]HI?=F1?
+?ޙ=
\ No newline at end of file
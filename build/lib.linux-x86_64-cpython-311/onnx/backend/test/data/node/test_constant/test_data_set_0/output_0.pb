@@ -0,0 +1 @@
+BvaluesJdx?h>z?j@$?.z8s?bhdӽ9>(>%?^B?0=B>]ת>=?RiJ>Z/d#S'?K]?=C@
\ No newline at end of file
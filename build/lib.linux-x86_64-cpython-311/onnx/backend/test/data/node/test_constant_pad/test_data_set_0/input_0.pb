@@ -0,0 +1 @@
+BxJx?h>z?j@$?.z8s?bhdӽ9>(>%?^B?0=B>]ת>=?RiJ>Z/d#S'?K]?=C@(Hm;= ?2??>>Ec! >*z??Oƾmǚ6&õgڿ?xFKྙ[	G?4οYL=e> kQN>.:=ݚ>b"6
\ No newline at end of file
@@ -0,0 +1 @@
+BvalueJ?
\ No newline at end of file
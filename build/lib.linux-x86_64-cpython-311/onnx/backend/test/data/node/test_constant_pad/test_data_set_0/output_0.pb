@@ -0,0 +1 @@
+ByJ???????????????x?h>z?j@$????????.z8s?bhdӽ9>???????(>%?^B?0=B>???????]ת>=?RiJ>Z???????????????????????????????????????????/d#S'?K]?=C@???????(Hm;= ?2?????????>>Ec!??????? >*z??Oƾmǚ???????????????????????????????????????????6&õgڿ?x???????FKྙ[	G?4οY???????L=e> k漚???????QN>.:=ݚ>b"6????????????????????????????
\ No newline at end of file
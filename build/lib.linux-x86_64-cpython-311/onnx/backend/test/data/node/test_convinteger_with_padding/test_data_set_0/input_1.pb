@@ -0,0 +1 @@
+BwJ
\ No newline at end of file
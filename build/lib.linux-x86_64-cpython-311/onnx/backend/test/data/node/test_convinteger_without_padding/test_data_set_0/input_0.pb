@@ -0,0 +1 @@
+BxJ		
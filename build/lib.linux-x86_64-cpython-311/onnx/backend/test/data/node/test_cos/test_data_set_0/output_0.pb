@@ -0,0 +1,3 @@
+ByJ)Dk??-?x?}?2~?ɸj?IY}?c=_9?y~?1g?bq?y=z?s?*(?jTJ<K?e)&?}<?7$W=g?;{?:=Rc=|?m?ϑ!?̾p?|?M>d>;	m?+dt?f>>#M
+潾Ow_?sg?>q6?.}0:z?$
+ ?m?hR_?>?xh?o?`t?3N?kWo?
\ No newline at end of file
@@ -0,0 +1 @@
+ByJ<@@b?B\?!!@'T@%???x??9?T?gz@1??;ь?)1?@?R?>?@LT??]?_|@v}@P"???U@r@%?C?ص?]l@@Ӈ?S?@?q9?ظ???@6@Ge@?z?J??2'@Q?^׶?T????/?H?l?_??
\ No newline at end of file
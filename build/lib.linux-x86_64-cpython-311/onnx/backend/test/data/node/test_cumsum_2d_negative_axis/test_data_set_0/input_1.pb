@@ -0,0 +1 @@
+BaxisJ
\ No newline at end of file
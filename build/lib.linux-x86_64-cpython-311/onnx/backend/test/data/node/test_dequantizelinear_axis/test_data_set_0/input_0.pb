@@ -0,0 +1 @@
+BxJY"J;W cyf
\ No newline at end of file
@@ -0,0 +1 @@
+Bx_zero_pointJT
\ No newline at end of file
@@ -0,0 +1 @@
+ByJ?x2???5??f?H??>??.?ƨ?m?ސ??B?r??⒂??ݙ????(?%ן???????h;?W??j?*???&g???"?f+?`?Fn?@?K?t???C!?!??7W?.???~??
\ No newline at end of file
@@ -0,0 +1 @@
+ByJ?x2???5?
\ No newline at end of file
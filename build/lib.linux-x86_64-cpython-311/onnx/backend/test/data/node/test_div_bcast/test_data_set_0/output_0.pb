@@ -0,0 +1 @@
+BzJd5?#>8>??3?AhY?>1뽽xʍ>=Gd?0?2=	>΃>3?edb>wM?'?nW@"''=wn??'='>p,dFd=Ì?i?8rdOxЎ?R64VJ?yӶL0%>oƾUؼ3>%s=k>(
\ No newline at end of file
@@ -0,0 +1,4 @@
+ByJ<	
+
+
+
\ No newline at end of file
@@ -0,0 +1 @@
+BrJ=
\ No newline at end of file
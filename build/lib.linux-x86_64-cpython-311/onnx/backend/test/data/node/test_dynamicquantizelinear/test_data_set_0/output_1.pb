@@ -0,0 +1 @@
+By_scaleJ<
\ No newline at end of file
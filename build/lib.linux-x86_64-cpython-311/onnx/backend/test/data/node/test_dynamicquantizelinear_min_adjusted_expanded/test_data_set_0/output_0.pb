@@ -0,0 +1 @@
+ByJ@S`
\ No newline at end of file
@@ -0,0 +1 @@
+ByJx9?2g?kZ?M	?ſu(@:E3ꐑ3?$`<?B`6?;˿"_}쿵E?gZK꿬WnL'?
\ No newline at end of file
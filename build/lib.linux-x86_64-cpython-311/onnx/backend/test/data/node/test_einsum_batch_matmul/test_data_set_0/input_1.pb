@@ -0,0 +1,3 @@
+ByJ6Q?3ꐑ3?ʣhx0WE)Q1DֿN6>?EGE?$`<?`hkؿ͢XӿSdQy]~d`LB`6?6Oe֨h	ܿn%sQht3?;˿"_}쿚±??X࿮+TۜBi?E?90[?]Lz4&7׿˄忦\C׿gZKvڞO7[?JcǶٿfJ)w9?W
+>@?)T?e?tR6:?*nL'?zn⿈Fzӿ>?(?}(t|ך?gi?^sBtrH?D~U?|-G?
+ǿ7!K&?
\ No newline at end of file
@@ -0,0 +1 @@
+BxJ(9?S,?"RQ?N1iY@=|?
\ No newline at end of file
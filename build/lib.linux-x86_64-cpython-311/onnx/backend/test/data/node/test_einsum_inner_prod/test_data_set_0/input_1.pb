@@ -0,0 +1 @@
+ByJ(BE2g?6I_ÿYlf)g>G?
\ No newline at end of file
@@ -0,0 +1 @@
+BzJPR<
\ No newline at end of file
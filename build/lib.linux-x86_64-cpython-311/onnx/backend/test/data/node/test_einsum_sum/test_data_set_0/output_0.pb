@@ -0,0 +1 @@
+ByJ[.܋@R0?H!@ڻ}?
\ No newline at end of file
@@ -0,0 +1 @@
+BxJ`9?S,?"RQ?N1iY@=|?BE2g?6I_ÿYlf)g>G?p?KD?
\ No newline at end of file
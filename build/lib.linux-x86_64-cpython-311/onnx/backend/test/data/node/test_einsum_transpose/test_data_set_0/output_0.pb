@@ -0,0 +1 @@
+ByJ`9?=|?YlS,?BEf)g>G?"RQ?2g?p?N1iY@6I_ÿKD?
\ No newline at end of file
@@ -0,0 +1 @@
+ByJx?h>z?j@$?8s?ԏ(H9>(>%?^B?0=B>]ת>=?iJ>n쿌S'?K]?|C@+6ĿHm;=Hή2??>>ܿr >*z??Bk$ВFIP¿}ѿ?vpL$5	ܶ	G? Ϳ;ľq>0Lb`cQN>.:=ݚ>2}p~
\ No newline at end of file
@@ -0,0 +1 @@
+ByJx?h>z?j@$?8s?(Ƚ9>(>%?^B?0=B>]ת>=?=iJ>nlS'?K]?|C@+6DHm;=H.2??>>\r >*z??BkВFI&PB}Q?vp̾$	6	G? M;Dq>0̾b1`QN>.:=ݚ>2}~ě
\ No newline at end of file
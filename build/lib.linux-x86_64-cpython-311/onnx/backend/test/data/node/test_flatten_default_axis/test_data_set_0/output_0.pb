@@ -0,0 +1 @@
+BbJ?7?N?w}?H>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=p=<&U?H5G?^?z?L?G>G?9=#?4>q?ڗ?N>s>.4F?>?<\?N?c?yq?Ƌ.?k>>2?v=9*?+?nW>A>>L8>j?a>}?=U>R.%>2'?p>I>Jz>">]=7(?>LI>ɼ>,R?	=V?>=?y?>z?(?a@=?a =̐>)=>'=΢>G>_=E1??">?c=;q?[m?x>h*?>8a7?	->;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>???od>\s?>=X?3?I>UP?>a?M?ia?I1?
\ No newline at end of file
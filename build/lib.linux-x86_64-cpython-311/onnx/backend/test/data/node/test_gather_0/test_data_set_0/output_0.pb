@@ -0,0 +1 @@
+ByJx?h>z?j@$?.z8s?bhdӽ9>(>%?^B?0=B>]ת>=?RiJ>Z/d#S'?K]?=C@(Hm;= ?2??>>Ec! >*z??Oƾmǚ6&õgڿ?xFKྙ[	G?ב?>O/^~/Ѓf=#f?Ok>Ŀ??@?7>8lF?5mξy?	FU>z?u>4?
\ No newline at end of file
@@ -0,0 +1 @@
+ByJx?h>z?j@$?.z8s?bhdӽ9>(>%?iJ>Z/d#S'?K]?=C@(Hm;= ?2??>>Ec! >gڿ?xFKྙ[	G?4οYL=e> kQN>.:=ݚ>b"6Wп>DhT=:?>ב?>O/^~/Ѓf=#f?Ok>Ŀ5mξy?	FU>z?u>4?G,<h?>>>?^Ab*x?(?Ӿ3Y?7mM?r?N4?l?
\ No newline at end of file
@@ -0,0 +1 @@
+BdataJ$x?h>z?j@$?.z8s?bhdӽ
\ No newline at end of file
@@ -0,0 +1 @@
+ByJx?z?j@.z8s?hdӽ
\ No newline at end of file
@@ -0,0 +1 @@
+BaJ0?7?N?w}?H>QY%?n><Kd?v?rR>~J?e?
\ No newline at end of file
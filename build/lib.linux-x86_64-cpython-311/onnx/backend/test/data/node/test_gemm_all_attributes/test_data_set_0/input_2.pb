@@ -0,0 +1 @@
+BcJ>?<\?N?
\ No newline at end of file
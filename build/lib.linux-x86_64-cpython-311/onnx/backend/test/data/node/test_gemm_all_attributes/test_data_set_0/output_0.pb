@@ -0,0 +1 @@
+ByJ<u>>>>>>"??*'?M?>L#?n>X>?
\ No newline at end of file
@@ -0,0 +1 @@
+BbJPp=<&U?H5G?^?z?L?G>G?9=#?4>q?ڗ?N>s>.4F?>?<
\ No newline at end of file
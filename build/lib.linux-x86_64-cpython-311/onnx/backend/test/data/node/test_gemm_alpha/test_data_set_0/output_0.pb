@@ -0,0 +1 @@
+ByJ0b}?C!?%p?>ƕ?D?\؄??ps??No?	?
\ No newline at end of file
@@ -0,0 +1 @@
+BaJ8?7?N?w}?H>QY%?n><Kd?v?rR>~J?e?^k?l?
\ No newline at end of file
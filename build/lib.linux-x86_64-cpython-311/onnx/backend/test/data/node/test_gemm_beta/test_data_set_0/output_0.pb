@@ -0,0 +1 @@
+ByJ <?X{-@V	@Ε3@@5X@7.+@Ċ^@
\ No newline at end of file
@@ -0,0 +1 @@
+BbJ`H5G?^?z?L?G>G?9=#?4>q?ڗ?N>s>.4F?>?<\?N?c?yq?Ƌ.?k>>
\ No newline at end of file
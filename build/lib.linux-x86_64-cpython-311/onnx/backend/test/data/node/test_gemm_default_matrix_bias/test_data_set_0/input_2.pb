@@ -0,0 +1 @@
+BcJ02?v=9*?+?nW>A>>L8>j?a>}?=
\ No newline at end of file
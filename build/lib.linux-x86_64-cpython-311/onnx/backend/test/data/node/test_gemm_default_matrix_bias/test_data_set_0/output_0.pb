@@ -0,0 +1,2 @@
+ByJ0ka@2@@*@?P@P@
+'@@C@@bD?
\ No newline at end of file
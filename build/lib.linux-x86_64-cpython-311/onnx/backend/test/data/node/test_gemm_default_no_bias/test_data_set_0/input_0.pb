@@ -0,0 +1,2 @@
+
+BaJP?7?N?w}?H>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=p=<&U?H5G?^?
\ No newline at end of file
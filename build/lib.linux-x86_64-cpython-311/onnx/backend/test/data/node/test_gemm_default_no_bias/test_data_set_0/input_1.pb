@@ -0,0 +1,2 @@
+
+BbJxz?L?G>G?9=#?4>q?ڗ?N>s>.4F?>?<\?N?c?yq?Ƌ.?k>>2?v=9*?+?nW>A>>L8>
\ No newline at end of file
@@ -0,0 +1 @@
+BaJ?7?N?w}?H>QY%?
\ No newline at end of file
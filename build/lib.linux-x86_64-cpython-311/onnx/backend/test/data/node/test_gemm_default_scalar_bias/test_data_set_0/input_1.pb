@@ -0,0 +1 @@
+BbJ0n><Kd?v?rR>~J?e?^k?l?Z{=p=<&U?
\ No newline at end of file
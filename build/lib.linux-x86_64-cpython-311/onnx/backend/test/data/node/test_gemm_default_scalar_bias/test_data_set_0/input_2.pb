@@ -0,0 +1 @@
+BcJH@
\ No newline at end of file
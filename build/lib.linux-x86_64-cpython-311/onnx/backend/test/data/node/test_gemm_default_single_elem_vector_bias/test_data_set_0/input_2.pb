@@ -0,0 +1 @@
+BcJ2?
\ No newline at end of file
@@ -0,0 +1 @@
+ByJ$7@[-@͆2@UX@N@nT@[)@@*8@
\ No newline at end of file
@@ -0,0 +1 @@
+BbJpZ{=p=<&U?H5G?^?z?L?G>G?9=#?4>q?ڗ?N>s>.4F?>?<\?N?c?yq?Ƌ.?k>>
\ No newline at end of file
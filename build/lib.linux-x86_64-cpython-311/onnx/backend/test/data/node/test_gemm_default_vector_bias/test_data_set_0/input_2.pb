@@ -0,0 +1 @@
+BcJ2?v=9*?+?
\ No newline at end of file
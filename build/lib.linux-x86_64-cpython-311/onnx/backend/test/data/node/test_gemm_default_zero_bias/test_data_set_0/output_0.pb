@@ -0,0 +1 @@
+ByJ0b?C?%?~?@D?\@?p?ߎ?N?	?
\ No newline at end of file
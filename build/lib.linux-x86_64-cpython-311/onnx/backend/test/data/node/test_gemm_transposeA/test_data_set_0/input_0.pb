@@ -0,0 +1 @@
+BaJH?7?N?w}?H>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=p=<&U?
\ No newline at end of file
@@ -0,0 +1 @@
+ByJ0m1@j?a?	@7I@m??L @A@"̍?S?0J?
\ No newline at end of file
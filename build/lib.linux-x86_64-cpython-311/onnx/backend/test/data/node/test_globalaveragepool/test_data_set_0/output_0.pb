@@ -0,0 +1 @@
+ByJI>oFw
\ No newline at end of file
@@ -0,0 +1 @@
+ByJC@?ב?
\ No newline at end of file
@@ -0,0 +1,7 @@
+BYJH
+B>
+B>
+B>
+B>
+B>
+B>W3>W3>W3>W3>W3>W3>fU=fU=fU=fU=fU=fU=
\ No newline at end of file
@@ -0,0 +1 @@
+BWJx==============================
\ No newline at end of file
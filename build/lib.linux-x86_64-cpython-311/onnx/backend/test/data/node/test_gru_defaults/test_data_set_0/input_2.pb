@@ -0,0 +1 @@
+BRJ===========================================================================
\ No newline at end of file
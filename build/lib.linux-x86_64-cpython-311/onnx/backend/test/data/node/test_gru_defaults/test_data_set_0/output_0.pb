@@ -0,0 +1 @@
+BY_hJ<=====yYM>yYM>yYM>yYM>yYM>L>L>L>L>L>
\ No newline at end of file
@@ -0,0 +1,2 @@
+BBJxٺ>*>ǩ?319r޾?,?֞>8E<
+?,`="*-?u?ELUd>q鋿᾿>u*>l"?r@hq?id?oT
\ No newline at end of file
@@ -0,0 +1 @@
+BY_hJ<HH"~9>/$\z=XO7X!d.>#<ЀO\L
\ No newline at end of file
@@ -0,0 +1 @@
+	BWJl===========================
\ No newline at end of file
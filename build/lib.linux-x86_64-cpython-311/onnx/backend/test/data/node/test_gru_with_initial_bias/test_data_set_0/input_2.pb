@@ -0,0 +1 @@
+	BRJl===========================
\ No newline at end of file
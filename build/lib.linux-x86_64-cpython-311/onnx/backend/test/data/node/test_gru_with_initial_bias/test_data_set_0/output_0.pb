@@ -0,0 +1 @@
+BY_hJ$yYM>yYM>yYM>>>>)G=)G=)G=
\ No newline at end of file
@@ -0,0 +1 @@
+BsJٺ>*>
\ No newline at end of file
@@ -0,0 +1 @@
+BxJx?h>z?j@$?.z?8s?b>hd=9>(>%?^B?0=B>]ת>=?R>iJ>Z?/d#@S'?K]?=?C@(?Hm;= ?>2??>>Ec??!> >*z??O>mǚ>6?&õ?g??x?FK>[?	G?4?Y>L=e?> ??k<QN>.:=ݚ>b"?6>
\ No newline at end of file
@@ -0,0 +1 @@
+ByJ7n,о
\ No newline at end of file
@@ -0,0 +1 @@
+ByJ ,\,#X`,\,#X`
\ No newline at end of file
@@ -0,0 +1,2 @@
+
+	seq_empty
\ No newline at end of file
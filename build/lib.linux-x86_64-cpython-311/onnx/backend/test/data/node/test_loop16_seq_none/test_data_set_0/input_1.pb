@@ -0,0 +1 @@
+	BcondJ
\ No newline at end of file
@@ -0,0 +1 @@
+BYJT٪>٪>٪>٪>٪>٪>٪>)U?)U?)U?)U?)U?)U?)U?7?7?7?7?7?7?7?
\ No newline at end of file
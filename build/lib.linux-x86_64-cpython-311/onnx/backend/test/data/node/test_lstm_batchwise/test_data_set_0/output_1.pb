@@ -0,0 +1 @@
+BY_hJT٪>٪>٪>٪>٪>٪>٪>)U?)U?)U?)U?)U?)U?)U?7?7?7?7?7?7?7?
\ No newline at end of file
@@ -0,0 +1 @@
+BY_hJ$===>>>.u>.u>.u>
\ No newline at end of file
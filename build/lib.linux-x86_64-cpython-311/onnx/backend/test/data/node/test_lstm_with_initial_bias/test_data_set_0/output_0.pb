@@ -0,0 +1 @@
+BY_hJ0>>>>f	?f	?f	?f	?|*?|*?|*?|*?
\ No newline at end of file
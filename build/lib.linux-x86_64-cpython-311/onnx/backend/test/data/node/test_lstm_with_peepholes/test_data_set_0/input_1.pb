@@ -0,0 +1 @@
+BWJ================================================
\ No newline at end of file
@@ -0,0 +1 @@
+	BPJ$=========
\ No newline at end of file
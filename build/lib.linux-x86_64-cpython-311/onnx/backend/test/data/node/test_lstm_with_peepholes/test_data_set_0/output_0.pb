@@ -0,0 +1 @@
+BY_hJ	>	>	>.?.?.?
\ No newline at end of file
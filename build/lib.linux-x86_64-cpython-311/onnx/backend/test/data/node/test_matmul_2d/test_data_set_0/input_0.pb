@@ -0,0 +1 @@
+BaJ0x?h>z?j@$?.z8s?bhdӽ9>(>%?
\ No newline at end of file
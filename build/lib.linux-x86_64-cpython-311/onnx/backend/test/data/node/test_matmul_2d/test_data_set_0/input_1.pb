@@ -0,0 +1 @@
+BbJ0^B?0=B>]ת>=?RiJ>Z/d#S'?K]?=
\ No newline at end of file
@@ -0,0 +1 @@
+BcJ$O@~?]?|6wS]??ɿ
\ No newline at end of file
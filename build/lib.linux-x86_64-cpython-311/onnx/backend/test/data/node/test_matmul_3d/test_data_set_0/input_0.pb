@@ -0,0 +1 @@
+BaJ`C@(Hm;= ?2??>>Ec! >*z??Oƾmǚ6&õgڿ?xFKྙ[	G?
\ No newline at end of file
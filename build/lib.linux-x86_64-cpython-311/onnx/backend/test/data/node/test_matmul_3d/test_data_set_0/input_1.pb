@@ -0,0 +1 @@
+BbJ`4οYL=e> kQN>.:=ݚ>b"6^&,Z[*Pܿ35>;;Wп>DhT=:?>
\ No newline at end of file
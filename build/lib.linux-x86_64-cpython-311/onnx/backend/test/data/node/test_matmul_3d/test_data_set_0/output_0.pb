@@ -0,0 +1 @@
+BcJHZ>Wz6N_89?)s?pC@Zb 啿fB@A?CN@4K@=c?
\ No newline at end of file
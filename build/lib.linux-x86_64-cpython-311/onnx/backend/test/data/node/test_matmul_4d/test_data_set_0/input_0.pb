@@ -0,0 +1 @@
+BaJ`ב?>O/^~/Ѓf=#f?Ok>Ŀ??@?7>8lF?5mξy?	FU>z?u>4?
\ No newline at end of file
@@ -0,0 +1 @@
+BcJHB>آ?⻆>>>~?N3?BmT@?5>@կD=3B?H?D?>O@
\ No newline at end of file
@@ -0,0 +1 @@
+BBJ
\ No newline at end of file
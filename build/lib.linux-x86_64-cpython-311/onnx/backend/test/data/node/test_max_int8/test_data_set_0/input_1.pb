@@ -0,0 +1 @@
+Bdata_1J
\ No newline at end of file
@@ -0,0 +1 @@
+BresultJ
\ No newline at end of file
@@ -0,0 +1 @@
+ByJx?z?j@j@$?8s?8s?hdӽ9>9>%?%?^B?B>B>=?=?iJ>iJ>ZS'?K]?K]?C@C@Hm;=Hm;=2?2??>Ec! >*z?*z??mǚmǚ6&õ??FKFKྜ	G?	G?YY>> kQN>QN>ݚ>ݚ>66ZZ[*P35>;;>>T=:?:?ב?ב?>>O/~/Ѓf=f=f?f?Ok>???@?7>8F?F?y?y?z?z?4?
\ No newline at end of file
@@ -0,0 +1,2 @@
+BxJ	
+
\ No newline at end of file
@@ -0,0 +1 @@
+Bdata_0J
\ No newline at end of file
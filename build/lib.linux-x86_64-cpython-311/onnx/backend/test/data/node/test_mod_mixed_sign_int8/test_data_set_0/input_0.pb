@@ -0,0 +1 @@
+BxJ
\ No newline at end of file
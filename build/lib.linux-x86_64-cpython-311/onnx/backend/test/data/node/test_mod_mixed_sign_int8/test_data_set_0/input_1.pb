@@ -0,0 +1 @@
+ByJ
\ No newline at end of file
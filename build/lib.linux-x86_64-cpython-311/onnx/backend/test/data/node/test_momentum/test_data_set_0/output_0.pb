@@ -0,0 +1 @@
+BX_newJ?IK-@
\ No newline at end of file
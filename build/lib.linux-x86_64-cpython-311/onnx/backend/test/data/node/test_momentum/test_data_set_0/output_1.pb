@@ -0,0 +1 @@
+BV_newJr-?<l?
\ No newline at end of file
@@ -0,0 +1 @@
+BX1_newJ5h?
\ No newline at end of file
@@ -0,0 +1 @@
+BX2_newJ^K8?q@
\ No newline at end of file
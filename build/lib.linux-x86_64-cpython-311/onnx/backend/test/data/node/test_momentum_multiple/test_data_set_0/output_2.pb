@@ -0,0 +1 @@
+BV1_newJf?
\ No newline at end of file
@@ -0,0 +1 @@
+BV2_newJC3@n
\ No newline at end of file
@@ -0,0 +1,3 @@
+BzJ8חTLKw.>	>&@ƿs˿=<&=	@>]?x6>iy=6=ǽ|D`>@e?!>Q?0X@w0[\=	=ҿQ?X>[W=tn$?=WS<Gm	@GXI%?
+@??Yq?FC ֿj{><>MS~;>
+=@oǾF
\ No newline at end of file
@@ -0,0 +1,2 @@
+BzJ8חTLKw.><(?'箾	=v6>2=l`ƽk(W9I=e	*>~Z
+-?p3?0>o^z?ǆa>;X)z>dս;k8?Z@?|R׽W|@Kz++?ڱ[4?ش??W11Ԗ>>!N2@9'?bs>Op@B٣}y|üW{)?σ
\ No newline at end of file
@@ -0,0 +1 @@
+BYJld?;>:ſrd>D>6nQ?[?:#rcvyHE3U?>	,?UD?Pi?ҿo?>2?ϗ?m=msþ
\ No newline at end of file
@@ -0,0 +1 @@
+ByJxh̾zj$.z?8sb>hd=9Ҿ(%^B0B]ת=R>iJZ?/d#@S'K]=?C(?Hm; ?>2ĿEc??!> *z癿O>mǚ>6?&õ?g?x?FK>[?	G4?Y>L=e?ƾ ??k<QN۾.:ݚb"?6>
\ No newline at end of file
@@ -0,0 +1 @@
+BX_newJ?A=@
\ No newline at end of file
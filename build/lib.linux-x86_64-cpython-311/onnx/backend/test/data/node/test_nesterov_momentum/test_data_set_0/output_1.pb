@@ -0,0 +1 @@
+BV_newJ</? r?
\ No newline at end of file
@@ -0,0 +1 @@
+BlossJ7rRľl
\ No newline at end of file
@@ -0,0 +1 @@
+BlossJ
\ No newline at end of file
@@ -0,0 +1 @@
+BweightJ/>>5A?e>be?
\ No newline at end of file
@@ -0,0 +1 @@
+BlossJI
\ No newline at end of file
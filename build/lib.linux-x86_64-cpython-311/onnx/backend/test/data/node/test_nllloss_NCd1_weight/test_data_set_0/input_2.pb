@@ -0,0 +1 @@
+BweightJ<\?N?c?yq?
\ No newline at end of file
@@ -0,0 +1 @@
+BlossJz(	
\ No newline at end of file
@@ -0,0 +1 @@
+BlossJx
\ No newline at end of file
@@ -0,0 +1 @@
+BlossJZk
\ No newline at end of file
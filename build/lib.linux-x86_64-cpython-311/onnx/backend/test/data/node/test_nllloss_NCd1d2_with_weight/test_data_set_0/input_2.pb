@@ -0,0 +1 @@
+BweightJY?`o?p?W=K?
\ No newline at end of file
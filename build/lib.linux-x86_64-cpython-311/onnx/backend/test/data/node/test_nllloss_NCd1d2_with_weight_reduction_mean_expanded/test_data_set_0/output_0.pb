@@ -0,0 +1,2 @@
+BlossJN
+
\ No newline at end of file
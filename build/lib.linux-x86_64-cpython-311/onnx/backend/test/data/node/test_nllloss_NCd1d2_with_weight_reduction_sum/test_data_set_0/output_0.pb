@@ -0,0 +1 @@
+BlossJ0	
\ No newline at end of file
@@ -0,0 +1 @@
+BlossJbڿ
\ No newline at end of file
@@ -0,0 +1,2 @@
+BweightJ(>u?>
+^?|>
\ No newline at end of file
@@ -0,0 +1 @@
+BinputJ<?7?N?w}?H>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=
\ No newline at end of file
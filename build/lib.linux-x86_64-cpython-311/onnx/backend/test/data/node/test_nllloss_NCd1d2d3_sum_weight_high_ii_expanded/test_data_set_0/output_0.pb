@@ -0,0 +1 @@
+BlossJШ|
\ No newline at end of file
@@ -0,0 +1 @@
+BweightJ	=?@?o>id>
\ No newline at end of file
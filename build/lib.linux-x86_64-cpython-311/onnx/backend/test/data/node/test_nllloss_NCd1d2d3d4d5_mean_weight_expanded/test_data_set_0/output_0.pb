@@ -0,0 +1 @@
+BlossJp
\ No newline at end of file
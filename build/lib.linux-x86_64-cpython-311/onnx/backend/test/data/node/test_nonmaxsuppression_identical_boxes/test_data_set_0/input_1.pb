@@ -0,0 +1,2 @@
+
+BscoresJ(fff?fff?fff?fff?fff?fff?fff?fff?fff?fff?
\ No newline at end of file
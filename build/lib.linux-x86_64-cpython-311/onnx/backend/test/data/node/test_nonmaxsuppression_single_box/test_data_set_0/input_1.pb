@@ -0,0 +1 @@
+BscoresJfff?
\ No newline at end of file
@@ -0,0 +1 @@
+Bscore_thresholdJ>
\ No newline at end of file
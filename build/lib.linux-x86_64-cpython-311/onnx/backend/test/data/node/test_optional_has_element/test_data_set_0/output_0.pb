@@ -0,0 +1 @@
+	BoutputJ
\ No newline at end of file
@@ -0,0 +1 @@
+BslopeJ^&,Z[*Pܿ35>
\ No newline at end of file
@@ -0,0 +1 @@
+ByJx?h>z?j@$?<(?8s?	=v6>9>(>%?^B?0=B>]ת>=?*>iJ>-?S'?K]??C@o^z?Hm;=a>2??>>k8?Z@?| >*z??++?ڱ[4?ش???11Ԗ>>	G?N2@9'?>>Op@B٣QN>.:=ݚ>)?σ
\ No newline at end of file
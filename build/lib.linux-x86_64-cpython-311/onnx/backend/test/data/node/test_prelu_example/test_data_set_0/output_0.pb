@@ -0,0 +1,2 @@
+ByJx?h>z?j@$?	>8s?s˿=9>(>%?^B?0=B>]ת>=?=6=iJ>|D`>@S'?K]?Q?C@w0Hm;=	=2??>>[W=tn >*z??GXI%?
+@??Yq?	G?FC ֿ><>MS~;QN>.:=ݚ>oǾF
\ No newline at end of file
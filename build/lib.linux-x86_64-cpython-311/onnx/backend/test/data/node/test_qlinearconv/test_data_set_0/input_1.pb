@@ -0,0 +1 @@
+Bx_scaleJEq;
\ No newline at end of file
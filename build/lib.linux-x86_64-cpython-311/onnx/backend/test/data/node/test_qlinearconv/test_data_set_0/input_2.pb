@@ -0,0 +1 @@
+Bx_zero_pointJ
\ No newline at end of file
@@ -0,0 +1 @@
+Bw_scaleJ=|:
\ No newline at end of file
@@ -0,0 +1 @@
+Bw_zero_pointJ
\ No newline at end of file
@@ -0,0 +1 @@
+Ba_scaleJD;
\ No newline at end of file
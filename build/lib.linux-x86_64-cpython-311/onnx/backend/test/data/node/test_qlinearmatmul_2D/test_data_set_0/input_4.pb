@@ -0,0 +1 @@
+Bb_scaleJ;
\ No newline at end of file
@@ -0,0 +1 @@
+Bb_zero_pointJr
\ No newline at end of file
@@ -0,0 +1 @@
+By_scaleJO/<
\ No newline at end of file
@@ -0,0 +1 @@
+ByJsB
\ No newline at end of file
@@ -0,0 +1 @@
+Ba_zero_pointJq
\ No newline at end of file
@@ -0,0 +1 @@
+By_zero_pointJv
\ No newline at end of file
@@ -0,0 +1 @@
+ByJsBsB
\ No newline at end of file
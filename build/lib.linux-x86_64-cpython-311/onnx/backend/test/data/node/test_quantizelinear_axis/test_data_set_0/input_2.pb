@@ -0,0 +1 @@
+By_zero_pointJT
\ No newline at end of file
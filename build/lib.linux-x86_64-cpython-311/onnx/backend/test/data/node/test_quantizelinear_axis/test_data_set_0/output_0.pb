@@ -0,0 +1 @@
+ByJY"J;W cyf
\ No newline at end of file
@@ -0,0 +1 @@
+BdeltaJ
\ No newline at end of file
@@ -0,0 +1 @@
+BxJ??S?Z'??tl??p?%?MY?9)b??W?Բ??y?k/?N?-?J??\?^C?J?#v?b?<G??Ͳ$??˂?I'j?C??Dt?r?i??'Y??̸?E?\?To?K?j?X?vו?5?P!?P?&]?5?0Hp???x5?K)??@?$`w?>?
\ No newline at end of file
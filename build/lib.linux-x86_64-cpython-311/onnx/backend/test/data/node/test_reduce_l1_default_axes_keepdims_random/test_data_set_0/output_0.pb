@@ -0,0 +1 @@
+BreducedJB
\ No newline at end of file
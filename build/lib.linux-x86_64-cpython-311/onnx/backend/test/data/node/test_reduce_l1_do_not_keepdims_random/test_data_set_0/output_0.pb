@@ -0,0 +1 @@
+BreducedJ;@<@;@VA9A`2@
\ No newline at end of file
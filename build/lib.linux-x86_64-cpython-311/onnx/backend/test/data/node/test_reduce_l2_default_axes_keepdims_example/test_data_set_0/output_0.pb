@@ -0,0 +1 @@
+BreducedJA
\ No newline at end of file
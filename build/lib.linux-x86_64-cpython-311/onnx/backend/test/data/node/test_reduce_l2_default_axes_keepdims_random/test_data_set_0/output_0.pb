@@ -0,0 +1 @@
+BreducedJoA
\ No newline at end of file
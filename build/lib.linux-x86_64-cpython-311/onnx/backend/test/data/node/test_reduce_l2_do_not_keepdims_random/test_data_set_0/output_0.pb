@@ -0,0 +1 @@
+BreducedJV8@5@R@@A@
\ No newline at end of file
@@ -0,0 +1 @@
+BreducedJ!	@F@@
\ No newline at end of file
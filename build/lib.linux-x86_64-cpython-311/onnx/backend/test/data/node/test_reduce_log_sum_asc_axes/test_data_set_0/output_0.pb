@@ -0,0 +1 @@
+BreducedJ?T?|g?*?4?
\ No newline at end of file
@@ -0,0 +1 @@
+BreducedJh[@
\ No newline at end of file
@@ -0,0 +1 @@
+BreducedJpB
\ No newline at end of file
@@ -0,0 +1 @@
+BreducedJ[QA
\ No newline at end of file
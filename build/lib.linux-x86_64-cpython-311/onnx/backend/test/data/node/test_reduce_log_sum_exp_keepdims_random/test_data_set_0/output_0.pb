@@ -0,0 +1 @@
+BreducedJC@Ê@RL/@A!?
\ No newline at end of file
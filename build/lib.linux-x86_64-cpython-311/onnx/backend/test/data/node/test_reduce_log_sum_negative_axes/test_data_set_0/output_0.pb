@@ -0,0 +1,2 @@
+BreducedJ<L:? ?,?_?u?-j?9jX?Yoh?t?HV>?l?W:?
+l>
\ No newline at end of file
@@ -0,0 +1 @@
+BreducedJA_A
\ No newline at end of file
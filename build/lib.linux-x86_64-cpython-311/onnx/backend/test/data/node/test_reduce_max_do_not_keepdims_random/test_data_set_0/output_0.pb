@@ -0,0 +1 @@
+BreducedJ@@Ɵ@A_A&?
\ No newline at end of file
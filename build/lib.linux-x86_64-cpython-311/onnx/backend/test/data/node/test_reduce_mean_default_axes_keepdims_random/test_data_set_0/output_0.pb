@@ -0,0 +1 @@
+BreducedJ@
\ No newline at end of file
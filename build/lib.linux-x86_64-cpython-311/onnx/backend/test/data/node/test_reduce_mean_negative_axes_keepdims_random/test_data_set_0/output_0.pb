@@ -0,0 +1 @@
+BreducedJ?Ir&@8@^@1k`
\ No newline at end of file
@@ -0,0 +1 @@
+BreducedJ1
\ No newline at end of file
@@ -0,0 +1 @@
+BreducedJy?Ie?qÿ:@;@1
\ No newline at end of file
@@ -0,0 +1 @@
+BreducedJgM
\ No newline at end of file
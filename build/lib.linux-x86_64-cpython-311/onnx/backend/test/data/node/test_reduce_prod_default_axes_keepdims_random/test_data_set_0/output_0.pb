@@ -0,0 +1 @@
+BreducedJZ
\ No newline at end of file
@@ -0,0 +1 @@
+BreducedJvA
\ No newline at end of file
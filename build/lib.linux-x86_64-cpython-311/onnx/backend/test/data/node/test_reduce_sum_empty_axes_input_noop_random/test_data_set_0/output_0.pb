@@ -0,0 +1 @@
+BreducedJ0y?@@Ie?qÿ:@Ɵ@A_A1;@&?
\ No newline at end of file
@@ -0,0 +1 @@
+BreducedJB@Ir@81,A^qA1k
\ No newline at end of file
@@ -0,0 +1 @@
+BreducedJN`C
\ No newline at end of file
@@ -0,0 +1 @@
+BreducedJګ@Ax@#ыBB@
\ No newline at end of file
@@ -0,0 +1 @@
+BdataJ`?7?N?w}?H>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=p=<&U?H5G?^?z?L?G>G?
\ No newline at end of file
@@ -0,0 +1 @@
+BYJ*@@
\ No newline at end of file
@@ -0,0 +1 @@
+BRJd]ת>=?RiJ>Z/d#S'?K]?=C@(Hm;= ?2??>>Ec! >*z??Oƾmǚ
\ No newline at end of file
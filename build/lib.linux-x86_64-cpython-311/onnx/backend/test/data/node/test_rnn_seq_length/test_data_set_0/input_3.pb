@@ -0,0 +1,2 @@
+
+BBJ(6&õgڿ?xFKྙ[	G?4οY
\ No newline at end of file
@@ -0,0 +1,3 @@
+BYJ>>V>??W?$(>>Z> c?F>>u>?M?"><N>G>0?m>I`??ff6? ?ƫ>>>j>io>q>,
+?/>z4?X9?
+h>3?+>?%??TtT?s?(=?m4?RV?*c?Di?M?5?ۊ?>!t>;>vO>(?B?>>6?l?y?,?F%?&?C?`?	?a>=[>'>Q>|>g>}Г>vq>p>
\ No newline at end of file
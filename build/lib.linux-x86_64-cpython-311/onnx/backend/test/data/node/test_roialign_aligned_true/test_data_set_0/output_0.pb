@@ -0,0 +1,2 @@
+BYJ? ү>&S>>
+h"? c>^	?>>D>I>>?2?sh>>:>?>U/?>B6?ZR?>>/>_>ڪ>#>X>$?>Ș>\?b>$><>>??>ྎ>.>)?333?I@?}?}3?'9?Q;?	P?u>ף>;>G>s>>W>->S$?OT?;?>;p?@?{n?')??l>>*?)?䃾>ΈR>]mE>H}>
\ No newline at end of file
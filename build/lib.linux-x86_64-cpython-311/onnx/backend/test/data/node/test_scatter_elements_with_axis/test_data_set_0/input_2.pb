@@ -0,0 +1 @@
+BupdatesJ̌?ff@
\ No newline at end of file
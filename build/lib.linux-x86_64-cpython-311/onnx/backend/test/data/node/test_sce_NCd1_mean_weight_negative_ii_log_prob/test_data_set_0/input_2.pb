@@ -0,0 +1 @@
+BwJ/>>5A?e>be?
\ No newline at end of file
@@ -0,0 +1,2 @@
+BwJ(>u?>
+^?|>
\ No newline at end of file
@@ -0,0 +1 @@
+BwJ	=?@?o>id>
\ No newline at end of file
@@ -0,0 +1 @@
+BzJX?
\ No newline at end of file
@@ -0,0 +1 @@
+BzJu?
\ No newline at end of file
@@ -0,0 +1 @@
+Blog_probJ<pпʿ:kѿSӿ]c/_t~FٿCԿ^	
\ No newline at end of file
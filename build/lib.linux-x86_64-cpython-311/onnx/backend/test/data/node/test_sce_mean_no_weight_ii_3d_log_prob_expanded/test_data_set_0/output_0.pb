@@ -0,0 +1 @@
+BzJC?
\ No newline at end of file
@@ -0,0 +1 @@
+BzJh?
\ No newline at end of file
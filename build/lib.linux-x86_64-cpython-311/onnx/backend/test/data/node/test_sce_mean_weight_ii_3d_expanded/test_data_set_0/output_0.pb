@@ -0,0 +1 @@
+BzJA?
\ No newline at end of file
@@ -0,0 +1 @@
+BzJ?_t?^?
\ No newline at end of file
@@ -0,0 +1 @@
+BwJfff?333?L?fff?fff?
\ No newline at end of file
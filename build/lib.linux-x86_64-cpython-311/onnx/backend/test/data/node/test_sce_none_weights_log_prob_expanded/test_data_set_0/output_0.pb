@@ -0,0 +1 @@
+BzJqU??ٕ?
\ No newline at end of file
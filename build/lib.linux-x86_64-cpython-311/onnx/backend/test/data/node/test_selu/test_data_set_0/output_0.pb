@@ -0,0 +1,2 @@
+ByJZY@?;@0 @I@|oj6@޾Wޢz?<@>:@@>q?!?}n@+sop?%\R?%@:/I~@(>%@@>6?ja&>?7l@`f@8\ȿmy|$BF@XT6%5G@Xř,*c?d.
+*z?EWL>fLh?]4
\ No newline at end of file
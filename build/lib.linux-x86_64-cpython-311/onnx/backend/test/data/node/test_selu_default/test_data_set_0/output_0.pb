@@ -0,0 +1 @@
+ByJ7??D>V?E@*?Y?<|<0>>?L?>>ʀ>4?j>>ϿZ/?h?1k@zD=$??&>o>Tk?7(>"v?.?N꾂,.-@Y3!Q?: >#>4qHl>V"=>fSk
\ No newline at end of file
@@ -0,0 +1 @@
+BYJ0̷g?̷g?̷g?̷g?????????
\ No newline at end of file
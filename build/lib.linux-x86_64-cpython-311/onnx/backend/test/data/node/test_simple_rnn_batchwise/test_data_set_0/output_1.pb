@@ -0,0 +1 @@
+BY_hJ0̷g?̷g?̷g?̷g?????????
\ No newline at end of file
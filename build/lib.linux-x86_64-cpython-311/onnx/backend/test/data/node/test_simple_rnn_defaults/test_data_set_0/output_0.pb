@@ -0,0 +1 @@
+BY_hJ0&>&>&>&>ٷ?ٷ?ٷ?ٷ?L?L?L?L?
\ No newline at end of file
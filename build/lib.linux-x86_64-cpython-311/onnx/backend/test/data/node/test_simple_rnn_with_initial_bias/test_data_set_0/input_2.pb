@@ -0,0 +1 @@
+BRJd=========================
\ No newline at end of file
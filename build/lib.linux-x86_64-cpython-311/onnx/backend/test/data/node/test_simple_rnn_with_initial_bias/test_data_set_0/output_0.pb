@@ -0,0 +1 @@
+BY_hJ<ٷ?ٷ?ٷ?ٷ?ٷ?xk?xk?xk?xk?xk?|?|?|?|?|?
\ No newline at end of file
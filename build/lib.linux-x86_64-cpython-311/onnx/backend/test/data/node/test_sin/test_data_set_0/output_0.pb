@@ -0,0 +1 @@
+ByJ;{?t>]mT?H?Rt?7T_?P?f]ӽv^>>C~?m0?v=t>L>=??Pa>A!?*B?-C?LD~\;=>?~?3>	>Fmj#*s>OMq?un?cn4]u}}zm?E0پ.*s3?#4XGO0>sNlF>x =Ճ>`
\ No newline at end of file
@@ -0,0 +1 @@
+ByJ%E5@hd>B?̹@,J@6?ӽ.>>@//V?F=E>w>b@S>7vHa3?y?6O-@~;=,@uH@W@DM>cD>)c" >0R?^?N˾%`2Oru*\@g1ݸͿ[?W6~[\>¼>>S=<>V-ҽ
\ No newline at end of file
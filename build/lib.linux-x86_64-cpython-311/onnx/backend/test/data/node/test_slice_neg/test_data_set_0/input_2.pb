@@ -0,0 +1 @@
+BendsJ
\ No newline at end of file
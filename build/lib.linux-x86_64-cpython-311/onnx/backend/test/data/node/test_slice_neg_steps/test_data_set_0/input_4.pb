@@ -0,0 +1 @@
+BstepsJ
\ No newline at end of file
@@ -0,0 +1,3 @@
+ByJZ=p#K??	?Uݝ>p"RξRſC!Tu=n]?>wb=
+?@S=<<6I?xTbމ,>C?N[<q>"T8?"@Ns|?ImK(aA?>#??6Y^>SXĨ>6]<呿?G?r!#̣Ȝ??#?Pr֤\?h>	KvOxdt^??x>@Z??;=*[b)ʾ>v >/*E?۽Ⓘw>t<?>.*1y==˳0?
+-- >Y?+R?+ ?-$MF>ſTd?",l?>h??Ok>T=>
\ No newline at end of file
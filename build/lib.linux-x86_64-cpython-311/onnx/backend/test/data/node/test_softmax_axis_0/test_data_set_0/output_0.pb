@@ -0,0 +1 @@
+ByJ>QJ>:>/?>eE>>\>/=iY>w>?>=X>W>>oT>&>>?W>f>=o? ?KH>Շ>iQ>)?Йz>3O>v>~?>>F>/?)>Ȇ>>???J>a=:>B=>>N>2>a?rQ>bш>N>ꋃ> >=<j>GG>x.>
\ No newline at end of file
@@ -0,0 +1 @@
+ByJF?u=l>	9?`?^v>N>e%>n=>p*=K>]>ѱ=C>/q>>.>T=ZJ>(?|z>P(>G0>\?QCa>>*>>#p>>Ku=_>>z;>~)>=v=,> }>8==5>>ü?g>ʞ>n9=>&>)P>>k>|{>!>|o>A>9D>c;>#=s>o=>
\ No newline at end of file
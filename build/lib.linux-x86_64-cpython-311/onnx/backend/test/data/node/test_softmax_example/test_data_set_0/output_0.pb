@@ -0,0 +1 @@
+ByJa=z>;M*?
\ No newline at end of file
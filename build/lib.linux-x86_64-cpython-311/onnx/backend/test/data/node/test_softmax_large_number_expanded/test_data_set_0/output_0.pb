@@ -0,0 +1 @@
+ByJ O=x=jr>$?O=x=jr>$?
\ No newline at end of file
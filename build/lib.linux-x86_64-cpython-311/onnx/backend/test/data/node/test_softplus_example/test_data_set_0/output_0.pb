@@ -0,0 +1 @@
+ByJc>r1??
\ No newline at end of file
@@ -0,0 +1 @@
+BaxesJ
\ No newline at end of file
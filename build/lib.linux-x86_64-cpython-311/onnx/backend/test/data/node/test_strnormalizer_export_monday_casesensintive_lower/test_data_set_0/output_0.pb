@@ -0,0 +1 @@
+2tuesday2	wednesday2thursdayBy
\ No newline at end of file
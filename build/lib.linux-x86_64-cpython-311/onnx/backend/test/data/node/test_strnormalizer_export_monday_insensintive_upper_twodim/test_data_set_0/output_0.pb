@@ -0,0 +1 @@
+2TUESDAY2	WEDNESDAY2TUESDAY2	WEDNESDAYBy
\ No newline at end of file
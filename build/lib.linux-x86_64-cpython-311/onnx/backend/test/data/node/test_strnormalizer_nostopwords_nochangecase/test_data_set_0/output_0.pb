@@ -0,0 +1 @@
+2monday2tuesdayBy
\ No newline at end of file
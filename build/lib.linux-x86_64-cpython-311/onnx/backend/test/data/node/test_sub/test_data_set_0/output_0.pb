@@ -0,0 +1 @@
+BzJ@a|B?w\?5}@>V?Sk#%@>8(M?b>?̸ҡ?*=]?"Z@{T>?i$},>HK?H?jV D&@n>=?"XKF=K4~"?_)}L4;<߾;{??)?mCVh1?[bؿi0Rj>Eu>?wa;>˟,y
\ No newline at end of file
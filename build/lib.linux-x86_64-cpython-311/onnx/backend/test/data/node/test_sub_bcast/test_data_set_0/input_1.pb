@@ -0,0 +1 @@
+ByJ^&,Z[*Pܿ35>
\ No newline at end of file
@@ -0,0 +1,8 @@
+BzJ<
+
+	
+		
+
+
+
+
\ No newline at end of file
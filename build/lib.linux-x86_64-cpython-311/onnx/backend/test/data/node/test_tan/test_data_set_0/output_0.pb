@@ -0,0 +1 @@
+ByJR>R?=JQf?-/k%ԽF>>A[s?pm=u>5z>&PAzU>s꒿*?D?!?jI̎;=]ATA0A>h>PP@@!6k!>4@%@оDe޿@> 7RmB{?Y~Ap1]Ο̛>pwԟ>m=ğ>xZ<~R¾
\ No newline at end of file
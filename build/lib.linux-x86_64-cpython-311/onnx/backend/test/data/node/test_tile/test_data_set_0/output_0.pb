@@ -0,0 +1,2 @@
+
+BzJ	?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>?7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^??7?N?w}?H>?7?N?w}?H>QY%?n><Kd?v?rR>QY%?n><Kd?v?rR>~J?e?^k?l?Z{=~J?e?^k?l?Z{=p=<&U?H5G?^?p=<&U?H5G?^?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?z?L?G>G?9=z?L?G>G?9=#?4>q?ڗ?N>#?4>q?ڗ?N>s>.4F?>?<s>.4F?>?<\?N?c?yq?Ƌ.?\?N?c?yq?Ƌ.?k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>k>>2?v=9*?k>>2?v=9*?+?nW>A>>L8>+?nW>A>>L8>j?a>}?=U>j?a>}?=U>R.%>2'?p>I>Jz>R.%>2'?p>I>Jz>">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=">]=7(?>LI>">]=7(?>LI>ɼ>,R?	=V?>=ɼ>,R?	=V?>=?y?>z?(?a@=??y?>z?(?a@=?a =̐>)=>'=a =̐>)=>'=΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;΢>G>_=E1??΢>G>_=E1??">?c=;q?[m?">?c=;q?[m?x>h*?>8a7?	->x>h*?>8a7?	->;>%?<j5T?ܙ;;>%?<j5T?ܙ;b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?b-?|>>5<?Qv?%~>b-?|>>5<?Qv?%~>???od>\s????od>\s?>=X?3?I>UP?>=X?3?I>UP?>a?M?ia?I1?>a?M?ia?I1?
\ No newline at end of file
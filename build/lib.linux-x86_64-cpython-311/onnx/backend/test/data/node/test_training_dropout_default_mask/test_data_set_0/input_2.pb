@@ -0,0 +1 @@
+	BtJ
\ No newline at end of file
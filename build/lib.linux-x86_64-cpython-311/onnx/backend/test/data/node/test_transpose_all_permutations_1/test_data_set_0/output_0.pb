@@ -0,0 +1,2 @@
+B
+transposedJ`?H>v?7?QY%?rR>N?n>~J?w}?<Kd?e?^k?<z?l?&U?L?Z{=H5G?G>p=^?G?
\ No newline at end of file
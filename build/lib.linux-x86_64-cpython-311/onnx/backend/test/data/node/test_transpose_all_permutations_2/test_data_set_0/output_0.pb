@@ -0,0 +1,2 @@
+B
+transposedJ`?7?N?w}?^k?l?Z{=p=H>QY%?n><Kd?<&U?H5G?^?v?rR>~J?e?z?L?G>G?
\ No newline at end of file
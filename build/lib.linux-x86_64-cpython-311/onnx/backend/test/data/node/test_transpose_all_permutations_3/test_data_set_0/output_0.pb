@@ -0,0 +1,2 @@
+B
+transposedJ`?^k?7?l?N?Z{=w}?p=H><QY%?&U?n>H5G?<Kd?^?v?z?rR>L?~J?G>e?G?
\ No newline at end of file
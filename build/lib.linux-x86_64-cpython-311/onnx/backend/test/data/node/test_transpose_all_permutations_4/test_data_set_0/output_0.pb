@@ -0,0 +1,2 @@
+B
+transposedJ`?H>v?^k?<z?7?QY%?rR>l?&U?L?N?n>~J?Z{=H5G?G>w}?<Kd?e?p=^?G?
\ No newline at end of file
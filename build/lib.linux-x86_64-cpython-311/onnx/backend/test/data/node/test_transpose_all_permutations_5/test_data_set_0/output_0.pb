@@ -0,0 +1,2 @@
+B
+transposedJ`?^k?H><v?z?7?l?QY%?&U?rR>L?N?Z{=n>H5G?~J?G>w}?p=<Kd?^?e?G?
\ No newline at end of file
@@ -0,0 +1 @@
+BkJ
\ No newline at end of file
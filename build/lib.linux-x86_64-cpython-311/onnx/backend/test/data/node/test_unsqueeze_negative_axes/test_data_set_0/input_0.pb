@@ -0,0 +1 @@
+BxJ<x?h>z?j@$?.z8s?bhdӽ9>(>%?^B?0=B>
\ No newline at end of file
@@ -0,0 +1 @@
+J_?}jQT3n=?!@>>Q?f? >Ku=@f"=7>[y?rpA˘k>ޢ?{.r>7@|ѿE^?ՏȾ=?̿Nd=ྥ2Z>I>
\ No newline at end of file
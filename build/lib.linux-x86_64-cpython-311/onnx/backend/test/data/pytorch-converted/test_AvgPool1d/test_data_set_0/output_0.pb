@@ -0,0 +1,2 @@
+JH=^	a4>
+>{>Lt>Y^>glV9C??Nt>N>YE5>
\ No newline at end of file
@@ -0,0 +1 @@
+JH}?>X?,}}+ǀž?Sd>)@"p9Jr?)?f?
\ No newline at end of file
@@ -0,0 +1 @@
+Jbҽ#?G	=?}\?ا>nJ=T0r>^>'>=55=ʚ>9Z>žrl`n s+|r=/f~R(<[:>_w>a2	=>6?L>>bl>%#X~=>,<
\ No newline at end of file
@@ -0,0 +1,3 @@
+Je8L;Ap\3>g}%>qA>S>?a*<;
+_(ͽA<>C5?;>>.>>ۖ>B>Vp>G\>$u>떣>m
+>oȋ>w>q>YU>\@<U>nqZ;=Pἂjd<?<>N>ko= >ƍ=r[>-Q=
\ No newline at end of file
@@ -0,0 +1 @@
+J*F>Fr>\aX?ݾ><5?b#Q=ˀ<=rH<UEs'7y>yP>=d??ֽ"vD_VJp<R=g`D>}ʽi?=>1?%>g-=چr<wW~[=JheD=!2U=WU>e"?<&p=c<}:;(=
\ No newline at end of file
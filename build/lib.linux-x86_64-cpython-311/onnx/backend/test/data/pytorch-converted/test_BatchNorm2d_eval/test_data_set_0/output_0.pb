@@ -0,0 +1,3 @@
+JL+U0??B"!O>J"W1?u-x=>?K?8=},?gkǇz2?FdD><=Ѧ>&)?X808gʩ/?pY	?qꤾ	B=/?n.> 8"MR>:3mPh-`ʽ= >CK?S!>֖>/:=L=_¿Yo>׼>O+%=ㅫ=t=?Кq={#?>_#T=_l>&y?27> 0ξK͕C^=*km?d>p:oHG4>r>)=7L><ߑ	}J>u>| $?o?K>;վN?zӽsMgQ@0G?C?he9Ags>8v@?y(?sX?U}FU
+11?d?>bCq=O>+@&?_տ_6E?-Yhȭ?`	6>_ܾg<(!>d?492>?w>F?_n?Qbr?Δ>#?U:¾5?0Dd>n>4T?b?IRZF"?;\4>ξO>SU	?~j.`4?=(?S?E?&d=!q?@>*>>Ϊk&!>龳SL=X>Ɗ>U ?Zp*G?`"=<mbﳮ&H>>>Տ*1f=9 
+=H7ʽ#0b>E=06:?=
\ No newline at end of file
@@ -0,0 +1,2 @@
+
+JZY>0aiN3?[S{?c¾a?L">?6??~Az?R瀿y3/>w@ο>̾pƑ%>3=|?}$?;򔭿^L[?s>jI >N.5;(sdbz?O?z߿f>>->">&>e/>(v?gGX=i]+?V?2-ي0I>N6?X,ۧ?M<?t!=O>ҾHλ?9eࢠ>g<
\ No newline at end of file
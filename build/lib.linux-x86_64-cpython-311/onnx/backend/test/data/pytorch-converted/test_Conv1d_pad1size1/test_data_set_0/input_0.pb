@@ -0,0 +1 @@
+J˗?B̟
\ No newline at end of file
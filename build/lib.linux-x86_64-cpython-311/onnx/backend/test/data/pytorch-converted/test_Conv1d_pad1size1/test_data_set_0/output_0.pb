@@ -0,0 +1 @@
+J7IȾ\e=
\ No newline at end of file
@@ -0,0 +1,4 @@
+
+J(v=ZWn:
+\>+m>|1t)w)1;߿w>?rپ))?ŧ^?}"ʿiÔG?e?;j?¾*?슾x^?5
+bξ[>2[??!&?&vj*?8~?W???\?Qn>\n<f뾊q5??Ͼ&Ew2=~ӾwǿF??Տ=OL>5>R{?/}85t?g=T6?ZαEג;v>J>Ǿ$>b?!
\ No newline at end of file
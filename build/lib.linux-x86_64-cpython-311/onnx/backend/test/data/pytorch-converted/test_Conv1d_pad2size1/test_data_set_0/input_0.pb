@@ -0,0 +1 @@
+Jv7Z>?
\ No newline at end of file
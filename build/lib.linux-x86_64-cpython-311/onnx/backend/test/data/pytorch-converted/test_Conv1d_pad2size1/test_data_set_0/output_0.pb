@@ -0,0 +1 @@
+JVrAK>Xe@l]=
\ No newline at end of file
@@ -0,0 +1 @@
+JD>dgB45?,l=>}?2J?qp<Uyܺ1~?Hvi`ӾRAT)t">tN?"d>et?>(^>hPb=Pn?f64>.?]+\HR$䁼060hD
\ No newline at end of file
@@ -0,0 +1 @@
+J4~ll=`H=X<r齋t>0Q<<	Y?>:=^r=|;><~!~>6	G&>o޷>?ʳ彘$<(P=>#>z2#
\ No newline at end of file
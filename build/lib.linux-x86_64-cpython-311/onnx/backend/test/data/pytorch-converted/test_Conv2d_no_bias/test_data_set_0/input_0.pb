@@ -0,0 +1,2 @@
+J1{eI(?2?ɂRd`>S#E?>)s>)>쀿CI&	W@|?kLA@>1ֿSĐ>k?d&
+#?:wףDRN_{<,7?u7?mW?X+?5N^?ͪ?	@_H?Y>3<?'?:Uսx?\?A۹857>?Jm\?w֍I̿?I>2|?>l䏿?Őr=2VF>>)@忰?	?ӛ8?'p?uԍ>Ph=wcD%J̿5IU=(d>B/>)sB>;1ɿLۿA1?p>}?>+	@7>>>@V?_۴$?@ΔȞ?Vyk\<$2fھ+>·?a>Q@X;Z?5>UR>Q)QJ?K>>{?uן:=0ZN]>?O>iC>7=	|?8󾪾6?T1?:M;>X>?ӾBϿ>F1)ÿY?쾻??{?a?GEQ=c>0?nX@?J=UIY?4q:M>ɒ>?tԿΞK?qt׿?
\ No newline at end of file
@@ -0,0 +1,3 @@
+J.g?Λd?d>b?#?Z羾o㺾@>rL>?Q>j
+`p8NI:1?|>W?{=~?X+?@;X
+t?\j?J|>Y
\ No newline at end of file
@@ -0,0 +1 @@
+JglaI?Ѿd:?$7=r{vc?%j>Sƾ޾=5>J=r@'?W?t@?:>S?Ѿډ>PV>'C=jӹ?̂Ͼ#>2Ǿ^Yh]g?#0>o|hYF<>rL?l0{?jn?jI6?>ڿ>*ώ?.TqQ<?Y(??x>^!?={ɾ~h'\?
\ No newline at end of file
@@ -0,0 +1 @@
+Jev=&>S?wXt>`:AGs?)|-=@>|>?h>>0!d>U=G>j>*>zq;ҹT*]<a>e>֬>*y?=beK>d5	?QGҾG&l=0><4>⯖7>B=$ڽD<aY3>c?7/=C=s.>>X>q}>e>S{>?;׼q{=s>mY>=0üݺMe=p>=+'co%L߽(?6>Mо9>C>2==^fx>(W?J	>ٶ1>&D)=HQ+7pl>Kv)=龬YfB>>iDH>>G>h镽/=ft+M=}#?Đ(_R>g>H~?ľ@ϽK%Z>`=X#Vf=E>3!?Ngc=1j?.>
\ No newline at end of file
@@ -0,0 +1,2 @@
+Jy=Ij=
+?q=3>M⾂k>H=.?uľV+>=ݾr>U>}vv:>5>!?1;=?.p~b|5Kp?9>N}8#?>I>)Ⱦ⏁<~ƽNH?)M=UF<{׼0?;S?D=P]?n=>)|H7B:W@?]Gz?cp^>h/ľ
\ No newline at end of file
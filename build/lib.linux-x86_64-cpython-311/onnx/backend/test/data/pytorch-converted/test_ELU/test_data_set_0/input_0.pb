@@ -0,0 +1 @@
+JxUÑ?.>u?? ?(t?7[	˿!>v\m?ќ>xHx<lXB>D!5F~荾`?xU?u֎
\ No newline at end of file
@@ -0,0 +1 @@
+JxUÑ?.>u?? ?(t?˿!>r	&ȯm?ќ>vڿ#YܾCBFB>bw, D\yJwBR?xU?
\ No newline at end of file
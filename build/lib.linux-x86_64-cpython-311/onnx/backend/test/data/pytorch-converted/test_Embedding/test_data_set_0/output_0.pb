@@ -0,0 +1 @@
+J0>OǾ?4B?>>OǾ?4B?>
\ No newline at end of file
@@ -0,0 +1 @@
+J0"K忌?E7?+;"K忌?E7?+;
\ No newline at end of file
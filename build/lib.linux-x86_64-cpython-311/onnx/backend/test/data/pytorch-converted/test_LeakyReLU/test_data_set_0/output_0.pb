@@ -0,0 +1 @@
+JxR(>eF|)<M>l^M??y?J!?f?tdKQ?]0?Y?>J?K,;ə.E^?}ki>Ӥ?o<
\ No newline at end of file
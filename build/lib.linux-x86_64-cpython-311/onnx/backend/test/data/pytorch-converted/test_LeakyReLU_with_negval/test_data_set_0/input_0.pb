@@ -0,0 +1,2 @@
+Jx;EȿM"V; >?
+t sv?Dɒ?59>=G?M1T?!e??X=dSZ?w>?B?󳿺uDw>T:>mx? Q?'?ž!~&=q
\ No newline at end of file
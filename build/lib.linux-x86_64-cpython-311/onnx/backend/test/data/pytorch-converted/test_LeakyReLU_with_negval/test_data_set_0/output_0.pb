@@ -0,0 +1,2 @@
+Jx;EHMx"V;>?
+tsv?Dɒ?59>=G?M1T?!e??X=dӾZ?w>?B?3uaDw>T:>mx? Q?'?E!~=q
\ No newline at end of file
@@ -0,0 +1,3 @@
+
+JP8?@=J>`?z?a?|B[=db˽I0?DBGJ>KϿ>,?D=?ǰԾ<?u"C@tÑ?>U=R?b3?
+U,`>}?/)+?{o?CU>>ނ
\ No newline at end of file
@@ -0,0 +1,3 @@
+
+JPvjF>xa
+?>?P?M*?	;@̀?P+@L?!?>vxt?,?<Rb?>v>??
\ No newline at end of file
@@ -0,0 +1,4 @@
+
+J>@?SЃ?dm)!??2C;}
+	޾!>Rn=$tnS?0?2n>?yXW>IB?lN5>??)7U%5=/>4	=ZWپ]ME<gl?
+e}@оY*=Ȑ`ߗ/Zj?q>#~9?՛@.|?E>~O3\лq<>ǫ>9bKFM?+}?$>t5?.dN"@~$=n?b@5jɿ;}4\_@Q
\ No newline at end of file
@@ -0,0 +1,2 @@
+
+JP>@?)!?!>0?IB??U%5=/>gl?}@j?#~9?|?E>q<>M??N"@b@4_@
\ No newline at end of file
@@ -0,0 +1,154 @@
+Jo?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?o?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?*?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?./?u{?u{?u{?u{?u{?u{?u{?u{?u{?u{?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?J?V~?V~?V~?V~?V~?V~?V~?V~?V~?V~?V~?V~?V~???????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?"{?
+{?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?t?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?hy?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?.?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?r(~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?ݐ~?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?Iz?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????O?O?O?O?O?O?O?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?Nh?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?c?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?x{?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z?>z? _}? _}? _}? _}? _}? _}? _}? _}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?A}?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?Of?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?-}?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?\ ?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?x?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?~}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?.)}?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?{~?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?݆?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?6}?6}?6}?6}?6}?6}?6}?6}?6}?6}?6}?6}?6}?6}?6}?6}?6}?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?,~?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?Z?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?|~?~?~?~?~?~?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}? }? }? }? }? }? }? }? }? }? }?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?P'?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?R|?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz?dPz????????????????????????????????????????????????????????????????????????????????w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?w?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?0?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?N~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?U~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?Ӂ~?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????d|?d|?d|?d|?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?/}?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?e-?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?VC?VC?VC?VC?VC?VC?VC?VC?VC?VC?VC?VC?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?:~?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?3}?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?>q?'?'?'?'?'?'?'?'?'?'?'?'?'?'?'?'?'?'?'?'?'?'?'?'?}~?}~?}~?}~?}~?}~?}~?}~?}~?}~?}~?}~?}~?}~?}~?}~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?U}?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?r|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?Y|?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?;?}?}?}?}?}?}?}?}?}?}?}?}?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?&?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?:?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?r?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?6J~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?3~?v}?v}?v}?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?1Z?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?E
+~?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?{?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????k?k?k?k?k?k?k?k?k?k?k?k?k?k?k?k?k?k?k?k?k?k?k?k?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?WZ?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?U?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?~?~?~?~?~?~?~?~?~?~?~?~?~?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?-?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????s~?s~?s~?s~?s~?s~?s~?s~?s~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?f~?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?چ?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?1?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?6i?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?G?|?|?|?|?|?|?|?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1F|?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?1}?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?y{?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?c~?Y|?Y|?Y|?Y|?Y|?Y|?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?J~?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?x}?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?Ǹ{?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?L:?X|?X|?X|?X|?X|?X|?X|?X|?X|?X|?X|?X|?X|?}?}?}?}?}?}?}?}?}?}?}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?I}?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?R~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?o4?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?#?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?
+y?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?|?{?{?{?{?{?{?{?{?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????c?c?c?c?c?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]?]? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ? ?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?q?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?]}?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?6?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?v?O}?O}?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?D?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?;z?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?}|?~?~?~?~?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?T?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?M}?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~?$~??????????????????????????????????????????????????????????????Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?Lp?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?K?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?w{?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z?̺z??????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????s~?s~?s~?s~?s~?s~?s~?s~?s~?s~?s~?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?D|?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?L~?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?n{?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?!?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~???????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?F?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?M~?}?}?}?}?}?}?}?}?}?}?}?}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?c}?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?}?{?{?{?{?{?1z?1z?1z?1z?1z?1z?1z?1z?1z?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?}?}?}?}?}?}?}?}?}?}?}?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?9~?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?Q?????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?~?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?f?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?D~?
\ No newline at end of file
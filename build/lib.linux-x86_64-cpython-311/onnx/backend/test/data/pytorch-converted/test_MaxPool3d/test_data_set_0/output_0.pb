@@ -0,0 +1 @@
+J?@@ն?6?r?,2?ov??銐?<$?sh?}o?M}?j?Ņ?q?m??B?r`@jG@D?/??^a?gѡ??]?t?-4@0?H@>?R@Y@	@7b??;??۲?k?}F?i@?с??	@
\ No newline at end of file
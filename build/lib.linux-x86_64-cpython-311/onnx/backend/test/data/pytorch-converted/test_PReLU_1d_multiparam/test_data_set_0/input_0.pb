@@ -0,0 +1,2 @@
+J`0m|0]i=H?q>i<ݿ޿i>?`=X1u~!>	־
+>$p@f>/5~?(
\ No newline at end of file
@@ -0,0 +1,3 @@
+JoU,?npEtk>$7M(ÿi+?.S?3'?S?d(?Z<@׾EpKdB9?Yd=큺lǾ6
+fE@Mbo`־`?ٿ(lJ>_>X,?]5_8N4@,w=,?h&b
+@Yp1˅[07rҼ^S2>28?G1Ee@(^p?K>YȾ(^j	@EV?%(.^k-?69?8?3>^=?HOKst7b;F>Zs;?_Pfbf?1R>>:߭z?_mp=QxlF`,C?AO?!̨?]?ɜ,h폾G>U1?Yo=h"@tL?9?OP?]?b=(L>)Ӎ>+][}
\ No newline at end of file
@@ -0,0 +1,3 @@
+JoU,?npEtk>$7M(þi+?.S?3'?S?d(?Z<@׽EpKdB9?Yd=큺lǽ6
+fE@Mbo`ֽ`?پ(lJ>_>X,?]5_8N4@,w=,?h&b
+@Yp1˅[07rһ^S2>28?G1Ee@(^p?K>YȽ(^j	@EV?%(.^k-?69?8?3>^=?HOKst7b;F>Zs;?_Pfbf?1R>>:߭z?_mp=QxlF`,C?AO?!̨?]?ɜ,h폽G>U1?Yo=h"@tL?9?OP?]?b=(L>)Ӎ>+][}
\ No newline at end of file
@@ -0,0 +1,3 @@
+J????;Y;S3?>?`ǡsK{5!)H-R??־̯>ʹ?7?xe$>ؾ錿gi?8>I5?Y<5Q?[
+*,@M#?̾ɔ?w"WkFe>2UQ?Jv	2?f%?׺i㗾$i澍ň>ž?_	!><p?'½v?Qo>I>J )_?5owT@I>,ܴ>?㾨ҿ8SȿI?-s]ʾ	<>V&e?#[ݾ,@@X?>?la>Qٿ3?Jk>dpÿ^f?Wo?`;ƾK	@'@f>|?n᫾¿-131@8]?ޚ>?2>)^aѾB?4ʦ/
+@
\ No newline at end of file
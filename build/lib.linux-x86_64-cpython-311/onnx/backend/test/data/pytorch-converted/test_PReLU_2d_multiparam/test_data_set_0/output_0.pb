@@ -0,0 +1,3 @@
+J????;Y;S3?>?`ǡsK{5!)H-R??ֽ̯>ʹ?7?xe$>ؽ錾gi?8>I5?Y<5Q?[
+*,@M#?̽ɔ?w"WkFe>2UQ?Jv	2?f%?׹i㗽$i潍ň>Ž?_	!><p?'¼v?Qo>I>J )_?5owT@I>,ܴ>?㽨Ҿ8SȾI?-s]ʽ	<>V&e?#[ݽ,@@X?>?la>Qپ3?Jk>dpþ^f?Wo?`;ƽK	@'@f>|?n᫽¾-131@8]?ޚ>?2>)^aѽB?4ʦ/
+@
\ No newline at end of file
@@ -0,0 +1 @@
+JxPO1?`>{Y{?	:>Ձy>>kR9E?j^?w>?ٜJ]k? ?h?Q䛿)>?hBV	@6拿W-KLa>	?X`>G1y
\ No newline at end of file
@@ -0,0 +1,4 @@
+J'?M?>E>9?i=>7>?,?g;?[?->T`>>F??Pi>SC?4>"?8??GC>+?&;?
+/?>$(>=>C?74?>3>d?w>](Z?xM?)6>vVD?1>Ĥ>.q>Z>7>']?~.>WG?>A7?Q>X,>h;?s#9?y	?$>3%H?V?hb?}?7?0?{:?>
+?\>׈>#7J=E9?m>M?>}3?آ>7?@>?	?4z>#">z>R0?<]I?CI>Z>˲?>\?B>G">b?ad>K>K>7?$>?>%?=,?
+?(?>5>?(?*?#?+?a?(>{?F>>q	=>;=>?/"?#1?
\ No newline at end of file
@@ -0,0 +1,2 @@
+Jxe=>G?*I=	2u$>ce,>H?uRN?J?	܅u4>%t<U7ySLC>?$V<
+?!+??<>:`>%?
\ No newline at end of file
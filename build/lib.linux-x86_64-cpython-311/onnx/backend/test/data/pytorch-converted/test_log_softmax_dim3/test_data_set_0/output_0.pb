@@ -0,0 +1,3 @@
+J]<鿂i
+8VFꕿ>⸿Z1߿cW[_'ۀJ0!vM;i_#vS#OҿPޡxAT/t4ƿ5 s\=@FHeYT|߿@οk-剿yt]4Eac7
+ƿCjm^i0eLz-GY6I -;M|׹PbA!i,{3V߿Y8/ F(WgϿnaaWC8Nvȿ@ضYNL翍+e@!^b	]Ŀ5BLEZ$10a>5eY"$qD& 3hR	kbX&
\ No newline at end of file
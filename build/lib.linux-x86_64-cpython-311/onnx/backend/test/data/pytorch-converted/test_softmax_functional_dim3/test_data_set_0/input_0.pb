@@ -0,0 +1,4 @@
+J/?u>:*$@σ?<U?@aҿ#ܾ✽X?}>?`V~^?'0>d@}zZ\,Y?N~ؿd?Ͼfr?/f{ˠm3h?TœglpEIr;M?fl?ݞ>:u$@$+"꿼Tӿު)?H=o=x>J}*?}Ć>V
+^윋jq='п6XQ>_z2?{˿?&ta?Fﾥ%XH>?^ⶾ;
+t9W?ԨN!/?EK5j>0տ3߿?:D?35K??K`͠ts弢R/>u>G?k8k>BO
+V'>Jߜ=H0h?f?gC?JM?q/ڼJL'mwW??>n4
\ No newline at end of file
@@ -0,0 +1 @@
+J0l>m1?󡈾k@\-=뜄6uo&܄b?ܫKD?
\ No newline at end of file
@@ -0,0 +1 @@
+JA!sBPM_?
\ No newline at end of file
@@ -0,0 +1,2 @@
+J 
+>qXA03>fO+`{=~$ɾJ@
\ No newline at end of file
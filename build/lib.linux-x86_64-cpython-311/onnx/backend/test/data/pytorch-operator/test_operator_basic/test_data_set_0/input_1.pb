@@ -0,0 +1 @@
+J333?
\ No newline at end of file
@@ -0,0 +1 @@
+J%
\ No newline at end of file
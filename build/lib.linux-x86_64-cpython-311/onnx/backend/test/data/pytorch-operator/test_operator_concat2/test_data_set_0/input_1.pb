@@ -0,0 +1 @@
+Jl>m1?󡈾k@\-=뜄
\ No newline at end of file
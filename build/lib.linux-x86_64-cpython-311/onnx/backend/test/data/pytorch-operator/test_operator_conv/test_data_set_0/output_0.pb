@@ -0,0 +1 @@
+0&Js[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?[I?R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=R=ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>ʡ>{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?{7?>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<ܩ<θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>θ>????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????????jGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGjGؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿؿTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTTT%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>%.8>
\ No newline at end of file
@@ -0,0 +1,3 @@
+J0?i?1>z?1
+??A?l?&
+D?RAÍ?E?
\ No newline at end of file
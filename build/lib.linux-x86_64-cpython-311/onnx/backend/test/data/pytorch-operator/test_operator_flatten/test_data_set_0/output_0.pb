@@ -0,0 +1 @@
+J`A&>Jas\=+?[t[ﾵ#?6ңhYx?w?vL?ܿ!	(?ѱ-]}{8>,\ξK>
\ No newline at end of file
@@ -0,0 +1 @@
+J0L<=>&܄b?ܫKD?l>m1?Pk@\-=CE"?
\ No newline at end of file
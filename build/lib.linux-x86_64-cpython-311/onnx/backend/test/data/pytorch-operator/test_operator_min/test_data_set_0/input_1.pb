@@ -0,0 +1 @@
+J06uo&܄b?ܫKD?A!sBPM_?~.CE"?
\ No newline at end of file
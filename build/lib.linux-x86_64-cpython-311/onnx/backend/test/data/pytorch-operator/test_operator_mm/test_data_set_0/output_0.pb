@@ -0,0 +1 @@
+J =>wA>FĈ4f!A?~3?
\ No newline at end of file
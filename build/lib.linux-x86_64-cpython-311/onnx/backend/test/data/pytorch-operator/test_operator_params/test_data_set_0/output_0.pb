@@ -0,0 +1 @@
+JPS9&;&;&;
\ No newline at end of file
@@ -0,0 +1 @@
+J`oFD?"<3<?>#e?tl?l?:>>*>W>K?=˨p_?WD?!齚\qA?
\ No newline at end of file
@@ -0,0 +1 @@
+J E>94w"->ٍ>|=
\ No newline at end of file
@@ -0,0 +1,3 @@
+J ??
+*zR@b
+?TZ?g>
\ No newline at end of file
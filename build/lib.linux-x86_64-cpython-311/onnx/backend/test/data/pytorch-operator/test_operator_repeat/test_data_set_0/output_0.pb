@@ -0,0 +1 @@
+	JA&>JaA&>JaA&>JaA&>Jas\=+?[t[s\=+?[t[s\=+?[t[s\=+?[t[ﾵ#?6ңh#?6ңh#?6ңh#?6ңhA&>JaA&>JaA&>JaA&>Jas\=+?[t[s\=+?[t[s\=+?[t[s\=+?[t[ﾵ#?6ңh#?6ңh#?6ңh#?6ңhA&>JaA&>JaA&>JaA&>Jas\=+?[t[s\=+?[t[s\=+?[t[s\=+?[t[ﾵ#?6ңh#?6ңh#?6ңh#?6ңhYx?w?vL?Yx?w?vL?Yx?w?vL?Yx?w?vL?ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}{8>,\ξK>{8>,\ξK>{8>,\ξK>{8>,\ξK>Yx?w?vL?Yx?w?vL?Yx?w?vL?Yx?w?vL?ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}{8>,\ξK>{8>,\ξK>{8>,\ξK>{8>,\ξK>Yx?w?vL?Yx?w?vL?Yx?w?vL?Yx?w?vL?ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}{8>,\ξK>{8>,\ξK>{8>,\ξK>{8>,\ξK>A&>JaA&>JaA&>JaA&>Jas\=+?[t[s\=+?[t[s\=+?[t[s\=+?[t[ﾵ#?6ңh#?6ңh#?6ңh#?6ңhA&>JaA&>JaA&>JaA&>Jas\=+?[t[s\=+?[t[s\=+?[t[s\=+?[t[ﾵ#?6ңh#?6ңh#?6ңh#?6ңhA&>JaA&>JaA&>JaA&>Jas\=+?[t[s\=+?[t[s\=+?[t[s\=+?[t[ﾵ#?6ңh#?6ңh#?6ңh#?6ңhYx?w?vL?Yx?w?vL?Yx?w?vL?Yx?w?vL?ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}{8>,\ξK>{8>,\ξK>{8>,\ξK>{8>,\ξK>Yx?w?vL?Yx?w?vL?Yx?w?vL?Yx?w?vL?ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}{8>,\ξK>{8>,\ξK>{8>,\ξK>{8>,\ξK>Yx?w?vL?Yx?w?vL?Yx?w?vL?Yx?w?vL?ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}ܿ!	(?ѱ-]}{8>,\ξK>{8>,\ξK>{8>,\ξK>{8>,\ξK>
\ No newline at end of file
@@ -0,0 +1 @@
+JL<=>
\ No newline at end of file
@@ -0,0 +1 @@
+JL<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>L<=>
\ No newline at end of file
@@ -0,0 +1 @@
+J`eL>\(03t/>Mڃg=_3?Jнb(Q+?̲eڔ??!(5?yV?Ͽ/?RpВ߉>LLA>
\ No newline at end of file
@@ -0,0 +1 @@
+BXJ_V?3`?KnkI?cۮo?)?[!*?Yam?:g?63IS?BKN?(?U?"	?-6k-?%X|?Jk/?ҽN?"!?{ _Ҥ??'z#?iP?!4?)?2,R?
\ No newline at end of file
@@ -0,0 +1 @@
+BoutJ`-6k-?%X|?Jk/?ҽN?"!?{ _Ҥ??'z#?iP?!4?)?2,R?
\ No newline at end of file
@@ -0,0 +1 @@
+BxJx?h>
\ No newline at end of file
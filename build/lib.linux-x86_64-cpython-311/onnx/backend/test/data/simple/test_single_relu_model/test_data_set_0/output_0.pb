@@ -0,0 +1 @@
+ByJx?h>
\ No newline at end of file
@@ -0,0 +1 @@
+2monday2tuesday2	wednesday2thursdayBx
\ No newline at end of file
@@ -0,0 +1 @@
+2TUESDAY2	WEDNESDAY2THURSDAYBy
\ No newline at end of file
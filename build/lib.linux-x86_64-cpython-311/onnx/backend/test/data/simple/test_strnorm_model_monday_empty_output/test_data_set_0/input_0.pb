@@ -0,0 +1 @@
+2monday2mondayBx
\ No newline at end of file
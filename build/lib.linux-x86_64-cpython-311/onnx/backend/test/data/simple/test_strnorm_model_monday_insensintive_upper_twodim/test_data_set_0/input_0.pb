@@ -0,0 +1 @@
+2Monday2tuesday2	wednesday2Monday2tuesday2	wednesdayBx
\ No newline at end of file
@@ -0,0 +1 @@
+2monday2tuesdayBx
\ No newline at end of file
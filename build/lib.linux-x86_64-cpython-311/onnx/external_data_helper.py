@@ -0,0 +1,685 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import asyncio
+import functools
+import hashlib
+import uuid
+import os
+import re
+import sys
+import threading
+import zlib
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, List, Text, Optional, Tuple, cast
+
+from .onnx_pb import TensorProto, ModelProto
+
+# Neighbouring tensors separated by at most this many bytes are fetched with one read
+_MAX_READ_GAP = 1 << 16
+# Upper bound of a single coalesced read, so large files are still read in parallel
+_MAX_READ_SIZE = 1 << 26
+# Buffer size used when writing external data files
+_WRITE_BUFFER_SIZE = 1 << 20
+# Default size of the independently compressed chunks of compressed external data
+_COMPRESSION_CHUNK_SIZE = 1 << 22
+
+
+class ExternalDataInfo(object):
+
+    def __init__(self, tensor):  # type: (TensorProto) -> None
+        self.location = ''
+        self.offset = None
+        self.length = None
+        self.checksum = None
+        self.basepath = ''
+        self.compression = None
+        self.chunk_size = None
+        self.chunks = None
+
+        for entry in tensor.external_data:
+            setattr(self, entry.key, entry.value)
+
+        if self.offset:
+            self.offset = int(self.offset)
+
+        if self.length:
+            self.length = int(self.length)
+
+        if self.chunk_size:
+            self.chunk_size = int(self.chunk_size)
+
+        if self.chunks:
+            self.chunks = [int(size) for size in self.chunks.split(',')]
+
+
+def load_external_data_for_tensor(tensor, base_dir):  # type: (TensorProto, Text) -> None
+    """
+    Load data from an external file for tensor.
+    Ideally TensorProto should not hold any raw data but if it does it will be ignored.
+    @params
+    tensor: a TensorProto object.
+    base_dir: directory that contains the external data.
+    """
+    tensor.raw_data = _read_external_data(tensor, base_dir)
+
+
+def _read_external_data(tensor, base_dir):  # type: (TensorProto, Text) -> bytes
+    info = ExternalDataInfo(tensor)
+    external_data_file_path = get_external_data_file_path(tensor, base_dir)
+
+    with open(external_data_file_path, 'rb') as data_file:
+
+        if info.offset:
+            data_file.seek(info.offset)
+
+        if info.length:
+            data = data_file.read(info.length)
+        else:
+            data = data_file.read()
+
+    if not info.compression:
+        return data
+    with ThreadPoolExecutor() as executor:
+        return _decompress(data, info.compression, cast(List[int], info.chunks), executor)
+
+
+def load_external_data_range(tensor, base_dir, start, end):  # type: (TensorProto, Text, int, int) -> bytes
+    """
+    Load bytes [start, end) of the data of an external tensor without reading the rest of it.
+    For compressed external data only the chunks overlapping the range are read and decompressed.
+    @params
+    tensor: a TensorProto object using external data.
+    base_dir: directory that contains the external data.
+    start, end: byte range within the (uncompressed) tensor data.
+    """
+    info = ExternalDataInfo(tensor)
+    offset = info.offset or 0
+    with open(get_external_data_file_path(tensor, base_dir), 'rb') as data_file:
+        if not info.compression:
+            if info.length:
+                end = min(end, info.length)
+            data_file.seek(offset + start)
+            return data_file.read(max(end - start, 0))
+
+        chunk_size = cast(int, info.chunk_size)
+        chunks = cast(List[int], info.chunks)
+        first = start // chunk_size
+        last = min((end - 1) // chunk_size, len(chunks) - 1)
+        if end <= start or first > last:
+            return b''
+        data_file.seek(offset + sum(chunks[:first]))
+        data = data_file.read(sum(chunks[first:last + 1]))
+
+    with ThreadPoolExecutor() as executor:
+        data = _decompress(data, info.compression, chunks[first:last + 1], executor)
+    skip = start - first * chunk_size
+    return data[skip:skip + end - start]
+
+
+def _get_codec(compression):  # type: (Text) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]
+    """Return the compress and decompress functions of a compression of external data."""
+    if compression == 'zlib':
+        return zlib.compress, zlib.decompress
+    if compression == 'lzma':
+        import lzma
+        return lzma.compress, lzma.decompress
+    raise ValueError("Unsupported compression of external data: " + compression)
+
+
+def _compress(data, compression, chunk_size, executor):  # type: (bytes, Text, int, ThreadPoolExecutor) -> Tuple[bytes, List[int]]
+    """
+    Compress data in independent chunks of chunk_size bytes.
+    Returns the compressed data and the size of each compressed chunk.
+    """
+    compress = _get_codec(compression)[0]
+    view = memoryview(data)
+    chunks = list(executor.map(compress, [view[i:i + chunk_size] for i in range(0, max(len(data), 1), chunk_size)]))
+    return b''.join(chunks), [len(chunk) for chunk in chunks]
+
+
+def _decompress(data, compression, chunk_sizes, executor):  # type: (bytes, Text, List[int], ThreadPoolExecutor) -> bytes
+    """Decompress the concatenated chunks of compressed data in parallel."""
+    decompress = _get_codec(compression)[1]
+    view = memoryview(data)
+    chunks = []
+    position = 0
+    for size in chunk_sizes:
+        chunks.append(view[position:position + size])
+        position += size
+    return b''.join(executor.map(decompress, chunks))
+
+
+class ExternalDataCache(object):
+    """
+    Loads external tensor data on first access and keeps the most recently used
+    payloads in memory, evicting the least recently used ones once more than
+    max_bytes are cached. Unlike load_external_data_for_tensor, the tensor itself
+    is left untouched, so a model can be inspected without holding all its weights.
+    """
+
+    def __init__(self, max_bytes=1 << 30):  # type: (int) -> None
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()  # type: OrderedDict[Tuple[Text, int, Optional[int]], bytes]
+        self._lock = threading.Lock()
+
+    def load(self, tensor, base_dir=''):  # type: (TensorProto, Text) -> bytes
+        """
+        Return the external data of tensor, reading it from disk on a cache miss.
+        @params
+        tensor: a TensorProto object using external data.
+        base_dir: directory that contains the external data.
+        """
+        info = ExternalDataInfo(tensor)
+        key = (os.path.abspath(get_external_data_file_path(tensor, base_dir)), info.offset or 0, info.length)
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                return data
+
+        data = _read_external_data(tensor, base_dir)
+        with self._lock:
+            if key not in self._entries and len(data) <= self.max_bytes:
+                self._entries[key] = data
+                self.size += len(data)
+                while self.size > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self.size -= len(evicted)
+        return data
+
+    def clear(self):  # type: () -> None
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+def load_external_data_for_model(model, base_dir, mmap=False, num_threads=None, verify=False):
+    # type: (ModelProto, Text, bool, Optional[int], bool) -> None
+    """
+    Loads external tensors into model
+
+    @params
+    model: ModelProto to load external data to
+    base_dir: directory that contains external data
+    mmap: If true, the data is not read. A ValueError is raised if the data of a tensor is compressed.
+          Tensors keep their external_data entries, so
+          numpy_helper.to_array(tensor, base_dir, mmap=True) can map the data files directly
+          instead of copying them into raw_data. Pass base_dir to save_model and
+          checker.check_model so that they find the data.
+    num_threads: Maximum number of threads reading data files concurrently.
+                 If not specified, the default of concurrent.futures.ThreadPoolExecutor is used.
+    verify: If true, the data of tensors with a recorded checksum is verified against it while
+            loading, and a ValueError is raised on mismatch. Ignored if mmap is true.
+    """
+    tensors = [tensor for tensor in _get_all_tensors(model) if uses_external_data(tensor)]
+    if mmap:
+        for tensor in tensors:
+            _check_mappable(tensor)
+        return
+    for i, data in _read_external_data_bulk(tensors, base_dir, num_threads, verify):
+        tensor = tensors[i]
+        tensor.raw_data = data
+        # After loading raw_data from external_data, change the state of tensors
+        tensor.data_location = TensorProto.DEFAULT
+        # and remove external data
+        del tensor.external_data[:]
+
+
+def _check_mappable(tensor):  # type: (TensorProto) -> None
+    if ExternalDataInfo(tensor).compression:
+        raise ValueError(
+            "External data of tensor {} is compressed and cannot be memory-mapped. "
+            "Load the model without mmap=True.".format(tensor.name))
+
+
+def _read_external_data_bulk(tensors, base_dir, num_threads=None, verify=False):
+    # type: (List[TensorProto], Text, Optional[int], bool) -> Iterator[Tuple[int, bytes]]
+    """
+    Read the external data of all tensors with the reads _external_data_reads plans, on a thread pool.
+    Compressed data is decompressed chunk by chunk on the same thread pool.
+    Yields (index in tensors, data) as soon as the read holding the data of a tensor finishes,
+    and holds no reference to the data afterwards, so only the reads in flight are kept in memory.
+    """
+    infos = [ExternalDataInfo(tensor) for tensor in tensors]
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        futures = [executor.submit(read) for read in _external_data_reads(tensors, base_dir, verify)]
+        for future in as_completed(futures):
+            # The future keeps its result: empty the chunk so the data is freed once consumed.
+            chunk = future.result()
+            while chunk:
+                i, data = chunk.pop()
+                if infos[i].compression:
+                    data = _decompress(data, infos[i].compression, cast(List[int], infos[i].chunks), executor)
+                yield i, data
+                del data
+
+
+def _external_data_reads(tensors, base_dir, verify=False):
+    # type: (List[TensorProto], Text, bool) -> List[Callable[[], List[Tuple[int, bytes]]]]
+    """
+    Plan the reads of the external data of all tensors. Ranges are grouped by file and sorted by offset,
+    and nearby ranges are merged into one sequential read. Each read returns (index in tensors, data)
+    for the tensors it covers, with compressed data left compressed.
+    If verify is true, each read checks the recorded checksums of the data it returns.
+    """
+    ranges = defaultdict(list)  # type: Dict[Text, List[Tuple[int, int, int]]]
+    infos = [ExternalDataInfo(tensor) for tensor in tensors]
+    for (i, tensor) in enumerate(tensors):
+        info = infos[i]
+        path = os.path.abspath(get_external_data_file_path(tensor, base_dir))
+        offset = info.offset or 0
+        length = info.length or max(os.path.getsize(path) - offset, 0)
+        ranges[path].append((offset, offset + length, i))
+
+    reads = []  # type: List[Tuple[Text, int, int, List[Tuple[int, int, int]]]]
+    for path, file_ranges in ranges.items():
+        file_ranges.sort()
+        run = [file_ranges[0]]
+        start, end = file_ranges[0][0], file_ranges[0][1]
+        for r in file_ranges[1:]:
+            if r[0] <= end + _MAX_READ_GAP and max(end, r[1]) - start <= _MAX_READ_SIZE:
+                run.append(r)
+                end = max(end, r[1])
+            else:
+                reads.append((path, start, end, run))
+                run = [r]
+                start, end = r[0], r[1]
+        reads.append((path, start, end, run))
+
+    def read(path, start, end, run):  # type: (Text, int, int, List[Tuple[int, int, int]]) -> List[Tuple[int, bytes]]
+        with open(path, 'rb') as data_file:
+            data_file.seek(start)
+            buffer = data_file.read(end - start)
+        if len(run) == 1 and run[0][1] - run[0][0] == len(buffer):
+            chunk = [(run[0][2], buffer)]
+        else:
+            chunk = [(i, buffer[r_start - start:r_end - start]) for (r_start, r_end, i) in run]
+        if verify:
+            for (i, data) in chunk:
+                if infos[i].checksum is not None and _checksum(data) != infos[i].checksum:
+                    raise ValueError("Checksum of the external data of tensor " + tensors[i].name + " does not match.")
+        return chunk
+
+    return [functools.partial(read, *args) for args in reads]
+
+
+async def _load_external_data_for_model_async(model, base_dir, executor=None):
+    # type: (ModelProto, Text, Optional[Executor]) -> None
+    """
+    Coroutine version of load_external_data_for_model. The reads are planned on executor as soon as
+    the model is parsed, then all of them are started on executor and awaited together. Each read
+    also decompresses its data and assigns it to its tensors, so the event loop is never blocked.
+    """
+    tensors = [tensor for tensor in _get_all_tensors(model) if uses_external_data(tensor)]
+    infos = [ExternalDataInfo(tensor) for tensor in tensors]
+
+    def load(read):  # type: (Callable[[], List[Tuple[int, bytes]]]) -> None
+        for (i, data) in read():
+            if infos[i].compression:
+                with ThreadPoolExecutor() as pool:
+                    data = _decompress(data, infos[i].compression, cast(List[int], infos[i].chunks), pool)
+            tensor = tensors[i]
+            tensor.raw_data = data
+            tensor.data_location = TensorProto.DEFAULT
+            del tensor.external_data[:]
+
+    loop = asyncio.get_event_loop()
+    reads = await loop.run_in_executor(executor, _external_data_reads, tensors, base_dir)
+    await asyncio.gather(*[loop.run_in_executor(executor, load, read) for read in reads])
+
+
+def _checksum(data):  # type: (bytes) -> Text
+    """Checksum recorded in external_data: the SHA1 digest of the tensor's data."""
+    return hashlib.sha1(data).hexdigest()
+
+
+def get_external_data_file_path(tensor, base_dir):  # type: (TensorProto, Text) -> Text
+    """
+    Return the path of the file holding the external data of tensor.
+    """
+    info = ExternalDataInfo(tensor)
+    return os.path.join(base_dir, _sanitize_path(info.location))
+
+
+def set_external_data(tensor,  # type: TensorProto
+                      location,  # type: Text
+                      offset=None,  # type: Optional[int]
+                      length=None,  # type: Optional[int]
+                      checksum=None,  # type: Optional[Text]
+                      basepath=None  # type: Optional[Text]
+                      ):  # type: (...) -> None
+    if not tensor.HasField("raw_data"):
+        raise ValueError("Tensor " + tensor.name + "does not have raw_data field. Cannot set external data for this tensor.")
+
+    del tensor.external_data[:]
+    tensor.data_location = TensorProto.EXTERNAL
+    for (k, v) in {
+        'location': location,
+        'offset': int(offset) if offset is not None else None,
+        'length': int(length) if length is not None else None,
+        'checksum': checksum,
+        'basepath': basepath
+    }.items():
+        if v is not None:
+            entry = tensor.external_data.add()
+            entry.key = k
+            entry.value = str(v)
+
+
+def convert_model_to_external_data(model, all_tensors_to_one_file=True, location=None, size_threshold=1024, convert_attribute=False,
+                                   max_shard_size=None):
+    # type: (ModelProto, bool, Optional[Text], int, bool, Optional[int]) -> None
+    """
+    Call to set all tensors with raw data as external data. This call should preceed 'save_model'.
+    'save_model' saves all the tensors data as external data after calling this function.
+    @params
+    model: ModelProto to be converted.
+    all_tensors_to_one_file: If true, save all tensors to one external file specified by location.
+                             If false, save each tensor to a file named with the tensor name.
+    location: specify the external file that all tensors to save to.
+              If not specified, will use the model name.
+    size_threshold: Threshold for size of data. Only when tensor's data is >= the size_threshold
+    it will be converted to external data. To convert every tensor with raw data to external data set size_threshold=0.
+    convert_attribute: If true, convert all tensors to external data
+                       If false, convert only non-attribute tensors to external data
+    max_shard_size: Only used with all_tensors_to_one_file. If set, tensors are packed in order into
+                    shard files holding at most max_shard_size bytes of tensor data each (a larger tensor
+                    gets a shard of its own). Shard i of n is named '<location>-<i>-of-<n>', e.g.
+                    'weights.bin-00001-of-00004'. save_model writes and load_model reads shards in parallel.
+
+    The data can also be compressed, with the compression argument of save_model or
+    write_external_data_tensors. Compressed data is recorded with the non-standard external_data
+    keys 'compression', 'chunk_size' and 'chunks', and can only be read by the loaders of this
+    package (load_model, load_external_data_for_model, load_external_data_range). Other ONNX
+    runtimes ignore these keys and misread the data, and it cannot be loaded with mmap=True.
+    """
+    tensors = _get_initializer_tensors(model)
+    if convert_attribute:
+        tensors = _get_all_tensors(model)
+
+    if all_tensors_to_one_file:
+        file_name = Text(uuid.uuid1())
+        if location:
+            file_name = location
+        tensors = [tensor for tensor in tensors
+                   if tensor.HasField("raw_data") and sys.getsizeof(tensor.raw_data) >= size_threshold]
+        if max_shard_size:
+            shards = []  # type: List[List[TensorProto]]
+            shard_size = 0
+            for tensor in tensors:
+                if not shards or (shards[-1] and shard_size + len(tensor.raw_data) > max_shard_size):
+                    shards.append([])
+                    shard_size = 0
+                shards[-1].append(tensor)
+                shard_size += len(tensor.raw_data)
+            for (i, shard) in enumerate(shards):
+                shard_name = '{}-{:05d}-of-{:05d}'.format(file_name, i + 1, len(shards))
+                for tensor in shard:
+                    set_external_data(tensor, shard_name)
+        else:
+            for tensor in tensors:
+                set_external_data(tensor, file_name)
+    else:
+        for tensor in tensors:
+            if tensor.HasField("raw_data") and sys.getsizeof(tensor.raw_data) >= size_threshold:
+                tensor_location = tensor.name
+                if not _is_valid_filename(tensor_location):
+                    tensor_location = Text(uuid.uuid1())
+                set_external_data(tensor, tensor_location)
+
+
+def convert_model_from_external_data(model):  # type: (ModelProto) -> None
+    """
+    Call to set all tensors which use external data as embedded data. save_model saves all the tensors data as embedded data after calling this function.
+    @params
+    model: ModelProto to be converted.
+    """
+    for tensor in _get_all_tensors(model):
+        if uses_external_data(tensor):
+            if not tensor.HasField("raw_data"):
+                raise ValueError("raw_data field doesn't exist.")
+            del tensor.external_data[:]
+            tensor.data_location = TensorProto.DEFAULT
+
+
+def save_external_data(tensor, base_path, align=None):  # type: (TensorProto, Text, Optional[int]) -> None
+    """
+    Write tensor data to an external file according to information in the `external_data` field.
+    The SHA1 checksum of the data is recorded along with its offset and length.
+
+    @params
+    tensor: Tensor object to be serialized
+    base_path: System path of a folder where tensor data is to be stored
+    align: If set and the tensor has no offset yet, the data is written at the next multiple of align bytes.
+    """
+    info = ExternalDataInfo(tensor)
+    external_data_file_path = os.path.join(base_path, info.location)
+
+    # Retrieve the tensor's data from raw_data or load external file
+    if not tensor.HasField("raw_data"):
+        raise ValueError("raw_data field doesn't exist.")
+
+    # Create file if it doesn't exist
+    if not os.path.isfile(external_data_file_path):
+        open(external_data_file_path, 'ab').close()
+
+    # Open file for reading and writing at random locations ('r+b')
+    with open(external_data_file_path, 'r+b') as data_file:
+        data_file.seek(0, 2)
+        if info.offset is not None:
+            # Pad file to required offset if needed
+            file_size = data_file.tell()
+            if info.offset > file_size:
+                data_file.write(b"\0" * (info.offset - file_size))
+
+            data_file.seek(info.offset)
+        elif align:
+            data_file.write(b"\0" * (_align_offset(data_file.tell(), align) - data_file.tell()))
+        offset = data_file.tell()
+        data_file.write(tensor.raw_data)
+        set_external_data(tensor, info.location, offset, data_file.tell() - offset, _checksum(tensor.raw_data))
+
+
+def _align_offset(offset, align):  # type: (int, Optional[int]) -> int
+    """Round offset up to the next multiple of align."""
+    if not align:
+        return offset
+    return (offset + align - 1) // align * align
+
+
+def _get_all_tensors(onnx_model_proto):  # type: (ModelProto) -> Iterable[TensorProto]
+    """Scan an ONNX model for all tensors and return as an iterator."""
+    return chain(_get_initializer_tensors(onnx_model_proto),
+                 _get_attribute_tensors(onnx_model_proto))
+
+
+def _get_initializer_tensors(onnx_model_proto):  # type: (ModelProto) -> Iterable[TensorProto]
+    """Create an iterator of initializer tensors from ONNX model."""
+    for initializer in onnx_model_proto.graph.initializer:
+        yield initializer
+
+
+def _get_attribute_tensors(onnx_model_proto):  # type: (ModelProto) -> Iterable[TensorProto]
+    """Create an iterator of tensors from node attributes of an ONNX model."""
+    for node in onnx_model_proto.graph.node:
+        for attribute in node.attribute:
+            if attribute.HasField("t"):
+                yield attribute.t
+            for tensor in attribute.tensors:
+                yield tensor
+
+
+def _sanitize_path(path):  # type: (Text) -> Text
+    """Remove path components which would allow traversing up a directory tree from a base path.
+
+    Note: This method is currently very basic and should be expanded.
+    """
+    return path.lstrip('/.')
+
+
+def _is_valid_filename(filename):  # type: (Text) -> bool
+    """Utility to check whether the provided filename is valid."""
+    exp = re.compile("^[^<>:;,?\"*|/]+$")
+    match = exp.match(filename)
+    if match:
+        return True
+    else:
+        return False
+
+
+def uses_external_data(tensor):  # type: (TensorProto) -> bool
+    """Return true if the tensor stores data in an external location."""
+    return tensor.HasField("data_location") and tensor.data_location == TensorProto.EXTERNAL
+
+
+def remove_external_data_field(tensor, field_key):  # type: (TensorProto, Text) -> None
+    """
+    Remove a field from a Tensor's external_data key-value store.
+
+    Modifies tensor object in place.
+
+    @params
+    tensor: Tensor object from which value will be removed
+    field_key: The key of the field to be removed
+    """
+    for (i, field) in enumerate(tensor.external_data):
+        if field.key == field_key:
+            del tensor.external_data[i]
+
+
+def write_external_data_tensors(model, filepath, align=None, deduplicate=False, num_threads=None, compression=None,
+                                compression_chunk_size=None):
+    # type: (ModelProto, Text, Optional[int], bool, Optional[int], Optional[Text], Optional[int]) -> ModelProto
+    """
+    Serializes data for all the tensors which have data location set to TensorProto.External.
+
+    Note: This function also strips basepath information from all tensors' external_data fields,
+    and records the SHA1 checksum of each tensor's data.
+
+    @params
+    model: Model object which is the source of tensors to serialize.
+    filepath: System path to the directory which should be treated as base path for external data.
+    align: If set, tensors without an offset are written at offsets that are multiples of align bytes
+           (e.g. 64 or 4096), so that consumers can map them directly into aligned buffers.
+    deduplicate: If true, the data of byte-identical tensors is written once and all of them
+                 point to the same region of the external data file.
+    num_threads: Maximum number of threads writing external data files concurrently.
+    compression: If set to 'zlib' or 'lzma', the data of each tensor is compressed in independent
+                 chunks. The codec and the compressed size of each chunk are recorded in external_data
+                 so that loaders can decompress chunks in parallel, or only the chunks they need
+                 (see load_external_data_range). These external_data keys are not part of the ONNX
+                 standard: only the loaders of this package can read compressed data, and not with mmap.
+    compression_chunk_size: Size in bytes of the uncompressed chunks. Defaults to 4 MiB.
+
+    @return
+    The modified model object.
+    """
+
+    # Writing to external data happens in 2 passes:
+    # 1. Tensors with raw data which pass the necessary conditions (size threshold etc) are marked for serialization
+    # 2. The raw data in these tensors is serialized to a file
+    # Thus serialize only if tensor has raw data and it was marked for serialization
+    tensors = [tensor for tensor in _get_all_tensors(model)
+               if uses_external_data(tensor) and tensor.HasField("raw_data")]
+    _write_external_data_bulk(tensors, filepath, align, deduplicate, num_threads, compression, compression_chunk_size)
+    for tensor in tensors:
+        tensor.ClearField(str('raw_data'))
+
+    return model
+
+
+def _write_external_data_bulk(tensors, base_path, align=None, deduplicate=False, num_threads=None, compression=None,
+                              compression_chunk_size=None):
+    # type: (List[TensorProto], Text, Optional[int], bool, Optional[int], Optional[Text], Optional[int]) -> None
+    """
+    Write the raw data of tensors to their external files, like save_external_data does for one tensor,
+    but computing the layout of each file up front so that every file is opened and written only once.
+    Different files are written concurrently on a thread pool, which also computes the checksums
+    and compresses the data.
+    If deduplicate is true, tensors without an offset whose data was already written point to that region.
+    """
+    files = OrderedDict()  # type: OrderedDict[Text, List[TensorProto]]
+    for tensor in tensors:
+        if not tensor.HasField("raw_data"):
+            raise ValueError("raw_data field doesn't exist.")
+        info = ExternalDataInfo(tensor)
+        files.setdefault(info.location, []).append(tensor)
+    chunk_size = compression_chunk_size or _COMPRESSION_CHUNK_SIZE
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        # Data as stored in the files, and the compressed size of each chunk
+        payloads = {}  # type: Dict[int, Tuple[bytes, Optional[List[int]]]]
+        if compression:
+            for tensor in tensors:
+                payloads[id(tensor)] = _compress(tensor.raw_data, compression, chunk_size, executor)
+
+        def payload(tensor):  # type: (TensorProto) -> bytes
+            return payloads[id(tensor)][0] if compression else tensor.raw_data
+
+        written = {}  # type: Dict[Tuple[int, bytes], Tuple[Text, int, TensorProto]]
+        duplicates = []  # type: List[Tuple[TensorProto, Text, int, TensorProto]]
+        layouts = []  # type: List[Tuple[Text, Text, bool, int, int, List[Tuple[int, int, TensorProto]]]]
+        for location, file_tensors in files.items():
+            external_data_file_path = os.path.join(base_path, location)
+            file_exists = os.path.isfile(external_data_file_path)
+            # New data is appended, and tensors with an offset are written at that offset
+            file_size = os.path.getsize(external_data_file_path) if file_exists else 0
+            end = file_size
+            placements = []  # type: List[Tuple[int, int, TensorProto]]
+            for (i, tensor) in enumerate(file_tensors):
+                info = ExternalDataInfo(tensor)
+                if deduplicate:
+                    key = (len(tensor.raw_data), hashlib.sha256(tensor.raw_data).digest())
+                    if info.offset is None and key in written:
+                        duplicates.append((tensor,) + written[key])
+                        continue
+                offset = info.offset if info.offset is not None else _align_offset(end, align)
+                placements.append((offset, i, tensor))
+                end = max(end, offset + len(payload(tensor)))
+                if deduplicate:
+                    written.setdefault(key, (location, offset, tensor))
+            if placements:
+                layouts.append((location, external_data_file_path, file_exists, file_size, end, placements))
+
+        def write(location, external_data_file_path, file_exists, file_size, end, placements):
+            # type: (Text, Text, bool, int, int, List[Tuple[int, int, TensorProto]]) -> None
+            with open(external_data_file_path, 'r+b' if file_exists else 'wb', buffering=_WRITE_BUFFER_SIZE) as data_file:
+                if end > file_size:
+                    # Preallocate the file; the gaps are zero-filled
+                    data_file.truncate(end)
+                for (offset, _, tensor) in sorted(placements, key=lambda placement: placement[:2]):
+                    if data_file.tell() != offset:
+                        data_file.seek(offset)
+                    data_file.write(payload(tensor))
+
+        # Checksums are computed while the files are written
+        checksums = {}  # type: Dict[int, Future[Text]]
+        for (_, _, _, _, _, placements) in layouts:
+            for (_, _, tensor) in placements:
+                checksums[id(tensor)] = executor.submit(lambda tensor: _checksum(payload(tensor)), tensor)
+        for future in [executor.submit(write, *layout) for layout in layouts]:
+            future.result()
+
+        def set_stored_data(tensor, location, offset, original):
+            # type: (TensorProto, Text, int, TensorProto) -> None
+            set_external_data(tensor, location, offset, len(payload(original)), checksums[id(original)].result())
+            if compression:
+                for (k, v) in [('compression', compression),
+                               ('chunk_size', str(chunk_size)),
+                               ('chunks', ','.join(str(size) for size in cast(List[int], payloads[id(original)][1])))]:
+                    entry = tensor.external_data.add()
+                    entry.key = k
+                    entry.value = v
+
+        for (location, _, _, _, _, placements) in layouts:
+            for (offset, _, tensor) in placements:
+                set_stored_data(tensor, location, offset, tensor)
+        for (tensor, location, offset, original) in duplicates:
+            set_stored_data(tensor, location, offset, original)
@@ -0,0 +1,633 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import itertools
+
+import numpy as np
+from onnx import TensorProto, MapProto, SequenceProto, OptionalProto, ModelProto, GraphProto
+from onnx import mapping, helper
+from onnx.external_data_helper import load_external_data_for_tensor, uses_external_data, _read_external_data_bulk, _check_mappable
+from onnx.external_data_helper import ExternalDataInfo, ExternalDataCache, get_external_data_file_path
+from typing import Sequence, Any, Optional, Text, List, Dict, Iterable, Union
+
+
+def combine_pairs_to_complex(fa):  # type: (Sequence[int]) -> np.ndarray[Any]
+    """
+    Combines consecutive (real, imag) pairs of values into complex values.
+    Returns a complex64 array for float32 input and a complex128 array otherwise.
+    """
+    pairs = np.asarray(fa)
+    if pairs.dtype != np.float32:
+        pairs = pairs.astype(np.float64)
+    # Reinterpret consecutive (real, imag) pairs as complex values
+    pairs = np.ascontiguousarray(pairs[:len(pairs) // 2 * 2])
+    return pairs.view(np.complex64 if pairs.dtype == np.float32 else np.complex128)
+
+
+def _typed_field_to_array(data_type, values, count=-1):  # type: (int, Iterable[Any], int) -> np.ndarray[Any]
+    """Converts the values of the typed storage field of a tensor of data_type to a flat array."""
+    # float16/bfloat16 is stored as int32 (uint16 type); Need view to get the original value
+    if (data_type == TensorProto.FLOAT16
+            or data_type == TensorProto.BFLOAT16):
+        return np.fromiter(values, dtype=np.int32, count=count).astype(np.uint16).view(np.float16)
+    storage_type = mapping.TENSOR_TYPE_TO_STORAGE_TENSOR_TYPE[data_type]
+    data = np.fromiter(values, dtype=mapping.TENSOR_TYPE_TO_NP_TYPE[storage_type], count=count)
+    if (data_type == TensorProto.COMPLEX64
+            or data_type == TensorProto.COMPLEX128):
+        data = combine_pairs_to_complex(data)
+    return data.astype(mapping.TENSOR_TYPE_TO_NP_TYPE[data_type], copy=False)
+
+
+def _encode_strings(strings):  # type: (List[Any]) -> List[bytes]
+    """Encodes a flat list of either all str or all bytes to UTF-8 bytes.
+
+    Raises TypeError if the list mixes str with other objects.
+    """
+    if len(strings) > 0 and isinstance(strings[0], bytes):
+        # Adding anything but bytes to string_data raises TypeError
+        return strings
+    return list(map(str.encode, strings))
+
+
+def _decode_strings(utf8_strings):  # type: (Sequence[bytes]) -> np.ndarray[Any]
+    """Decodes UTF-8 bytes into a flat object array of str."""
+    strings = np.empty(len(utf8_strings), dtype=object)
+    strings[:] = list(map(bytes.decode, utf8_strings))
+    return strings
+
+
+def to_array(tensor, base_dir="", mmap=False, cache=None, native_byteorder_copy=False):
+    # type: (TensorProto, Text, bool, Optional[ExternalDataCache], bool) -> np.ndarray[Any]
+    """Converts a tensor def object to a numpy array.
+
+    Inputs:
+        tensor: a TensorProto object.
+        base_dir: if external tensor exists, base_dir can help to find the path to it
+        mmap: if the tensor uses external data, return a read-only np.memmap
+            of the external file in base_dir instead of loading the data into raw_data.
+        cache: if the tensor uses external data, fetch it through this
+            ExternalDataCache instead of loading it into raw_data.
+        native_byteorder_copy: on big-endian hosts, eagerly convert the whole tensor
+            to a byteswapped copy in native byte order, instead of returning a
+            little-endian view of the raw data.
+    Returns:
+        arr: the converted array. Arrays read from raw or external data have a
+            little-endian dtype such as '<f4', which is native on little-endian hosts.
+            On big-endian hosts numpy swaps the values of such a view as they are
+            read, so no copy is made unless native_byteorder_copy is set.
+    """
+    if tensor.HasField("segment"):
+        raise ValueError(
+            "Currently not supporting loading segments.")
+    if tensor.data_type == TensorProto.UNDEFINED:
+        raise TypeError("The element type in the input tensor is not defined.")
+
+    tensor_dtype = tensor.data_type
+    storage_type = mapping.TENSOR_TYPE_TO_STORAGE_TENSOR_TYPE[tensor_dtype]
+    storage_field = mapping.STORAGE_TENSOR_TYPE_TO_FIELD[storage_type]
+    dims = tensor.dims
+
+    if tensor.data_type == TensorProto.STRING:
+        return _decode_strings(getattr(tensor, storage_field)).reshape(dims)
+
+    # Load raw data from external tensor if it exists
+    if uses_external_data(tensor):
+        if mmap:
+            return _to_byteorder(_memmap_external_data(tensor, base_dir), native_byteorder_copy)
+        if cache is not None:
+            return _to_byteorder(_raw_to_array(tensor, cache.load(tensor, base_dir)), native_byteorder_copy)
+        load_external_data_for_tensor(tensor, base_dir)
+
+    if tensor.HasField("raw_data"):
+        # Raw_bytes support: using frombuffer with a little-endian dtype, so the
+        # tensor is left untouched on big-endian hosts as well.
+        return _to_byteorder(_raw_to_array(tensor, tensor.raw_data), native_byteorder_copy)
+    else:
+        data = getattr(tensor, storage_field)
+        return _typed_field_to_array(tensor_dtype, data, len(data)).reshape(dims)
+
+
+def _to_byteorder(arr, native_byteorder_copy):  # type: (np.ndarray[Any], bool) -> np.ndarray[Any]
+    """Returns arr, or a byteswapped native-order copy of it if native_byteorder_copy is set."""
+    if native_byteorder_copy and not arr.dtype.isnative:
+        return arr.astype(arr.dtype.newbyteorder('='))
+    return arr
+
+
+def _memmap_external_data(tensor, base_dir):  # type: (TensorProto, Text) -> np.ndarray[Any]
+    """Maps the external data of tensor read-only, without copying it into memory."""
+    _check_mappable(tensor)
+    info = ExternalDataInfo(tensor)
+    # External data is always little-endian
+    dtype = np.dtype(mapping.TENSOR_TYPE_TO_NP_TYPE[tensor.data_type]).newbyteorder('<')
+    shape = tuple(tensor.dims)
+    nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+    if info.length is not None and info.length < nbytes:
+        raise ValueError(
+            "External data of tensor {} has {} bytes, expected {}.".format(
+                tensor.name, info.length, nbytes))
+    if nbytes == 0:
+        # np.memmap cannot map empty regions
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(get_external_data_file_path(tensor, base_dir),
+                     dtype=dtype, mode='r', offset=info.offset or 0, shape=shape)
+
+
+def from_array(arr, name=None):  # type: (np.ndarray[Any], Optional[Text]) -> TensorProto
+    """Converts a numpy array to a tensor def.
+
+    Inputs:
+        arr: a numpy array.
+        name: (optional) the name of the tensor.
+    Returns:
+        tensor_def: the converted tensor def.
+    """
+    tensor = TensorProto()
+    _fill_tensor(tensor, arr, name)
+    return tensor
+
+
+def _fill_tensor(tensor, arr, name=None):  # type: (TensorProto, np.ndarray[Any], Optional[Text]) -> None
+    """Sets the fields of an empty tensor def to the data of a numpy array, as from_array does."""
+    tensor.dims.extend(arr.shape)
+    if name:
+        tensor.name = name
+
+    if arr.dtype.kind in ('U', 'S'):
+        # Fixed-width strings are encoded in bulk without an object array
+        tensor.data_type = TensorProto.STRING
+        tensor.string_data.extend(_encode_strings(arr.ravel().tolist()))
+        return
+
+    if arr.dtype == object:
+        # Special care for strings.
+        tensor.data_type = mapping.NP_TYPE_TO_TENSOR_TYPE[arr.dtype]
+        flat_array = arr.ravel().tolist()
+        try:
+            tensor.string_data.extend(_encode_strings(flat_array))
+            return
+        except TypeError:
+            # Mixed or nested elements are handled one by one below
+            del tensor.string_data[:]
+        # TODO: Introduce full string support.
+        # We flatten the array in case there are 2-D arrays are specified
+        # We throw the error below if we have a 3-D array or some kind of other
+        # object. If you want more complex shapes then follow the below instructions.
+        # Unlike other types where the shape is automatically inferred from
+        # nested arrays of values, the only reliable way now to feed strings
+        # is to put them into a flat array then specify type astype(object)
+        # (otherwise all strings may have different types depending on their length)
+        # and then specify shape .reshape([x, y, z])
+        for e in flat_array:
+            if isinstance(e, str):
+                tensor.string_data.append(e.encode('utf-8'))
+            elif isinstance(e, np.ndarray):
+                for s in e:
+                    if isinstance(s, str):
+                        tensor.string_data.append(s.encode('utf-8'))
+                    elif isinstance(s, bytes):
+                        tensor.string_data.append(s)
+            elif isinstance(e, bytes):
+                tensor.string_data.append(e)
+            else:
+                raise NotImplementedError(
+                    "Unrecognized object in the object array, expect a string, or array of bytes: ", str(type(e)))
+        return
+
+    # For numerical types, directly use numpy raw bytes.
+    tensor.data_type = _tensor_type(arr.dtype)
+    # Raw data is always little-endian, swap while copying if needed
+    tensor.raw_data = arr.astype(arr.dtype.newbyteorder('<'), copy=False).tobytes()
+
+
+# Alignment of each array packed into the arena of initializers_to_arrays
+_ARENA_ALIGNMENT = 64
+
+
+def initializers_to_arrays(model, base_dir="", num_threads=None):
+    # type: (ModelProto, Text, Optional[int]) -> Dict[Text, np.ndarray[Any]]
+    """Converts all initializers of the main graph of a model to numpy arrays.
+
+    Inputs:
+        model: a ModelProto object.
+        base_dir: if external tensors exist, base_dir can help to find the path to them.
+        num_threads: (optional) the number of threads reading external data.
+    Returns:
+        arrays: the converted arrays, keyed by initializer name.
+
+    Tensors stored in raw_data, in memory or externally, are returned as read-only
+    views of the loaded bytes without another copy. Tensors stored in typed fields
+    are packed into a single contiguous arena. The model is not modified.
+    """
+    initializers = list(model.graph.initializer)
+    arrays = {}  # type: Dict[Text, np.ndarray[Any]]
+
+    external = [tensor for tensor in initializers
+                if uses_external_data(tensor) and not tensor.HasField("raw_data")]
+    for i, data in _read_external_data_bulk(external, base_dir, num_threads):
+        arrays[external[i].name] = _raw_to_array(external[i], data)
+
+    packed = []  # type: List[TensorProto]
+    for tensor in initializers:
+        if tensor.name in arrays:
+            continue
+        if tensor.HasField("raw_data"):
+            arrays[tensor.name] = _raw_to_array(tensor, tensor.raw_data)
+        elif tensor.data_type == TensorProto.STRING:
+            arrays[tensor.name] = to_array(tensor)
+        else:
+            packed.append(tensor)
+
+    offsets = []  # type: List[int]
+    size = 0
+    for tensor in packed:
+        size = -(-size // _ARENA_ALIGNMENT) * _ARENA_ALIGNMENT
+        offsets.append(size)
+        size += _nbytes(tensor)
+    # Over-allocate so that the arena itself starts on an aligned address
+    arena = np.empty(size + _ARENA_ALIGNMENT, dtype=np.uint8)
+    start = -arena.ctypes.data % _ARENA_ALIGNMENT
+    arena = arena[start:start + size]
+    for tensor, offset in zip(packed, offsets):
+        dtype = np.dtype(mapping.TENSOR_TYPE_TO_NP_TYPE[tensor.data_type])
+        array = arena[offset:offset + _nbytes(tensor)].view(dtype).reshape(tensor.dims)
+        _typed_field_into(tensor, array.reshape(-1))
+        arrays[tensor.name] = array
+
+    return {tensor.name: arrays[tensor.name] for tensor in initializers}
+
+
+def _typed_field_into(tensor, out):  # type: (TensorProto, np.ndarray[Any]) -> None
+    """Decodes the typed storage field of tensor into out, a flat array of the dtype of tensor."""
+    storage_type = mapping.TENSOR_TYPE_TO_STORAGE_TENSOR_TYPE[tensor.data_type]
+    values = getattr(tensor, mapping.STORAGE_TENSOR_TYPE_TO_FIELD[storage_type])
+    if (tensor.data_type == TensorProto.FLOAT16
+            or tensor.data_type == TensorProto.BFLOAT16):
+        # Stored as the bit patterns of the values
+        out = out.view(np.uint16)
+    elif (tensor.data_type == TensorProto.COMPLEX64
+            or tensor.data_type == TensorProto.COMPLEX128):
+        # Stored as consecutive (real, imag) pairs
+        out = out.view(out.real.dtype)
+    out[...] = values
+
+
+def _nbytes(tensor):  # type: (TensorProto) -> int
+    itemsize = np.dtype(mapping.TENSOR_TYPE_TO_NP_TYPE[tensor.data_type]).itemsize
+    return int(np.prod(tensor.dims, dtype=np.int64)) * itemsize
+
+
+def _raw_to_array(tensor, data):  # type: (TensorProto, bytes) -> np.ndarray[Any]
+    # Raw data is always little-endian
+    dtype = np.dtype(mapping.TENSOR_TYPE_TO_NP_TYPE[tensor.data_type]).newbyteorder('<')
+    return np.frombuffer(data, dtype=dtype).reshape(tensor.dims)
+
+
+def from_arrays(arrays, graph=None):  # type: (Dict[Text, np.ndarray[Any]], Optional[GraphProto]) -> List[TensorProto]
+    """Converts named numpy arrays to tensor defs in bulk.
+
+    Inputs:
+        arrays: the arrays to convert, keyed by tensor name.
+        graph: (optional) a GraphProto to which the tensors are appended as initializers.
+    Returns:
+        tensors: the converted tensor defs, in the order of arrays.
+
+    When graph is given, each tensor is built in place in graph.initializer,
+    so no further copy is made to add it to the graph.
+    """
+    if graph is None:
+        graph = GraphProto()
+    first = len(graph.initializer)
+    for name, arr in arrays.items():
+        _fill_tensor(graph.initializer.add(), np.asarray(arr), name)
+    return list(graph.initializer)[first:]
+
+
+def _tensor_type(dtype):  # type: (np.dtype[Any]) -> int
+    """Returns the TensorProto data type of a numeric numpy dtype of either byte order."""
+    try:
+        return mapping.NP_TYPE_TO_TENSOR_TYPE[dtype.newbyteorder('=')]
+    except KeyError:
+        raise RuntimeError(
+            "Numpy data type not understood yet: {}".format(str(dtype)))
+
+
+def _extend_stacked(tensors, arr):  # type: (Any, np.ndarray[Any]) -> None
+    """Appends the sub-arrays of a numeric array along its first axis as unnamed tensors
+    to a repeated field of tensor defs.
+    """
+    data_type = _tensor_type(arr.dtype)
+    # Raw data is always little-endian, swap the whole array at once if needed
+    arr = np.ascontiguousarray(arr.astype(arr.dtype.newbyteorder('<'), copy=False))
+    dims = arr.shape[1:]
+    for sub in arr:
+        tensor = tensors.add()
+        tensor.dims.extend(dims)
+        tensor.data_type = data_type
+        tensor.raw_data = sub.tobytes()
+
+
+def _stack_arrays(lst):  # type: (List[Any]) -> Optional[np.ndarray[Any]]
+    """Stacks a list of numeric numpy arrays or scalars of one type, dtype and shape.
+
+    Returns None if the elements cannot be stacked without changing their dtype.
+    """
+    kind = type(lst[0])
+    if issubclass(kind, np.ndarray):
+        if len(set((a.dtype, a.shape) for a in lst)) != 1:
+            return None
+        stacked = np.stack(lst)
+    elif issubclass(kind, np.generic):
+        # Scalars of one numpy type all have the same dtype
+        stacked = np.asarray(lst)
+    else:
+        return None
+    if stacked.dtype == object or stacked.dtype.kind in ('U', 'S'):
+        return None
+    return stacked
+
+
+def to_list(sequence, stack=False):  # type: (SequenceProto, bool) -> Union[List[Any], np.ndarray[Any]]
+    """Converts a sequence def to a Python list.
+
+    Inputs:
+        sequence: a SequenceProto object.
+        stack: (optional) if the sequence holds tensors that all have the same
+            data type and shape, return them stacked into one array of shape
+            (len(sequence), *dims), reading the data of all tensors at once.
+    Returns:
+        lst: the converted list, or the stacked array.
+    """
+    elem_type = sequence.elem_type
+    value_field = mapping.STORAGE_ELEMENT_TYPE_TO_FIELD[elem_type]
+    values = getattr(sequence, value_field)
+    if stack and elem_type == SequenceProto.TENSOR and len(values) > 0:
+        stacked = _stack_sequence(sequence)
+        if stacked is not None:
+            return stacked
+    if elem_type == SequenceProto.TENSOR or elem_type == SequenceProto.SPARSE_TENSOR:
+        convert = to_array  # type: Any
+    elif elem_type == SequenceProto.SEQUENCE:
+        convert = to_list
+    elif elem_type == SequenceProto.MAP:
+        convert = to_dict
+    elif len(values) > 0:
+        raise TypeError("The element type in the input sequence is not supported.")
+    else:
+        return []
+    return list(map(convert, values))
+
+
+def _stack_sequence(sequence):  # type: (SequenceProto) -> Optional[np.ndarray[Any]]
+    """Converts the tensors of a sequence to a single stacked array.
+
+    Returns None if the tensors differ in data type or shape.
+    """
+    tensors = list(sequence.tensor_values)
+    first = tensors[0]
+    if first.data_type == TensorProto.UNDEFINED:
+        return None
+    dims = list(first.dims)
+    # Check the tensors and collect their raw data in a single pass
+    raw_data = []  # type: List[bytes]
+    elsewhere = False
+    for t in tensors:
+        if t.data_type != first.data_type or t.dims != dims:
+            return None
+        if t.HasField("raw_data"):
+            raw_data.append(t.raw_data)
+        elif uses_external_data(t) or t.HasField("segment"):
+            elsewhere = True
+    shape = (len(tensors),) + tuple(dims)
+
+    if first.data_type == TensorProto.STRING:
+        strings = itertools.chain.from_iterable(t.string_data for t in tensors)
+        return _decode_strings(list(strings)).reshape(shape)
+    if elsewhere or 0 < len(raw_data) < len(tensors):
+        return np.stack([to_array(t) for t in tensors])
+    if raw_data:
+        # Raw data is always little-endian
+        dtype = np.dtype(mapping.TENSOR_TYPE_TO_NP_TYPE[first.data_type]).newbyteorder('<')
+        return np.frombuffer(b''.join(raw_data), dtype=dtype).reshape(shape)
+    storage_type = mapping.TENSOR_TYPE_TO_STORAGE_TENSOR_TYPE[first.data_type]
+    storage_field = mapping.STORAGE_TENSOR_TYPE_TO_FIELD[storage_type]
+    values = itertools.chain.from_iterable(getattr(t, storage_field) for t in tensors)
+    return _typed_field_to_array(first.data_type, values).reshape(shape)
+
+
+def from_list(lst, name=None, dtype=None):  # type: (Union[List[Any], np.ndarray[Any]], Optional[Text], Optional[int]) -> SequenceProto
+    """Converts a list into a sequence def.
+
+    Inputs:
+        lst: a Python list, or an array whose sub-arrays along the first
+            axis become the tensors of the sequence.
+        name: (optional) the name of the sequence.
+        dtype: (optional) type of element in the input list, used for specifying
+                          sequence values when converting an empty list.
+    Returns:
+        sequence: the converted sequence def.
+    """
+    sequence = SequenceProto()
+    if name:
+        sequence.name = name
+
+    if dtype:
+        elem_type = dtype
+    elif isinstance(lst, np.ndarray):
+        elem_type = SequenceProto.TENSOR
+    elif len(lst) > 0:
+        first_elem = lst[0]
+        if isinstance(first_elem, dict):
+            elem_type = SequenceProto.MAP
+        elif isinstance(first_elem, list):
+            elem_type = SequenceProto.SEQUENCE
+        else:
+            elem_type = SequenceProto.TENSOR
+    else:
+        # if empty input list and no dtype specified
+        # choose sequence of tensors on default
+        elem_type = SequenceProto.TENSOR
+    sequence.elem_type = elem_type
+
+    if not isinstance(lst, np.ndarray) and len(lst) > 0 and not all(isinstance(elem, type(lst[0])) for elem in lst):
+        raise TypeError("The element type in the input list is not the same "
+                        "for all elements and therefore is not supported as a sequence.")
+
+    if elem_type == SequenceProto.TENSOR:
+        stacked = lst
+        if not isinstance(lst, np.ndarray) and len(lst) > 0:
+            stacked = _stack_arrays(lst)
+        if isinstance(stacked, np.ndarray) and stacked.dtype != object and stacked.dtype.kind not in ('U', 'S'):
+            _extend_stacked(sequence.tensor_values, stacked)
+        else:
+            for tensor in lst:
+                _fill_tensor(sequence.tensor_values.add(), np.asarray(tensor))
+    elif elem_type == SequenceProto.SEQUENCE:
+        sequence.sequence_values.extend([from_list(seq) for seq in lst])
+    elif elem_type == SequenceProto.MAP:
+        sequence.map_values.extend([from_dict(map) for map in lst])
+    else:
+        raise TypeError("The element type in the input list is not a tensor, "
+                        "sequence, or map and is not supported.")
+    return sequence
+
+
+def to_dict(map):  # type: (MapProto) -> np.ndarray[Any]
+    """Converts a map def to a Python dictionary.
+
+    Inputs:
+        map: a MapProto object.
+    Returns:
+        dict: the converted dictionary.
+    """
+    key_list = []  # type: List[Any]
+    if map.key_type == TensorProto.STRING:
+        key_list = list(map.string_keys)
+    else:
+        key_list = list(map.keys)
+
+    values = to_list(map.values, stack=True)
+    if isinstance(values, np.ndarray):
+        # Index with an ellipsis so that scalar values stay 0-d arrays
+        values = [values[i, ...] for i in range(len(values))]
+    if len(key_list) != len(values):
+        raise IndexError("Length of keys and values for MapProto (map name: ",
+                        map.name,
+                        ") are not the same.")
+    dictionary = dict(zip(key_list, values))
+    return dictionary
+
+
+def from_dict(dict, name=None):  # type: (Dict[Any, Any], Optional[Text]) -> MapProto
+    """Converts a Python dictionary into a map def.
+
+    Inputs:
+        dict: Python dictionary
+        name: (optional) the name of the map.
+    Returns:
+        map: the converted map def.
+    """
+    map = MapProto()
+    if name:
+        map.name = name
+    keys = list(dict.keys())
+    if isinstance(keys[0], (str, bytes)):
+        key_type = TensorProto.STRING
+    else:
+        key_type = mapping.NP_TYPE_TO_TENSOR_TYPE[np.array(keys[0]).dtype]
+
+    valid_key_int_types = [TensorProto.INT8, TensorProto.INT16, TensorProto.INT32,
+                           TensorProto.INT64, TensorProto.UINT8, TensorProto.UINT16,
+                           TensorProto.UINT32, TensorProto.UINT64]
+
+    if not all(isinstance(key, type(keys[0])) for key in keys):
+        raise TypeError("The key type in the input dictionary is not the same "
+                        "for all keys and therefore is not valid as a map.")
+
+    values = list(dict.values())
+    if not all(isinstance(val, type(values[0])) for val in values):
+        raise TypeError("The value type in the input dictionary is not the same "
+                        "for all values and therefore is not valid as a map.")
+
+    value_seq = from_list(values)
+
+    map.key_type = key_type
+    if key_type == TensorProto.STRING:
+        map.string_keys.extend(_encode_strings(keys))
+    elif key_type in valid_key_int_types:
+        map.keys.extend(np.asarray(keys).tolist())
+    map.values.CopyFrom(value_seq)
+    return map
+
+
+def to_optional(optional):  # type: (OptionalProto) -> Optional[Any]
+    """Converts an optional def to a Python optional.
+
+    Inputs:
+        optional: an OptionalProto object.
+    Returns:
+        opt: the converted optional.
+    """
+    opt = None  # type: Optional[Any]
+    elem_type = optional.elem_type
+    if elem_type == OptionalProto.UNDEFINED:
+        return opt
+    value_field = mapping.OPTIONAL_ELEMENT_TYPE_TO_FIELD[elem_type]
+    value = getattr(optional, value_field)
+    # TODO: create a map and replace conditional branches
+    if elem_type == OptionalProto.TENSOR or elem_type == OptionalProto.SPARSE_TENSOR:
+        opt = to_array(value)
+    elif elem_type == OptionalProto.SEQUENCE:
+        opt = to_list(value)
+    elif elem_type == OptionalProto.MAP:
+        opt = to_dict(value)
+    elif elem_type == OptionalProto.OPTIONAL:
+        return to_optional(value)
+    else:
+        raise TypeError("The element type in the input optional is not supported.")
+    return opt
+
+
+def from_optional(
+        opt,  # type: Optional[Any]
+        name=None,  # type: Optional[Text]
+        dtype=None  # type: Optional[int]
+):  # type: (...) -> OptionalProto
+    """Converts an optional value into a Optional def.
+
+    Inputs:
+        opt: a Python optional
+        name: (optional) the name of the optional.
+        dtype: (optional) type of element in the input, used for specifying
+                          optional values when converting empty none. dtype must
+                          be a valid OptionalProto.DataType value
+    Returns:
+        optional: the converted optional def.
+    """
+    # TODO: create a map and replace conditional branches
+    optional = OptionalProto()
+    if name:
+        optional.name = name
+
+    if dtype:
+        # dtype must be a valid OptionalProto.DataType
+        valid_dtypes = [v for v in OptionalProto.DataType.values()]
+        assert dtype in valid_dtypes
+        elem_type = dtype
+    elif isinstance(opt, dict):
+        elem_type = OptionalProto.MAP
+    elif isinstance(opt, list):
+        elem_type = OptionalProto.SEQUENCE
+    elif opt is None:
+        elem_type = OptionalProto.UNDEFINED
+    else:
+        elem_type = OptionalProto.TENSOR
+
+    optional.elem_type = elem_type
+
+    if opt is not None:
+        if elem_type == OptionalProto.TENSOR:
+            optional.tensor_value.CopyFrom(from_array(opt))
+        elif elem_type == OptionalProto.SEQUENCE:
+            optional.sequence_value.CopyFrom(from_list(opt))
+        elif elem_type == OptionalProto.MAP:
+            optional.map_value.CopyFrom(from_dict(opt))
+        else:
+            raise TypeError("The element type in the input is not a tensor, "
+                            "sequence, or map and is not supported.")
+    return optional
+
+
+def convert_endian(tensor):  # type: (TensorProto) -> None
+    """
+    call to convert endianess of raw data in tensor.
+    @params
+    TensorProto: TensorProto to be converted.
+    """
+    tensor_dtype = tensor.data_type
+    np_dtype = mapping.TENSOR_TYPE_TO_NP_TYPE[tensor_dtype]
+    tensor.raw_data = np.frombuffer(tensor.raw_data, dtype=np_dtype).byteswap().tobytes()
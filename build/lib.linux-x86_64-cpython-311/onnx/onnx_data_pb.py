@@ -0,0 +1,8 @@
+# This file is generated by setup.py. DO NOT EDIT!
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from .onnx_data_pb2 import *  # noqa
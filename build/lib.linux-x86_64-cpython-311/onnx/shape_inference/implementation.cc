@@ -0,0 +1,1475 @@
+/*
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+#include "onnx/shape_inference/implementation.h"
+#include <algorithm>
+#include <atomic>
+#include <cstdint>
+#include <fstream>
+#include <functional>
+#include <list>
+#include <thread>
+#include "onnx/checker.h"
+#include "onnx/defs/data_type_utils.h"
+#include "onnx/string_utils.h"
+
+namespace ONNX_NAMESPACE {
+namespace shape_inference {
+namespace {
+
+std::string GetValueCaseString(const TypeProto& type) {
+  switch (type.value_case()) {
+    case TypeProto::ValueCase::kTensorType:
+      return "tensor_type";
+    case TypeProto::ValueCase::kSequenceType:
+      return "sequence_type";
+    case TypeProto::ValueCase::kMapType:
+      return "map_type";
+    case TypeProto::ValueCase::kOptionalType:
+      return "optional_type";
+#ifdef ONNX_ML
+    case TypeProto::ValueCase::kOpaqueType:
+      return "opaque_type";
+#endif
+    case TypeProto::ValueCase::kSparseTensorType:
+      return "sparse_tensor_type";
+    case TypeProto::ValueCase::VALUE_NOT_SET:
+      return "NOT_SET";
+    default:
+      return ONNX_NAMESPACE::to_string(type.value_case());
+  }
+}
+
+std::string GetElemTypeString(const TypeProto_Tensor& type) {
+#ifndef ONNX_USE_LITE_PROTO
+  const std::string type_str = TensorProto::DataType_Name(static_cast<TensorProto_DataType>(type.elem_type()));
+  if (!type_str.empty()) {
+    return type_str;
+  }
+#endif
+  return ONNX_NAMESPACE::to_string(type.elem_type());
+}
+
+std::string GetElemTypeString(const TypeProto_SparseTensor& type) {
+#ifndef ONNX_USE_LITE_PROTO
+  const std::string type_str = TensorProto::DataType_Name(static_cast<TensorProto_DataType>(type.elem_type()));
+  if (!type_str.empty()) {
+    return type_str;
+  }
+#endif
+  return ONNX_NAMESPACE::to_string(type.elem_type());
+}
+
+void CollectSymbols(const TypeProto& type, std::unordered_set<std::string>& symbols) {
+  const TensorShapeProto* shape = nullptr;
+  switch (type.value_case()) {
+    case TypeProto::kTensorType:
+      shape = type.tensor_type().has_shape() ? &type.tensor_type().shape() : nullptr;
+      break;
+    case TypeProto::kSparseTensorType:
+      shape = type.sparse_tensor_type().has_shape() ? &type.sparse_tensor_type().shape() : nullptr;
+      break;
+    case TypeProto::kSequenceType:
+      CollectSymbols(type.sequence_type().elem_type(), symbols);
+      break;
+    case TypeProto::kOptionalType:
+      CollectSymbols(type.optional_type().elem_type(), symbols);
+      break;
+    case TypeProto::kMapType:
+      CollectSymbols(type.map_type().value_type(), symbols);
+      break;
+    default:
+      break;
+  }
+  if (shape) {
+    for (const auto& dim : shape->dim()) {
+      if (dim.has_dim_param()) {
+        symbols.insert(dim.dim_param());
+      }
+    }
+  }
+}
+
+// Returns the key of a call of func_proto in the function inference cache: the function,
+// the input types and the attribute values. Returns an empty key if the call cannot be
+// cached, as its result may depend on the data of its inputs.
+std::string GetFunctionCallKey(const FunctionProto& func_proto, InferenceContext& ctx) {
+  std::string key = to_string(reinterpret_cast<uintptr_t>(&func_proto));
+  key += ':';
+  key += to_string(ctx.getNumInputs());
+  std::string serialized;
+  for (size_t i = 0; i < ctx.getNumInputs(); ++i) {
+    if (ctx.getInputData(i) || ctx.getInputSparseData(i)) {
+      return "";
+    }
+    const TypeProto* type = ctx.getInputType(i);
+    serialized.clear();
+    if (type) {
+      type->SerializeToString(&serialized);
+    }
+    key += '\0' + to_string(serialized.size()) + ':' + serialized;
+  }
+  for (const auto& attr_name : func_proto.attribute()) {
+    const AttributeProto* attr = ctx.getAttribute(attr_name);
+    serialized.clear();
+    if (attr) {
+      attr->SerializeToString(&serialized);
+    }
+    key += '\0' + to_string(serialized.size()) + ':' + serialized;
+  }
+  return key;
+}
+
+// Runs task(0) to task(count - 1) on num_threads threads, or on one per core if num_threads
+// is not positive. task must not throw.
+void RunInParallel(int count, int num_threads, const std::function<void(int)>& task) {
+  if (num_threads <= 0) {
+    num_threads = static_cast<int>(std::max(1u, std::thread::hardware_concurrency()));
+  }
+  std::atomic<int> next{0};
+  auto worker = [&]() {
+    for (int i = next++; i < count; i = next++) {
+      task(i);
+    }
+  };
+  std::vector<std::thread> workers;
+  for (int t = 1; t < std::min(count, num_threads); ++t) {
+    workers.emplace_back(worker);
+  }
+  worker();
+  for (auto& thread : workers) {
+    thread.join();
+  }
+}
+
+void RenameSymbols(TypeProto& type, const std::unordered_map<std::string, std::string>& symbols) {
+  TensorShapeProto* shape = nullptr;
+  switch (type.value_case()) {
+    case TypeProto::kTensorType:
+      shape = type.tensor_type().has_shape() ? type.mutable_tensor_type()->mutable_shape() : nullptr;
+      break;
+    case TypeProto::kSparseTensorType:
+      shape = type.sparse_tensor_type().has_shape() ? type.mutable_sparse_tensor_type()->mutable_shape() : nullptr;
+      break;
+    case TypeProto::kSequenceType:
+      RenameSymbols(*type.mutable_sequence_type()->mutable_elem_type(), symbols);
+      break;
+    case TypeProto::kOptionalType:
+      RenameSymbols(*type.mutable_optional_type()->mutable_elem_type(), symbols);
+      break;
+    case TypeProto::kMapType:
+      RenameSymbols(*type.mutable_map_type()->mutable_value_type(), symbols);
+      break;
+    default:
+      break;
+  }
+  if (shape) {
+    for (auto& dim : *shape->mutable_dim()) {
+      if (dim.has_dim_param()) {
+        auto iter = symbols.find(dim.dim_param());
+        if (iter != symbols.end()) {
+          dim.set_dim_param(iter->second);
+        }
+      }
+    }
+  }
+}
+
+// Renames symbols in the types of the values of g and of its subgraphs
+void RenameSymbols(GraphProto& g, const std::unordered_map<std::string, std::string>& symbols) {
+  if (symbols.empty()) {
+    return;
+  }
+  for (auto* values : {g.mutable_input(), g.mutable_output(), g.mutable_value_info()}) {
+    for (auto& value : *values) {
+      if (value.has_type()) {
+        RenameSymbols(*value.mutable_type(), symbols);
+      }
+    }
+  }
+  for (auto& n : *g.mutable_node()) {
+    for (auto& attr : *n.mutable_attribute()) {
+      if (attr.has_g()) {
+        RenameSymbols(*attr.mutable_g(), symbols);
+      }
+      for (auto& subgraph : *attr.mutable_graphs()) {
+        RenameSymbols(subgraph, symbols);
+      }
+    }
+  }
+}
+
+// Result of a function call inferred ahead of its turn on another thread
+struct PrefetchedFunctionCall {
+  std::vector<TypeProto> output_types;
+  std::unique_ptr<DeferredSymbolTable> symbol_table;
+  std::unique_ptr<FunctionInferenceCache> function_cache;
+  std::exception_ptr error;
+};
+
+// Takes the result of a prefetched function call at its turn
+void ApplyPrefetchedFunctionCall(
+    PrefetchedFunctionCall& call,
+    InferenceContext& ctx,
+    FunctionInferenceCache* function_cache) {
+  if (call.function_cache) {
+    function_cache->merge(*call.function_cache);
+  }
+  if (call.symbol_table) {
+    const auto symbols = call.symbol_table->commit();
+    if (!symbols.empty()) {
+      for (auto& type : call.output_types) {
+        RenameSymbols(type, symbols);
+      }
+    }
+  }
+  if (call.error) {
+    std::rethrow_exception(call.error);
+  }
+  for (size_t i = 0; i < call.output_types.size(); ++i) {
+    ctx.getOutputType(i)->Swap(&call.output_types[i]);
+  }
+}
+
+// Infers the subgraphs of n that take no inputs, such as the branches of If, in parallel
+// ahead of the inference of n, if there are several
+void PrefetchSubgraphInferencing(const NodeProto& n, InferenceContextImpl& ctx, int num_threads) {
+  std::vector<GraphInferencerImpl*> inferencers;
+  for (const auto& attr : n.attribute()) {
+    if (attr.has_g() && attr.g().input_size() == 0) {
+      auto* inferencer = static_cast<GraphInferencerImpl*>(ctx.getGraphAttributeInferencer(attr.name()));
+      if (std::find(inferencers.begin(), inferencers.end(), inferencer) == inferencers.end()) {
+        inferencers.push_back(inferencer);
+      }
+    }
+  }
+  if (inferencers.size() > 1) {
+    GraphInferencerImpl::prefetchInferencing(inferencers, num_threads);
+  }
+}
+
+// Number of nodes after a function call searched for independent calls to infer with it
+constexpr int kFunctionCallPrefetchDistance = 256;
+
+} // namespace
+
+template<class T>
+void CheckTensorShapesAndTypes(const T& inferred_type, const T& existing_type) {
+  if (inferred_type.elem_type() != TensorProto::UNDEFINED && existing_type.elem_type() != TensorProto::UNDEFINED &&
+      existing_type.elem_type() != inferred_type.elem_type()) {
+    std::stringstream ss;
+    ss << "Inferred elem type differs from existing elem type: (" << GetElemTypeString(inferred_type) << ") vs ("
+       << GetElemTypeString(existing_type) << ")";
+    fail_type_inference(ss.str());
+  }
+
+  if (!inferred_type.has_shape() || !existing_type.has_shape()) {
+    return;
+  }
+
+  if (inferred_type.shape().dim_size() != existing_type.shape().dim_size()) {
+    std::stringstream ss;
+    ss << "Inferred shape and existing shape differ in rank: (" << inferred_type.shape().dim_size() << ") vs ("
+       << existing_type.shape().dim_size() << ")";
+    fail_shape_inference(ss.str());
+  }
+
+  for (int i = 0; i < inferred_type.shape().dim_size(); ++i) {
+    const auto& inferred_dim = inferred_type.shape().dim(i);
+    const auto& existing_dim = existing_type.shape().dim(i);
+    if (inferred_dim.has_dim_value() && existing_dim.has_dim_value() &&
+        inferred_dim.dim_value() != existing_dim.dim_value()) {
+      std::stringstream ss;
+      ss << "Inferred shape and existing shape differ in dimension " << i << ": (" << inferred_dim.dim_value()
+         << ") vs (" << existing_dim.dim_value() << ")";
+      fail_shape_inference(ss.str());
+    }
+  }
+}
+
+void checkShapesAndTypes(const TypeProto& inferred_type, const TypeProto& existing_type) {
+  const auto inferred_value_case = inferred_type.value_case();
+  const auto existing_value_case = existing_type.value_case();
+  if (inferred_value_case == TypeProto::ValueCase::VALUE_NOT_SET ||
+      existing_value_case == TypeProto::ValueCase::VALUE_NOT_SET) {
+    // nothing to check; will assign inferredType to undefined existingType
+    return;
+  }
+  if (inferred_value_case != existing_value_case) {
+    fail_type_inference(
+        "type case mismatch. existing=",
+        GetValueCaseString(existing_type),
+        " inferred=",
+        GetValueCaseString(inferred_type));
+  }
+
+  if (inferred_value_case == TypeProto::kTensorType && existing_value_case == TypeProto::kTensorType) {
+    CheckTensorShapesAndTypes(inferred_type.tensor_type(), existing_type.tensor_type());
+  } else if (inferred_value_case == TypeProto::kSparseTensorType && existing_value_case == TypeProto::kSparseTensorType) {
+    CheckTensorShapesAndTypes(inferred_type.sparse_tensor_type(), existing_type.sparse_tensor_type());
+  } else if (inferred_value_case == TypeProto::kSequenceType && existing_value_case == TypeProto::kSequenceType) {
+    checkShapesAndTypes(inferred_type.sequence_type().elem_type(), existing_type.sequence_type().elem_type());
+  } else if (inferred_value_case == TypeProto::kOptionalType && existing_value_case == TypeProto::kOptionalType) {
+    checkShapesAndTypes(inferred_type.optional_type().elem_type(), existing_type.optional_type().elem_type());
+  } else if (inferred_value_case == TypeProto::TypeProto::kMapType && existing_value_case == TypeProto::TypeProto::kMapType) {
+    if (inferred_type.map_type().key_type() != existing_type.map_type().key_type()) {
+      fail_type_inference(
+          "key type mismatch from MapProto. existing=",
+          Utils::DataTypeUtils::ToDataTypeString(existing_type.map_type().key_type()),
+          " inferred=",
+          Utils::DataTypeUtils::ToDataTypeString(inferred_type.map_type().key_type()));
+    }
+    checkShapesAndTypes(inferred_type.map_type().value_type(), existing_type.map_type().value_type());
+  } else {
+    fail_type_inference("type case unsupported. existing=", existing_value_case, " inferred=", inferred_value_case);
+  }
+}
+
+void mergeShapesAndTypes(const TypeProto_Tensor& inferred_type, TypeProto_Tensor* existing_type) {
+  if (existing_type->elem_type() == TensorProto::UNDEFINED) {
+    existing_type->set_elem_type(inferred_type.elem_type());
+  }
+
+  if (!inferred_type.has_shape()) {
+    return;
+  }
+
+  if (!existing_type->has_shape()) {
+    *existing_type->mutable_shape() = inferred_type.shape();
+    return;
+  }
+
+  for (int i = 0; i < inferred_type.shape().dim_size(); ++i) {
+    const auto& inferred_dim = inferred_type.shape().dim(i);
+    auto* existing_dim = existing_type->mutable_shape()->mutable_dim(i);
+    if ((!existing_dim->has_dim_value() && !existing_dim->has_dim_param()) ||
+        inferred_dim.has_dim_value()) {
+      *existing_dim = inferred_dim;
+    }
+  }
+}
+
+void mergeShapesAndTypes(const TypeProto_SparseTensor& inferred_type, TypeProto_SparseTensor* existing_type) {
+  if (existing_type->elem_type() == TensorProto::UNDEFINED) {
+    existing_type->set_elem_type(inferred_type.elem_type());
+  }
+
+  if (!inferred_type.has_shape()) {
+    return;
+  }
+
+  if (!existing_type->has_shape()) {
+    *existing_type->mutable_shape() = inferred_type.shape();
+    return;
+  }
+
+  for (int i = 0; i < inferred_type.shape().dim_size(); ++i) {
+    const auto& inferred_dim = inferred_type.shape().dim(i);
+    auto* existing_dim = existing_type->mutable_shape()->mutable_dim(i);
+    if ((!existing_dim->has_dim_value() && !existing_dim->has_dim_param()) ||
+        inferred_dim.has_dim_value()) {
+      *existing_dim = inferred_dim;
+    }
+  }
+}
+
+void mergeShapesAndTypes(const TypeProto& inferred_type, TypeProto* existing_type) {
+  // Check before merge
+  checkShapesAndTypes(inferred_type, *existing_type);
+  const auto inferred_val_case = inferred_type.value_case();
+  if (inferred_val_case == TypeProto::kTensorType) {
+    mergeShapesAndTypes(inferred_type.tensor_type(), existing_type->mutable_tensor_type());
+  } else if (inferred_val_case == TypeProto::kSparseTensorType) {
+    mergeShapesAndTypes(inferred_type.sparse_tensor_type(), existing_type->mutable_sparse_tensor_type());
+  } else if (inferred_val_case == TypeProto::kSequenceType) {
+    mergeShapesAndTypes(
+        inferred_type.sequence_type().elem_type(), existing_type->mutable_sequence_type()->mutable_elem_type());
+  } else if (inferred_val_case == TypeProto::kOptionalType) {
+    mergeShapesAndTypes(
+        inferred_type.optional_type().elem_type(), existing_type->mutable_optional_type()->mutable_elem_type());
+  } else if (inferred_val_case == TypeProto::kMapType) {
+    mergeShapesAndTypes(
+      inferred_type.map_type().value_type(), existing_type->mutable_map_type()->mutable_value_type());
+  }
+}
+
+// TypeProto_Tensor or TypeProto_SparseTensor
+template <typename TensorTypeProto>
+void GenerateSymbolicShape(TensorTypeProto* inferred_type, SymbolTable& symbol_table) {
+  if (!inferred_type->has_shape()) {
+    return;
+  }
+  for (int i = 0; i < inferred_type->shape().dim_size(); ++i) {
+    // set a symbol if it doesn't have dim_value and dim_param
+    auto* dim = inferred_type->mutable_shape()->mutable_dim(i);
+    if (!dim->has_dim_value() && !dim->has_dim_param()) {
+      dim->set_dim_param(symbol_table.createNew("unk__"));
+    }
+  }
+}
+
+void MaterializeSymbolicShape(TypeProto* inferred_type, SymbolTable& symbol_table) {
+  const auto inferred_val_case = inferred_type->value_case();
+  if (inferred_val_case == TypeProto::ValueCase::VALUE_NOT_SET) {
+    return;
+  }
+
+  if (inferred_val_case == TypeProto::kTensorType) {
+    GenerateSymbolicShape(inferred_type->mutable_tensor_type(), symbol_table);
+  } else if (inferred_val_case == TypeProto::kSparseTensorType) {
+    GenerateSymbolicShape(inferred_type->mutable_sparse_tensor_type(), symbol_table);
+  } else if (inferred_val_case == TypeProto::kSequenceType) {
+    MaterializeSymbolicShape(inferred_type->mutable_sequence_type()->mutable_elem_type(), symbol_table);
+  } else if (inferred_val_case == TypeProto::kOptionalType) {
+    MaterializeSymbolicShape(inferred_type->mutable_optional_type()->mutable_elem_type(), symbol_table);
+  } else {
+    fail_shape_inference("type case unsupported for symbolic shape inference. inferred=", inferred_val_case);
+  }
+}
+
+std::string GetModelLocalFunctionsMapIdentifier(const std::string& domain, const std::string& func_name) {
+  return domain + ":" + func_name;
+}
+
+static void InferShapesImpl(
+    GraphProto* g,
+    const std::unordered_map<std::string, TypeProto*>& outer_scope_value_types_by_name,
+    const std::unordered_map<std::string, int>& opset_imports,
+    const ShapeInferenceOptions& options,
+    SymbolTable* symbol_table,
+    const ModelLocalFunctionsMap& model_local_functions_map,
+    const ISchemaRegistry* schema_registry = OpSchemaRegistry::Instance(),
+    const int ir_version = IR_VERSION, // default the latest one
+    // If not null, only the nodes flagged are inferred, the others keep their existing types
+    const std::vector<bool>* nodes_to_infer = nullptr,
+    FunctionInferenceCache* function_cache = nullptr,
+    int num_threads = 1
+) {
+  std::unordered_map<std::string, TypeProto*> value_types_by_name{outer_scope_value_types_by_name};
+  std::unordered_map<std::string, TypeProto*> undefined_value_types_by_name{outer_scope_value_types_by_name};
+  std::unordered_map<std::string, TensorShapeProto> generated_shape_data_by_name;
+
+  GraphInferenceContext graph_inference_context{
+      value_types_by_name,
+      opset_imports,
+      symbol_table,
+      schema_registry,
+      ir_version,
+      model_local_functions_map,
+      function_cache,
+      num_threads};
+  for (auto& vi : *g->mutable_value_info()) {
+    if (vi.has_type()) {
+      value_types_by_name[vi.name()] = vi.mutable_type();
+    }
+  }
+  for (auto& vi : *g->mutable_input()) {
+    if (vi.has_type()) {
+      value_types_by_name[vi.name()] = vi.mutable_type();
+    }
+  }
+  for (auto& vi : *g->mutable_output()) {
+    if (vi.has_type()) {
+      value_types_by_name[vi.name()] = vi.mutable_type();
+    } else {
+      // Some output type might be undefined in subgraph. e.g., Loop Op
+      // Saving names of outputs with undefined types to allow assigning inferred types to them
+      undefined_value_types_by_name[vi.name()] = vi.mutable_type();
+    }
+  }
+
+  // Holds the contructed type protos for graph initializers
+  std::list<TypeProto> initializer_type_list;
+  // Create TypeProtos for all graph initializers including sparse initializers
+  std::unordered_map<std::string, const TensorProto*> input_data_by_name;
+  for (const auto& tp : g->initializer()) {
+    input_data_by_name[tp.name()] = &tp;
+    TypeProto initializer_type;
+    TypeProto_Tensor* initializer_tensor_type = initializer_type.mutable_tensor_type();
+    initializer_tensor_type->set_elem_type(tp.data_type());
+    // set the shape according to the initializer shape info
+    auto* shape = initializer_tensor_type->mutable_shape();
+    for (int i = 0; i < tp.dims_size(); ++i) {
+      shape->add_dim()->set_dim_value(tp.dims(i));
+    }
+
+    auto iter = value_types_by_name.find(tp.name());
+    // If it already exists in input, check input and initializer is sync
+    // use shape info from input (input has priority over initializer)
+    if (iter != value_types_by_name.end()) {
+      CheckTensorShapesAndTypes(*initializer_tensor_type, *iter->second->mutable_tensor_type());
+    }
+    // Support IR>=4: some tensors can only exist in initializer and not in input
+    // So shape_inference should make use of initializer shapes
+    // Store initializer shape info in value_info as well
+    else if (ir_version >= 4) {
+      initializer_type_list.push_back(std::move(initializer_type));
+      value_types_by_name[tp.name()] = &initializer_type_list.back();
+    }
+  }
+
+  std::unordered_map<std::string, const SparseTensorProto*> input_sparse_data_by_name;
+  for (const auto& tp : g->sparse_initializer()) {
+    const auto& name = tp.values().name();
+    input_sparse_data_by_name[name] = &tp;
+    // Create TypeProto for sparse initializer
+    TypeProto initializer_type;
+    auto* initializer_sparse_tensor_type = initializer_type.mutable_sparse_tensor_type();
+    initializer_sparse_tensor_type->set_elem_type(tp.values().data_type());
+    // set the shape according to the initializer shape info
+    auto* shape = initializer_sparse_tensor_type->mutable_shape();
+    for (int i = 0; i < tp.dims_size(); ++i) {
+      shape->add_dim()->set_dim_value(tp.dims(i));
+    }
+
+    auto iter = value_types_by_name.find(name);
+    // If it already exists in input, check input and initializer is sync
+    // use shape info from input (input has priority over initializer)
+    if (iter != value_types_by_name.end()) {
+      CheckTensorShapesAndTypes(*initializer_sparse_tensor_type, *iter->second->mutable_sparse_tensor_type());
+    }
+    // Support IR>=4: some tensors can only exist in initializer and not in input
+    // So shape_inference should make use of initializer shapes
+    // Store initializer shape info in value_info as well
+    else if (ir_version >= 4) {
+      initializer_type_list.push_back(std::move(initializer_type));
+      value_types_by_name[name] = &initializer_type_list.back();
+    }
+  }
+
+  bool has_experimental_op = false;
+  // Collect data from constant nodes and check if any experimental ops exist
+  for (const auto& n : g->node()) {
+    if (checker::check_is_experimental_op(n.op_type())) {
+      has_experimental_op = true;
+    } else if (n.op_type() == "Constant" &&  n.output().size() == 1) {
+      for (const auto& attr : n.attribute()) {
+        if (attr.name() == "value") {
+          if (attr.type() == AttributeProto::TENSOR && attr.has_t()) {
+            input_data_by_name[n.output(0)] = &attr.t();
+          } else if (attr.type() == AttributeProto::SPARSE_TENSOR && attr.has_sparse_tensor()) {
+            input_sparse_data_by_name[n.output(0)] = &attr.sparse_tensor();
+          }
+        }
+      }
+    }
+  }
+
+  // Function calls whose inputs are all available are inferred on several threads ahead of
+  // their turn, except with data propagation, which records shape data as it goes.
+  // Each one takes its result at its turn.
+  const bool prefetch_function_calls = num_threads != 1 && !options.enable_data_propagation;
+  std::unordered_map<int, PrefetchedFunctionCall> prefetched_calls;
+  // Function called by each node that may be prefetched, and the indices of these nodes
+  std::vector<const FunctionProto*> called_functions;
+  std::vector<int> function_calls;
+  // Index of the first node at whose turn all the inputs of each node are available
+  std::vector<int> ready_at;
+  if (prefetch_function_calls) {
+    std::unordered_map<std::string, int> producers;
+    for (int node_index = 0; node_index < g->node_size(); ++node_index) {
+      for (const auto& output : g->node(node_index).output()) {
+        producers.emplace(output, node_index);
+      }
+    }
+    called_functions.resize(g->node_size(), nullptr);
+    ready_at.resize(g->node_size(), 0);
+    for (int node_index = 0; node_index < g->node_size(); ++node_index) {
+      const auto& n = g->node(node_index);
+      for (const auto& input : n.input()) {
+        auto producer = producers.find(input);
+        if (producer != producers.end()) {
+          ready_at[node_index] = std::max(ready_at[node_index], producer->second + 1);
+        }
+      }
+      if (nodes_to_infer && !(*nodes_to_infer)[node_index]) {
+        continue;
+      }
+      bool has_subgraph = false;
+      for (const auto& attr : n.attribute()) {
+        has_subgraph = has_subgraph || attr.has_g() || attr.graphs_size() > 0;
+      }
+      auto dit = opset_imports.find(n.domain());
+      if (has_subgraph || dit == opset_imports.end()) {
+        continue;
+      }
+      const auto schema = schema_registry->GetSchema(n.op_type(), dit->second, n.domain());
+      if (schema) {
+        if (!schema->has_type_and_shape_inference_function() && schema->HasFunction()) {
+          called_functions[node_index] = schema->GetFunction();
+        }
+      } else {
+        auto iter = model_local_functions_map.find(GetModelLocalFunctionsMapIdentifier(n.domain(), n.op_type()));
+        if (iter != model_local_functions_map.end()) {
+          called_functions[node_index] = iter->second;
+        }
+      }
+      if (called_functions[node_index]) {
+        function_calls.push_back(node_index);
+      }
+    }
+  }
+  // Infers the calls on several threads and records their results
+  auto infer_function_calls = [&](const std::vector<int>& calls,
+                                  std::vector<std::unique_ptr<InferenceContextImpl>>& contexts) {
+    std::vector<PrefetchedFunctionCall> results(calls.size());
+    for (auto& result : results) {
+      if (symbol_table) {
+        result.symbol_table.reset(new DeferredSymbolTable(symbol_table));
+      }
+      if (function_cache) {
+        result.function_cache.reset(new FunctionInferenceCache(function_cache));
+      }
+    }
+    RunInParallel(static_cast<int>(calls.size()), num_threads, [&](int i) {
+      ONNX_TRY {
+        InferShapeForFunctionNode(
+            *called_functions[calls[i]],
+            schema_registry,
+            *contexts[i],
+            options,
+            model_local_functions_map,
+            results[i].symbol_table.get(),
+            &generated_shape_data_by_name,
+            results[i].function_cache.get());
+      }
+      ONNX_CATCH(...) {
+        ONNX_HANDLE_EXCEPTION([&]() { results[i].error = std::current_exception(); });
+      }
+      for (size_t output = 0; output < contexts[i]->getNumOutputs(); ++output) {
+        results[i].output_types.push_back(*contexts[i]->getOutputType(output));
+      }
+    });
+    for (size_t i = 0; i < calls.size(); ++i) {
+      prefetched_calls.emplace(calls[i], std::move(results[i]));
+    }
+  };
+  // Prefetches the call at first with the following ones whose inputs are available at its
+  // turn. As in a serial run, calls whose result is cached are left to their turn to hit
+  // the cache, as are the calls with the same key as another one, if its result gets cached.
+  auto prefetch_function_call_batch = [&](int first) {
+    if (!called_functions[first]) {
+      return;
+    }
+    std::vector<int> calls;
+    std::vector<int> duplicate_calls;
+    std::vector<std::unique_ptr<InferenceContextImpl>> contexts;
+    std::vector<std::unique_ptr<InferenceContextImpl>> duplicate_contexts;
+    std::vector<std::string> duplicate_keys;
+    std::unordered_map<std::string, size_t> calls_by_key;
+    for (auto call = std::lower_bound(function_calls.begin(), function_calls.end(), first);
+         call != function_calls.end() && *call < first + kFunctionCallPrefetchDistance;
+         ++call) {
+      if (ready_at[*call] > first || prefetched_calls.count(*call)) {
+        continue;
+      }
+      std::unique_ptr<InferenceContextImpl> ctx(new InferenceContextImpl(
+          *g->mutable_node(*call),
+          value_types_by_name,
+          input_data_by_name,
+          input_sparse_data_by_name,
+          &generated_shape_data_by_name,
+          &graph_inference_context));
+      std::string key;
+      if (function_cache) {
+        key = GetFunctionCallKey(*called_functions[*call], *ctx);
+      }
+      if (!key.empty() && function_cache->contains(key)) {
+        if (*call == first) {
+          return;
+        }
+        continue;
+      }
+      if (!key.empty() && calls_by_key.count(key)) {
+        duplicate_calls.push_back(*call);
+        duplicate_contexts.push_back(std::move(ctx));
+        duplicate_keys.push_back(std::move(key));
+        continue;
+      }
+      if (!key.empty()) {
+        calls_by_key[key] = calls.size();
+      }
+      calls.push_back(*call);
+      contexts.push_back(std::move(ctx));
+    }
+    if (calls.size() + duplicate_calls.size() < 2) {
+      return;
+    }
+    infer_function_calls(calls, contexts);
+
+    // A serial run infers the duplicates again if the result of the first call is not cached
+    std::vector<int> uncached_calls;
+    std::vector<std::unique_ptr<InferenceContextImpl>> uncached_contexts;
+    for (size_t i = 0; i < duplicate_calls.size(); ++i) {
+      const auto& result = prefetched_calls[calls[calls_by_key[duplicate_keys[i]]]];
+      if (!result.function_cache->contains(duplicate_keys[i])) {
+        uncached_calls.push_back(duplicate_calls[i]);
+        uncached_contexts.push_back(std::move(duplicate_contexts[i]));
+      }
+    }
+    infer_function_calls(uncached_calls, uncached_contexts);
+  };
+
+  std::vector<std::string> inference_errors;
+  bool has_unsupported_op = false; // check whether exist unsupported ops
+  for (int node_index = 0; node_index < g->node_size(); ++node_index) {
+    auto& n = *g->mutable_node(node_index);
+    // Resolve domain for node
+    auto dit = opset_imports.find(n.domain());
+    if (dit == opset_imports.end()) {
+      fail_type_inference("Cannot infer type and shape for node name ", n.name(), ". No opset import for domain",
+          n.domain(), " optype ", n.op_type());
+    }
+    auto domain_version = dit->second;
+    const auto schema = schema_registry->GetSchema(n.op_type(), domain_version, n.domain());
+    if (nodes_to_infer && !(*nodes_to_infer)[node_index]) {
+      if (!schema &&
+          model_local_functions_map.find(GetModelLocalFunctionsMapIdentifier(n.domain(), n.op_type())) ==
+              model_local_functions_map.end()) {
+        has_unsupported_op = true;
+      }
+      // Downstream nodes may still need the shape data of the outputs of this one
+      if (options.enable_data_propagation && schema && schema->has_data_propagation_function()) {
+        ONNX_TRY {
+          DataPropagationContextImpl data_propagation_ctx(
+              n, value_types_by_name, input_data_by_name, generated_shape_data_by_name);
+          schema->GetDataPropagationFunction()(data_propagation_ctx);
+        }
+        ONNX_CATCH(const std::runtime_error& err) {
+          ONNX_HANDLE_EXCEPTION([&]() { fail_shape_inference(GetErrorWithNodeInfo(n, err)); });
+        }
+      }
+      continue;
+    }
+    InferenceContextImpl ctx(
+        n,
+        value_types_by_name,
+        input_data_by_name,
+        input_sparse_data_by_name,
+        &generated_shape_data_by_name,
+        &graph_inference_context);
+
+    ONNX_TRY {
+      if (prefetch_function_calls && !prefetched_calls.count(node_index)) {
+        prefetch_function_call_batch(node_index);
+      }
+      auto prefetched_call = prefetched_calls.find(node_index);
+      if (prefetched_call != prefetched_calls.end()) {
+        PrefetchedFunctionCall call = std::move(prefetched_call->second);
+        prefetched_calls.erase(prefetched_call);
+        ApplyPrefetchedFunctionCall(call, ctx, function_cache);
+      } else if (schema) {
+        if (schema->has_type_and_shape_inference_function()) {
+          if (num_threads != 1) {
+            PrefetchSubgraphInferencing(n, ctx, num_threads);
+          }
+          schema->GetTypeAndShapeInferenceFunction()(ctx);
+        } else if (schema->HasFunction()) {
+          InferShapeForFunctionNode(
+              *(schema->GetFunction()),
+              schema_registry,
+              ctx,
+              options,
+              model_local_functions_map,
+              symbol_table,
+              &generated_shape_data_by_name,
+              function_cache);
+        } else {
+          // Continue with inference for remaining nodes
+          continue;
+        }
+      } else if (model_local_functions_map.size() > 0) {
+        auto iter = model_local_functions_map.find(GetModelLocalFunctionsMapIdentifier(n.domain(), n.op_type()));
+        if (iter != model_local_functions_map.end()) {
+          InferShapeForFunctionNode(
+              *(iter->second),
+              schema_registry,
+              ctx,
+              options,
+              model_local_functions_map,
+              symbol_table,
+              &generated_shape_data_by_name,
+              function_cache);
+        } else {
+          has_unsupported_op = true;
+          continue;
+        }
+      } else {
+        has_unsupported_op = true;
+        continue;
+      }
+    }
+    ONNX_CATCH(const ONNX_NAMESPACE::InferenceError& ex) {
+      ONNX_HANDLE_EXCEPTION([&]() {
+        // onnx does not support unsupported/experimental operators
+        // so it won't consider it as an error
+        if (!has_unsupported_op && !has_experimental_op) {
+          inference_errors.push_back(GetErrorWithNodeInfo(n, ex));
+        }
+      });
+      // Continue with inference for remaining nodes
+      continue;
+    }
+
+    ONNX_TRY {
+      // check the type-equality for input and output
+      if (options.check_type && schema) {
+        schema->CheckInputOutputType(ctx);
+      }
+
+      for (int i = 0; i < n.output_size(); ++i) {
+        // skip type and shape propagation for missing optional outputs.
+        if (n.output(i).empty()) {
+          continue;
+        }
+        auto* inferred_type = ctx.getOutputType(i);
+        if (inferred_type->value_case() == TypeProto::ValueCase::VALUE_NOT_SET) {
+          continue;
+        }
+
+        if (symbol_table) {
+          MaterializeSymbolicShape(inferred_type, *symbol_table);
+        }
+
+        // Find any pre-existing type and shape info. If there is such,
+        // then check for compatibility with the inferred
+        // information. Otherwise, initialize it in an empty state.
+        auto iter = value_types_by_name.find(n.output(i));
+        TypeProto* existing_type = nullptr;
+        if (iter != value_types_by_name.end()) {
+          existing_type = iter->second;
+        } else {
+          // Create a new value_info if defined type does not exist
+          auto vi = g->add_value_info();
+          vi->set_name(n.output(i));
+          existing_type = vi->mutable_type();
+          // For undefined output type, update both value_info and output for now
+          // Update existing output with undefined type: assign inferred type to it
+          iter = undefined_value_types_by_name.find(n.output(i));
+          if (iter != undefined_value_types_by_name.end()) {
+            *iter->second = *inferred_type;
+          }
+        }
+
+        // Now we can merge pre-existing and inferred info
+        mergeShapesAndTypes(*inferred_type, existing_type);
+
+        // If data propagation is enabled, propagate shape data if it exists.
+        if (options.enable_data_propagation && schema && schema->has_data_propagation_function()) {
+          DataPropagationContextImpl data_propagation_ctx(
+              n, value_types_by_name, input_data_by_name, generated_shape_data_by_name);
+          schema->GetDataPropagationFunction()(data_propagation_ctx);
+        }
+
+        // Make merged info available to further inference.
+        value_types_by_name[n.output(i)] = existing_type;
+      }
+    }
+    ONNX_CATCH(const std::runtime_error& err) {
+      ONNX_HANDLE_EXCEPTION([&]() { fail_shape_inference(GetErrorWithNodeInfo(n, err)); });
+    }
+  }
+  // Throw shape inference error if any. Error mode right now only supports 0 and 1. 
+  // When set to 0, any node level shape inference errors are not thrown. This is to support backward compatiblity
+  // with 1.7 and earlier releases. When set to 1 it will throw all exceptions.
+  // TODO: Add a more granular way for exception handling.
+  if (options.error_mode > 0 && !inference_errors.empty()) {
+    std::string full_errors = "Shape inference error(s): ";
+    for (const std::string& error : inference_errors) {
+      full_errors += error + "\n";
+    }
+    fail_shape_inference(full_errors);
+  }
+}
+
+void InferShapes(
+    GraphProto* g,
+    const std::unordered_map<std::string, int>& opset_imports,
+    const ISchemaRegistry* schema_registry,
+    const ShapeInferenceOptions& options,
+    const std::unordered_map<std::string, const FunctionProto*>& model_local_functions) {
+  SymbolTableImpl symbol_table;
+  TraverseGraphsToAddExistingSymbols(*g, symbol_table);
+  FunctionInferenceCache function_cache;
+  InferShapesImpl(
+      g,
+      std::unordered_map<std::string, TypeProto*>(0),
+      opset_imports,
+      options,
+      &symbol_table,
+      model_local_functions,
+      schema_registry,
+      IR_VERSION,
+      nullptr,
+      &function_cache);
+}
+
+namespace {
+
+// Whether node n, or a node in one of its subgraphs, has an input in names
+bool HasInputIn(const NodeProto& n, const std::unordered_set<std::string>& names) {
+  for (const auto& input : n.input()) {
+    if (names.count(input)) {
+      return true;
+    }
+  }
+  for (const auto& attr : n.attribute()) {
+    if (attr.has_g()) {
+      for (const auto& subgraph_node : attr.g().node()) {
+        if (HasInputIn(subgraph_node, names)) {
+          return true;
+        }
+      }
+    }
+    for (const auto& subgraph : attr.graphs()) {
+      for (const auto& subgraph_node : subgraph.node()) {
+        if (HasInputIn(subgraph_node, names)) {
+          return true;
+        }
+      }
+    }
+  }
+  return false;
+}
+
+// Clears the types inferred in a subgraph: its value_info and the shapes of its outputs
+void ClearInferredTypes(GraphProto& g) {
+  g.clear_value_info();
+  for (auto& output : *g.mutable_output()) {
+    if (output.type().has_tensor_type()) {
+      output.mutable_type()->mutable_tensor_type()->clear_shape();
+    }
+  }
+  for (auto& n : *g.mutable_node()) {
+    for (auto& attr : *n.mutable_attribute()) {
+      if (attr.has_g()) {
+        ClearInferredTypes(*attr.mutable_g());
+      }
+      for (auto& subgraph : *attr.mutable_graphs()) {
+        ClearInferredTypes(subgraph);
+      }
+    }
+  }
+}
+
+void InferShapesForModel(
+    ModelProto& m,
+    const ISchemaRegistry* schema_registry,
+    const ShapeInferenceOptions& options,
+    const std::vector<bool>* nodes_to_infer,
+    FunctionInferenceStats* function_stats = nullptr,
+    int num_threads = 1) {
+  std::unordered_map<std::string, int> opset_imports;
+  for (const auto& opset_import : m.opset_import()) {
+    opset_imports[opset_import.domain()] = static_cast<int>(opset_import.version());
+  }
+
+  ModelLocalFunctionsMap model_local_functions_by_id;
+  for (const auto& function_proto : m.functions()) {
+    model_local_functions_by_id.insert(
+        {GetModelLocalFunctionsMapIdentifier(function_proto.domain(), function_proto.name()), &function_proto});
+  }
+
+  auto* g = m.mutable_graph();
+  SymbolTableImpl symbol_table;
+  TraverseGraphsToAddExistingSymbols(*g, symbol_table);
+  FunctionInferenceCache function_cache;
+  InferShapesImpl(
+      g,
+      std::unordered_map<std::string, TypeProto*>(0),
+      opset_imports,
+      options,
+      &symbol_table,
+      model_local_functions_by_id,
+      schema_registry,
+      m.ir_version(),
+      nodes_to_infer,
+      &function_cache,
+      num_threads);
+  if (function_stats) {
+    *function_stats = function_cache.stats();
+  }
+}
+
+} // namespace
+
+void InferShapes(
+    ModelProto& m,
+    const ISchemaRegistry* schema_registry,
+    const ShapeInferenceOptions& options,
+    FunctionInferenceStats* function_stats,
+    int num_threads) {
+  InferShapesForModel(m, schema_registry, options, nullptr, function_stats, num_threads);
+}
+
+void InferShapesIncrementally(
+    ModelProto& m,
+    const std::vector<int>& changed_nodes,
+    const ISchemaRegistry* schema_registry,
+    const ShapeInferenceOptions& options) {
+  auto* g = m.mutable_graph();
+  std::vector<bool> nodes_to_infer(g->node_size(), false);
+  for (int node_index : changed_nodes) {
+    if (node_index < 0 || node_index >= g->node_size()) {
+      fail_shape_inference("Changed node index ", node_index, " is out of range [0, ", g->node_size(), ")");
+    }
+    nodes_to_infer[node_index] = true;
+  }
+
+  // The nodes downstream of a changed node are inferred again, as their outputs may change with it
+  std::unordered_set<std::string> changed_values;
+  for (int node_index = 0; node_index < g->node_size(); ++node_index) {
+    const auto& n = g->node(node_index);
+    if (!nodes_to_infer[node_index] && !HasInputIn(n, changed_values)) {
+      continue;
+    }
+    nodes_to_infer[node_index] = true;
+    for (const auto& output : n.output()) {
+      if (!output.empty()) {
+        changed_values.insert(output);
+      }
+    }
+  }
+
+  // Their existing types are stale, as are the types inferred in their subgraphs
+  for (int node_index = 0; node_index < g->node_size(); ++node_index) {
+    if (!nodes_to_infer[node_index]) {
+      continue;
+    }
+    for (auto& attr : *g->mutable_node(node_index)->mutable_attribute()) {
+      if (attr.has_g()) {
+        ClearInferredTypes(*attr.mutable_g());
+      }
+      for (auto& subgraph : *attr.mutable_graphs()) {
+        ClearInferredTypes(subgraph);
+      }
+    }
+  }
+  auto* value_info = g->mutable_value_info();
+  value_info->erase(
+      std::remove_if(
+          value_info->begin(),
+          value_info->end(),
+          [&](const ValueInfoProto& vi) { return changed_values.count(vi.name()) > 0; }),
+      value_info->end());
+
+  InferShapesForModel(m, schema_registry, options, &nodes_to_infer);
+}
+
+void InferShapes(
+    const std::string& model_path,
+    const std::string& save_path,
+    const ISchemaRegistry* schema_registry,
+    const ShapeInferenceOptions& options) {
+  ModelProto model;
+  std::fstream model_stream(model_path, std::ios::in | std::ios::binary);
+  if (!model_stream.good()) {
+    fail_check("Unable to open model file:", model_path, ". Please check if it is a valid file.");
+  }
+  std::string data{std::istreambuf_iterator<char>{model_stream}, std::istreambuf_iterator<char>{}};
+  if (!ParseProtoFromBytes(&model, data.c_str(), data.size())) {
+    fail_check(
+        "Unable to parse model from file:", model_path, ". Please check if it is a valid protobuf file of model.");
+  }
+  InferShapes(model, schema_registry, options);
+  // Save the inferred model to the original model path
+  // Use SerializeToString instead of SerializeToOstream due to LITE_PROTO
+  std::fstream output(save_path, std::ios::out | std::ios::trunc | std::ios::binary);
+  std::string model_string;
+  ONNX_TRY {
+    model.SerializeToString(&model_string);
+    output << model_string;
+  }
+  ONNX_CATCH(...) {
+    fail_check("Unable to save inferred model to the target path:", save_path);
+  }
+}
+
+// Infer shape for functions.
+void InferShapeForFunctionNode(
+    const FunctionProto& func_proto,
+    const std::unordered_map<std::string, int>& func_opset_imports,
+    const ISchemaRegistry* schema_registry,
+    InferenceContext& ctx,
+    const ShapeInferenceOptions& options,
+    const std::unordered_map<std::string, const FunctionProto*>& model_local_functions_map,
+    SymbolTable* symbol_table,
+    std::unordered_map<std::string, TensorShapeProto>* generated_shape_data_by_name,
+    FunctionInferenceCache* function_cache) {
+
+  if (options.enable_data_propagation && generated_shape_data_by_name == nullptr) {
+    fail_shape_inference(
+        "Container for generated shape data cannot be nullptr when enable_data_propagation option is set.");
+  }
+
+  // Data propagation records the shape data of the values in the function body as it goes
+  std::string cache_key;
+  if (function_cache && !options.enable_data_propagation) {
+    cache_key = GetFunctionCallKey(func_proto, ctx);
+  }
+  if (!cache_key.empty()) {
+    const auto* output_types = function_cache->find(cache_key);
+    if (output_types) {
+      for (size_t i = 0; i < output_types->size(); ++i) {
+        ctx.getOutputType(i)->CopyFrom((*output_types)[i]);
+      }
+      return;
+    }
+  } else if (function_cache) {
+    function_cache->countUncached();
+  }
+
+  GraphProto g;
+  // Get a temporary tensor-shape map
+  const auto num_func_inputs = func_proto.input_size();
+  std::unordered_map<std::string, TypeProto*> value_types_by_name;
+  std::vector<TypeProto> types_cache(func_proto.input_size());
+  for (int i = 0; i < num_func_inputs; ++i) {
+    types_cache[i] = *ctx.getInputType(i);
+    value_types_by_name[func_proto.input().Get(i)] = &types_cache[i];
+  }
+
+  // Create a temporary initializer value map
+  std::unordered_map<std::string, const TensorProto*> initializers_by_name;
+  std::unordered_map<std::string, const SparseTensorProto*> sparse_initializers_by_name;
+  for (int i = 0; i < static_cast<int>(ctx.getNumInputs()) && i < num_func_inputs; ++i) {
+    const TypeProto* type = ctx.getInputType(i);
+    if (type->value_case() == TypeProto::kTensorType && ctx.getInputData(i) != nullptr) {
+      initializers_by_name[func_proto.input().Get(i)] = ctx.getInputData(i);
+    } else if (type->value_case() == TypeProto::kSparseTensorType && ctx.getInputSparseData(i) != nullptr) {
+      sparse_initializers_by_name[func_proto.input().Get(i)] = ctx.getInputSparseData(i);
+    }
+  }
+
+  std::unordered_map<std::string, const AttributeProto*> attr_map;
+  for (auto& attr : func_proto.attribute()) {
+    if (ctx.getAttribute(attr) != nullptr) {
+      attr_map[attr] = ctx.getAttribute(attr);
+    }
+  }
+
+  for (auto& n : func_proto.node()) {
+    // Resolve domain for node
+    auto it = func_opset_imports.find(n.domain());
+    if (it == func_opset_imports.end()) {
+      fail_type_inference(
+          "Cannot infer type and shape for function",
+          func_proto.name(),
+          ". No opset import for domain",
+          n.domain(),
+          " referenced by function body node ",
+          n.name(),
+          " optype ",
+          n.op_type());
+    }
+    auto domain_version = it->second;
+    const auto schema = schema_registry->GetSchema(n.op_type(), domain_version, n.domain());
+
+    NodeProto copy_n(n);
+    // Add attribute information into the temporary node
+    copy_n.clear_attribute();
+    for (const auto& attr : n.attribute()) {
+      if (attr.has_ref_attr_name()) {
+        if (attr_map.count(attr.ref_attr_name())) {
+          auto copy_attr = *attr_map[attr.ref_attr_name()];
+          copy_attr.set_name(attr.name());
+          copy_n.add_attribute()->CopyFrom(copy_attr);
+        }
+      } else {
+        copy_n.add_attribute()->CopyFrom(attr);
+      }
+    }
+    ONNX_NAMESPACE::shape_inference::InferenceContextImpl func_node_ctx(
+        copy_n, value_types_by_name, initializers_by_name, sparse_initializers_by_name, {});
+
+    if (schema && schema->has_type_and_shape_inference_function()) {
+      schema->GetTypeAndShapeInferenceFunction()(func_node_ctx);
+    } else if (schema && schema->HasFunction()) {
+      InferShapeForFunctionNode(
+          *(schema->GetFunction()),
+          schema_registry,
+          func_node_ctx,
+          options,
+          model_local_functions_map,
+          symbol_table,
+          generated_shape_data_by_name,
+          function_cache);
+    } else if (model_local_functions_map.size() > 0) {
+      // check model local functions for FunctionProto
+      auto iter = model_local_functions_map.find(GetModelLocalFunctionsMapIdentifier(n.domain(), n.op_type()));
+      if (iter == model_local_functions_map.end()) {
+        return;
+      }
+
+      InferShapeForFunctionNode(
+          *iter->second,
+          schema_registry,
+          func_node_ctx,
+          options,
+          model_local_functions_map,
+          symbol_table,
+          generated_shape_data_by_name,
+          function_cache);
+    } else {
+      // Cannot find the function definition in onnx defined schemas and model local functions map, so return.
+      return;
+    }
+
+    for (int i = 0; i < copy_n.output_size(); ++i) {
+      TypeProto* inferred_output_type = func_node_ctx.getOutputType(i);
+      // validate and merge the inferred type
+      TypeProto* existing_type = nullptr;
+      auto iter = value_types_by_name.find(n.output(i));
+      if (iter != value_types_by_name.end()) {
+        existing_type = iter->second;
+        checkShapesAndTypes(*inferred_output_type, *existing_type);
+      } else {
+        // Store the inferred type info in the temporary subgraph
+        auto vi = g.add_value_info();
+        vi->set_name(copy_n.output(i));
+        existing_type = vi->mutable_type();
+      }
+
+      if (symbol_table) {
+        MaterializeSymbolicShape(inferred_output_type, *symbol_table);
+      }
+      mergeShapesAndTypes(*inferred_output_type, existing_type);
+      if (options.enable_data_propagation && schema && schema->has_data_propagation_function()) {
+        DataPropagationContextImpl data_propagation_ctx(
+            copy_n, value_types_by_name, initializers_by_name, *generated_shape_data_by_name);
+        schema->GetDataPropagationFunction()(data_propagation_ctx);
+      }
+
+      // Make merged info available to downstream inference.
+      value_types_by_name[copy_n.output(i)] = existing_type;
+    }
+  }
+
+  for (int i = 0; i < func_proto.output_size(); ++i) {
+    const std::string& output_name = func_proto.output().Get(i);
+    // Skip if no type inferred for the tensor
+    auto iter = value_types_by_name.find(output_name);
+    if (iter != value_types_by_name.cend()) {
+      // Copy the type info to ctx
+      // to pass back to main graph
+      auto type_proto = ctx.getOutputType(i);
+      type_proto->CopyFrom(*(iter->second));
+    }
+  }
+
+  if (!cache_key.empty()) {
+    std::unordered_set<std::string> input_symbols;
+    for (size_t i = 0; i < ctx.getNumInputs(); ++i) {
+      if (ctx.getInputType(i)) {
+        CollectSymbols(*ctx.getInputType(i), input_symbols);
+      }
+    }
+    std::vector<TypeProto> output_types;
+    std::unordered_set<std::string> output_symbols;
+    for (size_t i = 0; i < ctx.getNumOutputs(); ++i) {
+      output_types.push_back(*ctx.getOutputType(i));
+      CollectSymbols(output_types.back(), output_symbols);
+    }
+    // The symbols created for the outputs of a call must not be shared with other calls
+    for (const auto& symbol : output_symbols) {
+      if (!input_symbols.count(symbol)) {
+        return;
+      }
+    }
+    function_cache->insert(cache_key, std::move(output_types));
+  }
+}
+
+void InferShapeForFunctionNode(
+    const FunctionProto& function_proto,
+    const ISchemaRegistry* schema_registry,
+    InferenceContext& ctx,
+    const ShapeInferenceOptions& options,
+    const std::unordered_map<std::string, const FunctionProto*>& model_local_functions_map,
+    SymbolTable* symbol_table,
+    std::unordered_map<std::string, TensorShapeProto>* generated_shape_data_by_name,
+    FunctionInferenceCache* function_cache) {
+
+  std::unordered_map<std::string, int> opset_imports;
+  for (const auto& opset_import : function_proto.opset_import()) {
+    opset_imports[opset_import.domain()] = static_cast<int>(opset_import.version());
+  }
+
+  InferShapeForFunctionNode(
+      function_proto,
+      opset_imports,
+      schema_registry,
+      ctx,
+      options,
+      model_local_functions_map,
+      symbol_table,
+      generated_shape_data_by_name,
+      function_cache);
+}
+
+std::vector<const TypeProto*> GraphInferencerImpl::doInferencing(
+    const std::vector<const TypeProto*>& input_types,
+    const std::vector<const TensorProto*>& input_data) {
+  // future: pass inputData into InferShapes either directly, or indirectly by
+  // updating initializers that match subgraph inputs.
+  (void)input_data;
+  if (prefetched_graph_ && input_types.empty()) {
+    std::unique_ptr<GraphProto> graph = std::move(prefetched_graph_);
+    std::unique_ptr<DeferredSymbolTable> symbols = std::move(prefetched_symbols_);
+    std::unique_ptr<FunctionInferenceCache> function_cache = std::move(prefetched_function_cache_);
+    std::exception_ptr error = prefetched_error_;
+    prefetched_error_ = nullptr;
+    if (symbols) {
+      RenameSymbols(*graph, symbols->commit());
+    }
+    if (function_cache) {
+      context_->function_cache->merge(*function_cache);
+    }
+    g_->Swap(graph.get());
+    if (error) {
+      std::rethrow_exception(error);
+    }
+    std::vector<const TypeProto*> graph_output_types;
+    graph_output_types.reserve(g_->output().size());
+    for (const ValueInfoProto& output : g_->output()) {
+      graph_output_types.push_back(&output.type());
+    }
+    return graph_output_types;
+  }
+  prefetched_graph_.reset();
+  prefetched_symbols_.reset();
+  prefetched_function_cache_.reset();
+  prefetched_error_ = nullptr;
+  return inferGraph(g_, getSymbolTable(), context_->function_cache, input_types, context_->num_threads);
+}
+
+void GraphInferencerImpl::prefetchInferencing(const std::vector<GraphInferencerImpl*>& inferencers, int num_threads) {
+  for (auto* inferencer : inferencers) {
+    inferencer->prefetched_graph_.reset(new GraphProto(*inferencer->g_));
+    SymbolTable* symbol_table = inferencer->getSymbolTable();
+    inferencer->prefetched_symbols_.reset(symbol_table ? new DeferredSymbolTable(symbol_table) : nullptr);
+    FunctionInferenceCache* function_cache = inferencer->context_->function_cache;
+    inferencer->prefetched_function_cache_.reset(
+        function_cache ? new FunctionInferenceCache(function_cache) : nullptr);
+    inferencer->prefetched_error_ = nullptr;
+  }
+  // The subgraphs of the prefetched graphs are inferred serially, so that threads do not nest
+  RunInParallel(static_cast<int>(inferencers.size()), num_threads, [&](int i) {
+    auto* inferencer = inferencers[i];
+    ONNX_TRY {
+      inferencer->inferGraph(
+          inferencer->prefetched_graph_.get(),
+          inferencer->prefetched_symbols_.get(),
+          inferencer->prefetched_function_cache_.get(),
+          {},
+          1);
+    }
+    ONNX_CATCH(...) {
+      ONNX_HANDLE_EXCEPTION([&]() { inferencer->prefetched_error_ = std::current_exception(); });
+    }
+  });
+}
+
+std::vector<const TypeProto*> GraphInferencerImpl::inferGraph(
+    GraphProto* g,
+    SymbolTable* symbol_table,
+    FunctionInferenceCache* function_cache,
+    const std::vector<const TypeProto*>& input_types,
+    int num_threads) {
+  int num_inputs = int(input_types.size());
+  std::unordered_set<std::string> initializer_name_set;
+  for (const auto& tp : g->initializer()) {
+    initializer_name_set.insert(tp.name());
+  }
+
+  if (context_->ir_version >= 4) {
+    if (g->input_size() != num_inputs) {
+      fail_shape_inference("Graph has ", g->input_size(), " inputs but ", num_inputs, " were provided");
+    }
+    for (int i = 0; i < g->input_size(); ++i) {
+      if (initializer_name_set.count(g->input(i).name()) > 0) {
+        fail_shape_inference("Cannot use the same name as both a subgraph initializer and subgraph input: ",
+          g->input(i).name());
+      }
+    }
+  } else {
+    // IR < 4 requires all initializers to be optional inputs
+    // So the number of graph input can be larger than the number of node input 
+    if (num_inputs > g->input_size()) {
+      fail_shape_inference(
+          "Graph has ",
+          g->input_size(),
+          " inputs but ",
+          num_inputs,
+          " were provided.",
+        "The number of graph input cannot be smaller than the number of node input" );
+    } else if (num_inputs < g->input_size()) {
+      for (int i = 0; i < g->input_size(); ++i) {
+        if (i < num_inputs && initializer_name_set.count(g->input(i).name()) > 0) {
+          fail_shape_inference("Graph initializer names must appear after the actual inputs: ",
+            g->input(i).name());
+        } else if (i >= num_inputs && initializer_name_set.count(g->input(i).name()) == 0) {
+          // Further check whether the additional input is in initializers
+          fail_shape_inference("Cannot find missing input: ", g->input(i).name(), "in initializers. ");
+        }
+      }
+    }
+  }
+
+  for (int i = 0, end = num_inputs; i < end; ++i) {
+    const TypeProto* inferred_input = input_types[i];
+
+    if (!inferred_input)
+      continue;
+
+    TypeProto* graph_input = g->mutable_input(i)->mutable_type();
+    // Even if graphInput doesn't have defined type, it will assign inferredType to it
+    mergeShapesAndTypes(*inferred_input, graph_input);
+
+    if (symbol_table) {
+      MaterializeSymbolicShape(graph_input, *symbol_table);
+    }
+  }
+
+  ShapeInferenceOptions options {};
+  InferShapesImpl(
+      g,
+      *context_->outer_scope_value_types_by_name, // never null
+      context_->opset_imports,
+      options,
+      symbol_table,
+      context_->model_local_functions,
+      context_->schema_registry,
+      IR_VERSION,
+      nullptr,
+      function_cache,
+      num_threads);
+
+  std::vector<const TypeProto*> graph_output_types;
+  graph_output_types.reserve(g->output().size());
+  for (const ValueInfoProto& output : g->output()) {
+    graph_output_types.push_back(&output.type());
+  }
+
+  return graph_output_types;
+}
+
+std::string GetErrorWithNodeInfo(NodeProto n, std::runtime_error err) {
+  std::string op_name = n.has_name() ? (", node name: " + n.name()) : "";
+  return "(op_type:" + n.op_type() + op_name + "): " + err.what();
+}
+
+void TraverseGraphsToAddExistingSymbols(const GraphProto& g, SymbolTable& symbol_table) {
+  symbol_table.addFromGraph(g);
+  for (const auto& n : g.node()) {
+    for (auto& attr : n.attribute()) {
+      if (attr.has_g()) {
+        TraverseGraphsToAddExistingSymbols(attr.g(), symbol_table);
+      }
+    }
+  }
+}
+
+} // namespace shape_inference
+} // namespace ONNX_NAMESPACE
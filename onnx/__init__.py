@@ -5,14 +5,20 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
 import os
 
 from .onnx_cpp2py_export import ONNX_ML
 from onnx.external_data_helper import load_external_data_for_model, write_external_data_tensors, convert_model_to_external_data
+from onnx.external_data_helper import _load_external_data_for_model_async
 from .onnx_pb import *  # noqa
 from .onnx_operators_pb import * # noqa
 from .onnx_data_pb import * # noqa
 from .version import version as __version__  # noqa
+from onnx._serialization import _serialize_to_stream, _deserialize
 
 # Import common subpackages so they're available when you 'import onnx'
 import onnx.checker  # noqa
@@ -23,7 +29,7 @@ import onnx.compose  # noqa
 
 import google.protobuf.message
 
-from typing import Union, Text, IO, Optional, cast, TypeVar, Any
+from typing import Union, Text, IO, Optional, cast, Any, Iterator
 
 
 # f should be either readable or a file path
@@ -36,6 +42,32 @@ def _load_bytes(f):  # type: (Union[IO[bytes], Text]) -> bytes
     return s
 
 
+# f should be either readable or a file path
+@contextlib.contextmanager
+def _load_buffer(f):  # type: (Union[IO[bytes], Text]) -> Iterator[Any]
+    '''
+    Like _load_bytes, but a file given by path is memory-mapped instead of copied into a bytes object.
+    The mapping is only valid inside the with block.
+    '''
+    if hasattr(f, 'read') and callable(cast(IO[bytes], f).read):
+        yield cast(IO[bytes], f).read()
+        return
+    import mmap
+    with open(cast(Text, f), 'rb') as readable:
+        try:
+            mapped = mmap.mmap(readable.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            mapped = None
+        if mapped is None:
+            yield readable.read()
+            return
+        try:
+            yield mapped
+        finally:
+            mapped.close()
+
+
 # str should be bytes,
 # f should be either writable or a file path
 def _save_bytes(str, f):  # type: (bytes, Union[IO[bytes], Text]) -> None
@@ -46,6 +78,15 @@ def _save_bytes(str, f):  # type: (bytes, Union[IO[bytes], Text]) -> None
             writable.write(str)
 
 
+# f should be either writable or a file path
+def _save_stream(proto, f):  # type: (ModelProto, Union[IO[bytes], Text]) -> None
+    if hasattr(f, 'write') and callable(cast(IO[bytes], f).write):
+        _serialize_to_stream(proto, cast(IO[bytes], f))
+    else:
+        with open(cast(Text, f), 'wb') as writable:
+            _serialize_to_stream(proto, writable)
+
+
 # f should be either a readable file or a file path
 def _get_file_path(f):  # type: (Union[IO[bytes], Text]) -> Optional[Text]
     if isinstance(f, str):
@@ -76,36 +117,7 @@ def _serialize(proto):  # type: (Union[bytes, google.protobuf.message.Message])
                          'neither proto is a str.\ntype is {}'.format(type(proto)))
 
 
-_Proto = TypeVar('_Proto', bound=google.protobuf.message.Message)
-
-
-def _deserialize(s, proto):  # type: (bytes, _Proto) -> _Proto
-    '''
-    Parse bytes into a in-memory proto
-
-    @params
-    s is bytes containing serialized proto
-    proto is a in-memory proto object
-
-    @return
-    The proto instance filled in by s
-    '''
-    if not isinstance(s, bytes):
-        raise ValueError('Parameter s must be bytes, but got type: {}'.format(type(s)))
-
-    if not (hasattr(proto, 'ParseFromString') and callable(proto.ParseFromString)):
-        raise ValueError('No ParseFromString method is detected. '
-                         '\ntype is {}'.format(type(proto)))
-
-    decoded = cast(Optional[int], proto.ParseFromString(s))
-    if decoded is not None and decoded != len(s):
-        raise google.protobuf.message.DecodeError(
-            "Protobuf decoding consumed too few bytes: {} out of {}".format(
-                decoded, len(s)))
-    return proto
-
-
-def load_model(f, format=None, load_external_data=True):  # type: (Union[IO[bytes], Text], Optional[Any], bool) -> ModelProto
+def load_model(f, format=None, load_external_data=True, mmap=False):  # type: (Union[IO[bytes], Text], Optional[Any], bool, bool) -> ModelProto
     '''
     Loads a serialized ModelProto into memory
     load_external_data is true if the external data under the same directory of the model and load the external data
@@ -114,18 +126,22 @@ def load_model(f, format=None, load_external_data=True):  # type: (Union[IO[byte
     @params
     f can be a file-like object (has "read" function) or a string containing a file name
     format is for future use
+    mmap: if true, external data is not read into memory. External tensors keep pointing to their
+          files, and numpy_helper.to_array(tensor, base_dir, mmap=True), with base_dir the directory
+          of the model, returns read-only np.memmap views of them. save_model and checker.check_model
+          find the data when given the same base_dir.
 
     @return
     Loaded in-memory ModelProto
     '''
-    s = _load_bytes(f)
-    model = load_model_from_string(s, format=format)
+    with _load_buffer(f) as s:
+        model = load_model_from_string(s, format=format)
 
     if load_external_data:
         model_filepath = _get_file_path(f)
         if model_filepath:
             base_dir = os.path.dirname(model_filepath)
-            load_external_data_for_model(model, base_dir)
+            load_external_data_for_model(model, base_dir, mmap=mmap)
 
     return model
 
@@ -141,16 +157,17 @@ def load_tensor(f, format=None):  # type: (Union[IO[bytes], Text], Optional[Any]
     @return
     Loaded in-memory TensorProto
     '''
-    s = _load_bytes(f)
-    return load_tensor_from_string(s, format=format)
+    with _load_buffer(f) as s:
+        return load_tensor_from_string(s, format=format)
 
 
-def load_model_from_string(s, format=None):  # type: (bytes, Optional[Any]) -> ModelProto
+def load_model_from_string(s, format=None):  # type: (Any, Optional[Any]) -> ModelProto
     '''
     Loads a binary string (bytes) that contains serialized ModelProto
 
     @params
-    s is a string, which contains serialized ModelProto
+    s is a string, which contains serialized ModelProto.
+    Any bytes-like object (bytearray, memoryview, mmap, ...) is accepted and parsed without a copy.
     format is for future use
 
     @return
@@ -159,12 +176,13 @@ def load_model_from_string(s, format=None):  # type: (bytes, Optional[Any]) -> M
     return _deserialize(s, ModelProto())
 
 
-def load_tensor_from_string(s, format=None):  # type: (bytes, Optional[Any]) -> TensorProto
+def load_tensor_from_string(s, format=None):  # type: (Any, Optional[Any]) -> TensorProto
     '''
     Loads a binary string (bytes) that contains serialized TensorProto
 
     @params
-    s is a string, which contains serialized TensorProto
+    s is a string, which contains serialized TensorProto.
+    Any bytes-like object (bytearray, memoryview, mmap, ...) is accepted and parsed without a copy.
     format is for future use
 
     @return
@@ -173,8 +191,9 @@ def load_tensor_from_string(s, format=None):  # type: (bytes, Optional[Any]) ->
     return _deserialize(s, TensorProto())
 
 
-def save_model(proto, f, format=None, save_as_external_data=False, all_tensors_to_one_file=True, location=None, size_threshold=1024, convert_attribute=False):
-    # type: (Union[ModelProto, bytes], Union[IO[bytes], Text], Optional[Any], bool, bool, Optional[Text], int, bool) -> None
+def save_model(proto, f, format=None, save_as_external_data=False, all_tensors_to_one_file=True, location=None, size_threshold=1024, convert_attribute=False, align=None, deduplicate=False,
+               max_shard_size=None, compression=None, compression_chunk_size=None, base_dir=None):
+    # type: (Union[ModelProto, bytes], Union[IO[bytes], Text], Optional[Any], bool, bool, Optional[Text], int, bool, Optional[int], bool, Optional[int], Optional[Text], Optional[int], Optional[Text]) -> None
     '''
     Saves the ModelProto to the specified path and optionally, serialize tensors with raw data as external data before saving.
 
@@ -189,20 +208,38 @@ def save_model(proto, f, format=None, save_as_external_data=False, all_tensors_t
                     to external data. To convert every tensor with raw data to external data set size_threshold=0.
     convert_attribute: If true, convert all tensors to external data
                        If false, convert only non-attribute tensors to external data
+    align: If set, external data of tensors is written at offsets that are multiples of align bytes
+           (e.g. 64 or 4096), so that consumers can map tensors directly into aligned buffers.
+    deduplicate: If true, the external data of byte-identical tensors is written only once,
+                 and all of them point to the same region of the external data file.
+    max_shard_size: If set together with all_tensors_to_one_file, external data is split into shard files
+                    of at most max_shard_size bytes of tensor data, which are written in parallel.
+    compression: If set to 'zlib' or 'lzma', external data is stored compressed in independently
+                 compressed chunks, which load_model decompresses in parallel. The compression is
+                 recorded with external_data keys that are not part of the ONNX standard, so the model
+                 can only be loaded by load_model of this package, and not with mmap=True.
+    compression_chunk_size: Size in bytes of the uncompressed chunks. Defaults to 4 MiB.
+    base_dir: If set, the external data of proto is first loaded from this directory, as
+              load_external_data_for_model does. Models loaded with mmap=True or load_external_data=False
+              need it, as their external data is still in the files they were loaded from.
     '''
     if isinstance(proto, bytes):
         proto = _deserialize(proto, ModelProto())
 
+    if base_dir is not None:
+        load_external_data_for_model(proto, base_dir)
+
     if save_as_external_data:
-        convert_model_to_external_data(proto, all_tensors_to_one_file, location, size_threshold, convert_attribute)
+        convert_model_to_external_data(proto, all_tensors_to_one_file, location, size_threshold, convert_attribute,
+                                       max_shard_size)
 
     model_filepath = _get_file_path(f)
     if model_filepath:
         basepath = os.path.dirname(model_filepath)
-        proto = write_external_data_tensors(proto, basepath)
+        proto = write_external_data_tensors(proto, basepath, align, deduplicate, compression=compression,
+                                            compression_chunk_size=compression_chunk_size)
 
-    s = _serialize(proto)
-    _save_bytes(s, f)
+    _save_stream(proto, f)
 
 
 def save_tensor(proto, f):  # type: (TensorProto, Union[IO[bytes], Text]) -> None
@@ -218,6 +255,56 @@ def save_tensor(proto, f):  # type: (TensorProto, Union[IO[bytes], Text]) -> Non
     _save_bytes(s, f)
 
 
+async def load_model_async(f, format=None, load_external_data=True, mmap=False, executor=None):
+    # type: (Union[IO[bytes], Text], Optional[Any], bool, bool, Optional[concurrent.futures.Executor]) -> ModelProto
+    '''
+    Asynchronous version of load_model for asyncio applications
+
+    Parsing runs in an executor, so the event loop keeps running while a large model is loaded.
+    As soon as the model is parsed and the locations of its external data are known, the reads of
+    all external data files are started together on the executor and awaited together.
+
+    @params
+    f, format, load_external_data and mmap are the same as for load_model
+    executor: concurrent.futures.Executor to run the load in. The loop's default executor is used if not specified.
+
+    @return
+    Loaded in-memory ModelProto
+    '''
+    # get_running_loop() only exists since Python 3.7; inside a coroutine this is the running loop
+    loop = asyncio.get_event_loop()
+    model = await loop.run_in_executor(executor, functools.partial(load_model, f, format, False))
+
+    if load_external_data:
+        model_filepath = _get_file_path(f)
+        if model_filepath:
+            base_dir = os.path.dirname(model_filepath)
+            if mmap:
+                load_external_data_for_model(model, base_dir, mmap=True)
+            else:
+                await _load_external_data_for_model_async(model, base_dir, executor)
+
+    return model
+
+
+async def save_model_async(proto, f, executor=None, **kwargs):
+    # type: (Union[ModelProto, bytes], Union[IO[bytes], Text], Optional[concurrent.futures.Executor], **Any) -> None
+    '''
+    Asynchronous version of save_model for asyncio applications
+
+    Serialization and writing of the model and its external data run in an executor, so the event
+    loop keeps running while a large model is saved. As with save_model, the model may be modified
+    (e.g. converted to external data), so it should not be used elsewhere until the save completes.
+
+    @params
+    proto and f are the same as for save_model
+    executor: concurrent.futures.Executor to run the save in. The loop's default executor is used if not specified.
+    kwargs: other arguments of save_model
+    '''
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(executor, functools.partial(save_model, proto, f, **kwargs))
+
+
 # For backward compatibility
 load = load_model
 load_from_string = load_model_from_string
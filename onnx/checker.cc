@@ -8,10 +8,17 @@
 #include "onnx/defs/schema.h"
 #include "onnx/defs/tensor_proto_util.h"
 #include "onnx/proto_utils.h"
+#include "onnx/shape_inference/implementation.h"
 #include "onnx/string_utils.h"
 
+#include <algorithm>
+#include <atomic>
+#include <exception>
 #include <fstream>
+#include <functional>
 #include <iterator>
+#include <mutex>
+#include <thread>
 #include <unordered_set>
 
 #ifdef _WIN32
@@ -44,6 +51,104 @@ namespace checker {
     }                                                                                  \
   } while (0)
 
+namespace {
+
+// Runs shape inference as the full check of a model does: checking types and
+// failing on node level errors.
+void infer_shapes_strictly(ModelProto& model) {
+  ShapeInferenceOptions options{true, 1, false};
+  shape_inference::InferShapes(model, OpSchemaRegistry::Instance(), options);
+}
+
+// Runs check(i) for every i in [0, count) on num_threads threads, one per core
+// if num_threads <= 0. Returns the lowest index whose check failed, or count if
+// none did, and stores the exception of that check in error.
+int run_in_parallel(int count, int num_threads, const std::function<void(int)>& check, std::exception_ptr& error) {
+  if (num_threads <= 0) {
+    num_threads = static_cast<int>(std::max(1u, std::thread::hardware_concurrency()));
+  }
+  std::atomic<int> next{0};
+  std::atomic<int> failed{count};
+  std::mutex error_mutex;
+  auto worker = [&]() {
+    for (int i = next++; i < count && i < failed; i = next++) {
+      ONNX_TRY {
+        check(i);
+      }
+      ONNX_CATCH(...) {
+        ONNX_HANDLE_EXCEPTION([&]() {
+          std::lock_guard<std::mutex> lock(error_mutex);
+          if (i < failed) {
+            failed = i;
+            error = std::current_exception();
+          }
+        });
+      }
+    }
+  };
+  std::vector<std::thread> workers;
+  for (int t = 1; t < std::min(count, num_threads); ++t) {
+    workers.emplace_back(worker);
+  }
+  worker();
+  for (auto& thread : workers) {
+    thread.join();
+  }
+  return failed;
+}
+
+// Checks count elements of a graph, such as its nodes, as a serial check would
+// check them in order with serial_before(i), parallel(i) and serial_after(i).
+// The order dependent serial parts run first on the calling thread, up to the
+// first failure. The parallel parts, which must only depend on state built by
+// the serial parts of earlier elements, then run on num_threads threads. The
+// error thrown is the one a serial check would have reported first.
+void check_in_parallel(
+    int count,
+    int num_threads,
+    const std::function<void(int)>& serial_before,
+    const std::function<void(int)>& parallel,
+    const std::function<void(int)>& serial_after) {
+  int serial_failed = count;
+  bool failed_before = false;
+  std::exception_ptr serial_error;
+  for (int i = 0; i < count && serial_failed == count; ++i) {
+    ONNX_TRY {
+      serial_before(i);
+    }
+    ONNX_CATCH(...) {
+      ONNX_HANDLE_EXCEPTION([&]() {
+        serial_failed = i;
+        failed_before = true;
+        serial_error = std::current_exception();
+      });
+    }
+    if (serial_failed != count) {
+      break;
+    }
+    ONNX_TRY {
+      serial_after(i);
+    }
+    ONNX_CATCH(...) {
+      ONNX_HANDLE_EXCEPTION([&]() {
+        serial_failed = i;
+        serial_error = std::current_exception();
+      });
+    }
+  }
+
+  int limit = failed_before ? serial_failed : std::min(serial_failed + 1, count);
+  std::exception_ptr parallel_error;
+  if (run_in_parallel(limit, num_threads, parallel, parallel_error) < limit) {
+    std::rethrow_exception(parallel_error);
+  }
+  if (serial_error) {
+    std::rethrow_exception(serial_error);
+  }
+}
+
+} // namespace
+
 void check_value_info(const ValueInfoProto& value_info, const CheckerContext& ctx) {
   enforce_non_empty_field(value_info, name);
   // Relax constraint for subgraph input/output.
@@ -90,6 +195,9 @@ void check_tensor(const TensorProto& tensor, const CheckerContext& ctx) {
   if (tensor.data_type() == TensorProto::UNDEFINED) {
     fail_check("setting data_type field (tensor name: ", tensor.name(), ") to UNDEFINED is not allowed");
   }
+  if (ctx.skip_tensor_data()) {
+    return;
+  }
 
   int num_value_fields = 0;
 
@@ -420,6 +528,10 @@ void check_sparse_tensor(const SparseTensorProto& sparse_tensor_proto, const Che
     if (indices.data_type() != TensorProto::INT64) {
       fail_check("Sparse tensor indices (", indices.name(), ") must have INT64 type.");
     }
+    if (ctx.skip_tensor_data() && (indices.dims().size() == 1 || indices.dims().size() == 2)) {
+      // The index values are tensor data
+      return;
+    }
     switch (indices.dims().size()) {
       case 1:
         // Indices in linearized format
@@ -608,7 +720,7 @@ void check_graph(const GraphProto& graph, const CheckerContext& ctx, const Lexic
   std::unordered_set<std::reference_wrapper<const std::string>, std::hash<std::string>, std::equal_to<std::string>>
       initializer_name_checker;
 
-  for (const auto& init : graph.initializer()) {
+  auto check_initializer_name = [&](const TensorProto& init) {
     enforce_has_field(init, name);
     const auto& name = init.name();
     if (name.empty()) {
@@ -618,9 +730,9 @@ void check_graph(const GraphProto& graph, const CheckerContext& ctx, const Lexic
     if (!initializer_name_checker.insert(std::cref(name)).second) {
       fail_check(name + " initializer name is not unique");
     }
-
-    check_tensor(init, ctx);
-
+  };
+  auto add_initializer = [&](const TensorProto& init) {
+    const auto& name = init.name();
     if (ctx.get_ir_version() <= 0x00000003) {
       // Initializers are a subset of graph inputs for IR_VERSION <= 3
       if (!lex_ctx.this_graph_has(name)) {
@@ -631,6 +743,22 @@ void check_graph(const GraphProto& graph, const CheckerContext& ctx, const Lexic
       // but is not required to (for IR_VERSION >= 4)
       lex_ctx.add(name);
     }
+  };
+
+  const bool parallel = ctx.get_num_threads() != 1;
+  if (parallel) {
+    check_in_parallel(
+        graph.initializer_size(),
+        ctx.get_num_threads(),
+        [&](int i) { check_initializer_name(graph.initializer(i)); },
+        [&](int i) { check_tensor(graph.initializer(i), ctx); },
+        [&](int i) { add_initializer(graph.initializer(i)); });
+  } else {
+    for (const auto& init : graph.initializer()) {
+      check_initializer_name(init);
+      check_tensor(init, ctx);
+      add_initializer(init);
+    }
   }
 
   for (const auto& sparse_init : graph.sparse_initializer()) {
@@ -647,7 +775,7 @@ void check_graph(const GraphProto& graph, const CheckerContext& ctx, const Lexic
     lex_ctx.add(name);
   }
 
-  for (const auto& node : graph.node()) {
+  auto check_node_inputs = [&](const NodeProto& node) {
     // nodes must be in topologically sorted order
     for (const auto& input : node.input()) {
       // explicit optional input
@@ -666,13 +794,12 @@ void check_graph(const GraphProto& graph, const CheckerContext& ctx, const Lexic
             "\n is not output of any previous nodes.");
       }
     }
-
-    // This needs to happen before SSA check since we don't want to recurse and
-    // find that outputs from control flow ops are colliding with names in the
-    // inner block
-
+  };
+  auto check_node_with_context = [](const NodeProto& node,
+                                    const CheckerContext& node_ctx,
+                                    const LexicalScopeContext& node_lex_ctx) {
     ONNX_TRY {
-      check_node(node, ctx, lex_ctx);
+      check_node(node, node_ctx, node_lex_ctx);
     }
     ONNX_CATCH(ValidationError & ex) {
       ONNX_HANDLE_EXCEPTION([&]() {
@@ -680,6 +807,8 @@ void check_graph(const GraphProto& graph, const CheckerContext& ctx, const Lexic
         ONNX_THROW_EX(ex);
       });
     }
+  };
+  auto add_node_outputs = [&](const NodeProto& node, int position) {
     // check for SSA form
     for (const auto& output : node.output()) {
       // optional output
@@ -693,7 +822,38 @@ void check_graph(const GraphProto& graph, const CheckerContext& ctx, const Lexic
             output,
             "' has been used as output names multiple times.");
       }
-      lex_ctx.add(output);
+      if (parallel) {
+        lex_ctx.add(output, position);
+      } else {
+        lex_ctx.add(output);
+      }
+    }
+  };
+
+  if (parallel) {
+    // Subgraphs are checked serially on the thread of the node they belong to.
+    CheckerContext node_ctx(ctx);
+    node_ctx.set_num_threads(1);
+    // Each node sees the outputs of the nodes before it only, so subgraphs are
+    // checked against the same lexical scope as in a serial check.
+    check_in_parallel(
+        graph.node_size(),
+        ctx.get_num_threads(),
+        [&](int i) { check_node_inputs(graph.node(i)); },
+        [&](int i) {
+          LexicalScopeContext node_lex_ctx{lex_ctx, i};
+          check_node_with_context(graph.node(i), node_ctx, node_lex_ctx);
+        },
+        [&](int i) { add_node_outputs(graph.node(i), i); });
+  } else {
+    for (int i = 0; i < graph.node_size(); ++i) {
+      const auto& node = graph.node(i);
+      check_node_inputs(node);
+      // This needs to happen before SSA check since we don't want to recurse and
+      // find that outputs from control flow ops are colliding with names in the
+      // inner block
+      check_node_with_context(node, ctx, lex_ctx);
+      add_node_outputs(node, i);
     }
   }
 }
@@ -776,6 +936,18 @@ void check_model_local_functions(
 
     CheckerContext ctx_copy = ctx;
     ctx_copy.set_opset_imports(model_opset_imports);
+    ctx_copy.set_num_threads(1);
+
+    if (ctx.get_num_threads() != 1) {
+      // Functions are independent of each other, so they are checked in parallel
+      check_in_parallel(
+          model.functions_size(),
+          ctx.get_num_threads(),
+          [](int) {},
+          [&](int i) { check_function(model.functions(i), ctx_copy, parent_lex); },
+          [](int) {});
+      return;
+    }
 
     for (const auto& function_proto : model.functions()) {
         check_function(function_proto, ctx_copy, parent_lex);
@@ -912,11 +1084,13 @@ void check_model(const ModelProto& model, CheckerContext& ctx) {
   }
 }
 
-void check_model(const std::string& model_path) {
+void check_model(const std::string& model_path, int num_threads, bool skip_tensor_data, bool full_check) {
   ModelProto model;
   LoadProtoFromPath(model_path, model);
 
   CheckerContext ctx;
+  ctx.set_num_threads(num_threads);
+  ctx.set_skip_tensor_data(skip_tensor_data);
   std::string model_dir;
   size_t pos = model_path.find_last_of("\\/");
   if (pos != std::string::npos) {
@@ -924,13 +1098,25 @@ void check_model(const std::string& model_path) {
   }
   ctx.set_model_dir(model_dir);
   check_model(model, ctx);
+  if (full_check) {
+    infer_shapes_strictly(model);
+  }
 }
 
-void check_model(const ModelProto& model) {
+void check_model(const ModelProto& model, int num_threads, bool skip_tensor_data) {
   CheckerContext ctx;
+  ctx.set_num_threads(num_threads);
+  ctx.set_skip_tensor_data(skip_tensor_data);
   check_model(model, ctx);
 }
 
+void check_model(ModelProto& model, int num_threads, bool skip_tensor_data, bool full_check) {
+  check_model(static_cast<const ModelProto&>(model), num_threads, skip_tensor_data);
+  if (full_check) {
+    infer_shapes_strictly(model);
+  }
+}
+
 std::set<std::string> experimental_ops = {
     "ATen",
     "Affine",
@@ -4,6 +4,7 @@
 
 #pragma once
 
+#include <limits>
 #include <stdexcept>
 #include <unordered_map>
 #include <unordered_set>
@@ -73,6 +74,24 @@ class CheckerContext final {
     return model_dir_;
   }
 
+  // Number of threads used to check the initializers, nodes and model local
+  // functions of the main graph. 1 checks serially, 0 uses one thread per core.
+  int get_num_threads() const {
+    return num_threads_;
+  }
+  void set_num_threads(int num_threads) {
+    num_threads_ = num_threads;
+  }
+
+  // Whether to skip the checks of the data stored in tensors, so that models
+  // whose tensors were stripped of their data can be checked.
+  bool skip_tensor_data() const {
+    return skip_tensor_data_;
+  }
+  void set_skip_tensor_data(bool skip_tensor_data) {
+    skip_tensor_data_ = skip_tensor_data;
+  }
+
   explicit CheckerContext() : ir_version_(-1) {}
 
  private:
@@ -81,6 +100,8 @@ class CheckerContext final {
   bool is_main_graph_ = true;
   const ISchemaRegistry* schema_registry_ = OpSchemaRegistry::Instance();
   std::string model_dir_;
+  int num_threads_ = 1;
+  bool skip_tensor_data_ = false;
 };
 
 class LexicalScopeContext final {
@@ -95,16 +116,30 @@ class LexicalScopeContext final {
   // values from the parent scope so the values are copied instead.
   LexicalScopeContext(const LexicalScopeContext& parent_context) : parent_context_{&parent_context} {}
 
+  // Construct an instance that sees the names of the parent scope except those
+  // added to it with a position at or after the given position. This lets the
+  // nodes of a graph be checked out of order against the scope they would see
+  // if the graph were checked in order.
+  LexicalScopeContext(const LexicalScopeContext& parent_context, int position)
+      : parent_context_{&parent_context}, parent_position_{position} {}
+
   void add(const std::string& name) {
     output_names.insert(name);
   }
 
+  // Add a name that is only visible to scopes constructed with a position
+  // greater than the given one, such as the output of the position-th node.
+  void add(const std::string& name, int position) {
+    output_names.insert(name);
+    positions_[name] = position;
+  }
+
   bool this_graph_has(const std::string& name) const {
     return output_names.find(name) != output_names.cend();
   }
 
   bool this_or_ancestor_graph_has(const std::string& name) const {
-    return this_graph_has(name) || (parent_context_ && parent_context_->this_or_ancestor_graph_has(name));
+    return this_graph_has(name) || (parent_context_ && parent_context_->has_before(name, parent_position_));
   }
 
   // public for backwards compatibility. please prefer the public interface of
@@ -112,7 +147,19 @@ class LexicalScopeContext final {
   std::unordered_set<std::string> output_names;
 
  private:
+  bool has_before(const std::string& name, int position) const {
+    if (this_graph_has(name)) {
+      auto it = positions_.find(name);
+      if (it == positions_.end() || it->second < position) {
+        return true;
+      }
+    }
+    return parent_context_ && parent_context_->has_before(name, parent_position_);
+  }
+
   const LexicalScopeContext* parent_context_{nullptr};
+  int parent_position_{std::numeric_limits<int>::max()};
+  std::unordered_map<std::string, int> positions_;
 };
 
 using IR_VERSION_TYPE = decltype(Version::IR_VERSION);
@@ -142,8 +189,15 @@ void check_model_local_functions(
     const CheckerContext& ctx,
     const LexicalScopeContext& parent_lex);
 
-void check_model(const ModelProto& model);
-void check_model(const std::string& model_path);
+void check_model(const ModelProto& model, int num_threads = 1, bool skip_tensor_data = false);
+void check_model(
+    const std::string& model_path,
+    int num_threads = 1,
+    bool skip_tensor_data = false,
+    bool full_check = false);
+// If full_check is true, strict shape inference is run on the model once it has
+// been checked, adding the inferred types to its graph.
+void check_model(ModelProto& model, int num_threads, bool skip_tensor_data, bool full_check);
 
 bool check_is_experimental_op(std::string node_op_type);
 
@@ -22,10 +22,12 @@ from onnx import (ValueInfoProto,
                   IR_VERSION)
 import onnx.onnx_cpp2py_export.checker as C
 import onnx.defs
+from onnx._serialization import (_initializer_data_size, _serialize_with_tensor_stubs, _stub_only,
+                                 _tensor_header, _tensor_placeholder, _unread_initializers)
+from onnx.external_data_helper import _get_all_tensors, get_external_data_file_path, uses_external_data
 from google.protobuf.message import Message
-from typing import TypeVar, Callable, Any, Type, cast, Union, Text
+from typing import TypeVar, Callable, Any, Type, cast, Optional, Union, Text
 import onnx.shape_inference
-import sys
 
 
 # Limitation of single protobuf file is 2GB
@@ -90,26 +92,76 @@ def check_sparse_tensor(sparse, ctx=DEFAULT_CONTEXT):  # type: (SparseTensorProt
     C.check_sparse_tensor(sparse.SerializeToString(), ctx)
 
 
-def check_model(model, full_check=False):  # type: (Union[ModelProto, Text, bytes], bool) -> None
+def check_model(model, full_check=False, num_threads=1, skip_tensor_data=False, base_dir=None):
+    # type: (Union[ModelProto, Text, bytes], bool, int, bool, Optional[Text]) -> None
+    """Checks the consistency of a model.
+
+    Arguments:
+        model: a ModelProto, its serialized bytes, or the path to it.
+        full_check: if True, the function also runs strict shape inference. The
+            model is parsed once for both, and the inferred model is not returned.
+        num_threads: the number of threads checking the initializers, nodes and
+            model local functions of the main graph. 1 checks serially and 0 uses
+            one thread per core. The error reported is the same as when checking serially.
+        skip_tensor_data: if True, only the structure, operator schemas and types are
+            checked, and not the data stored in tensors.
+        base_dir: the directory the external data of a ModelProto is relative to, such
+            as the directory of a model loaded with mmap=True. If not set, the external
+            data is looked for relative to the current directory.
+
+    A ModelProto is checked in memory whatever its size. Models that fit in a protobuf
+    are serialized whole. Larger ones are passed to the checker with each tensor replaced
+    by a stub that holds no data, which the checker validates like the tensor, so the data
+    is neither copied nor serialized. With skip_tensor_data, tensors are always replaced by
+    stubs, whatever the size of the model. With full_check, the small initializers and the
+    INT32 and INT64 initializers that a node consumes are not stubbed, as shape inference may
+    read their data.
+    """
     # If model is a path instead of ModelProto
     if isinstance(model, str):
-        C.check_model_path(model)
-        if full_check:
-            onnx.shape_inference.infer_shapes_path(model, check_type=True, strict_mode=True)
+        C.check_model_path(model, num_threads, skip_tensor_data, full_check)
     else:
         protobuf_string: bytes
         if isinstance(model, bytes):
             protobuf_string = model
         else:
             assert isinstance(model, ModelProto)
-            protobuf_string = model.SerializeToString()
+            tensor_stub = _tensor_header if skip_tensor_data else _tensor_placeholder  # type: Callable[[TensorProto], TensorProto]
+            if full_check:
+                # Shape inference may read the data of every tensor but the unread initializers
+                tensor_stub = _stub_only(_unread_initializers(model), tensor_stub)
+            # The locations of external data are rewritten in the serialized copy, not in model
+            relocate = base_dir is not None and any(uses_external_data(tensor) for tensor in _get_all_tensors(model))
+            if relocate:
+                tensor_stub = _relocated(cast(Text, base_dir), tensor_stub)
+            protobuf_string = b''
+            # The size of the initializers is estimated without serializing them
+            if not skip_tensor_data and not relocate and _initializer_data_size(model) < MAXIMUM_PROTOBUF:
+                protobuf_string = model.SerializeToString()
+            if not protobuf_string or len(protobuf_string) > MAXIMUM_PROTOBUF:
+                protobuf_string = _serialize_with_tensor_stubs(model, tensor_stub)
         # If the protobuf is larger than 2GB,
         # remind users should use the model path to check
-        if sys.getsizeof(protobuf_string) > MAXIMUM_PROTOBUF:
+        if len(protobuf_string) > MAXIMUM_PROTOBUF:
             raise ValueError('This protobuf of onnx model is too large (>2GB). Call check_model with model path instead.')
-        C.check_model(protobuf_string)
-        if full_check:
-            onnx.shape_inference.infer_shapes(model, check_type=True, strict_mode=True)
+        C.check_model(protobuf_string, num_threads, skip_tensor_data, full_check)
+
+
+def _relocated(base_dir, tensor_stub):  # type: (Text, Callable[[TensorProto], TensorProto]) -> Callable[[TensorProto], TensorProto]
+    """
+    Return a tensor_stub that writes tensors with external data as copies whose location
+    is the path of their data in base_dir, and every other tensor as tensor_stub does.
+    """
+    def stub(tensor):  # type: (TensorProto) -> TensorProto
+        if not uses_external_data(tensor):
+            return tensor_stub(tensor)
+        relocated = TensorProto()
+        relocated.CopyFrom(tensor)
+        for entry in relocated.external_data:
+            if entry.key == 'location':
+                entry.value = get_external_data_file_path(tensor, base_dir)
+        return relocated
+    return stub
 
 
 ValidationError = C.ValidationError
@@ -286,15 +286,16 @@ PYBIND11_MODULE(onnx_cpp2py_export, onnx_cpp2py_export) {
         checker::check_graph(proto, ctx, lex_ctx);
       });
 
-  checker.def("check_model", [](const py::bytes& bytes) -> void {
+  checker.def("check_model", [](const py::bytes& bytes, int num_threads, bool skip_tensor_data, bool full_check) -> void {
     ModelProto proto{};
     ParseProtoFromPyBytes(&proto, bytes);
-    checker::check_model(proto);
-  });
+    checker::check_model(proto, num_threads, skip_tensor_data, full_check);
+  }, "bytes"_a, "num_threads"_a = 1, "skip_tensor_data"_a = false, "full_check"_a = false);
 
   checker.def(
       "check_model_path",
-      (void (*)(const std::string&)) & checker::check_model);
+      (void (*)(const std::string&, int, bool, bool)) & checker::check_model,
+      "path"_a, "num_threads"_a = 1, "skip_tensor_data"_a = false, "full_check"_a = false);
 
   // Submodule `version_converter`
   auto version_converter =
@@ -320,18 +321,63 @@ PYBIND11_MODULE(onnx_cpp2py_export, onnx_cpp2py_export) {
   py::register_exception<InferenceError>(shape_inference, "InferenceError");
 
 
-  shape_inference.def("infer_shapes", [](const py::bytes& bytes, bool check_type, bool strict_mode, bool data_prop) {
+  py::class_<shape_inference::FunctionInferenceStats>(shape_inference, "FunctionInferenceStats")
+      .def(py::init<>())
+      .def_readonly("hits", &shape_inference::FunctionInferenceStats::hits)
+      .def_readonly("misses", &shape_inference::FunctionInferenceStats::misses);
+
+  shape_inference.def("infer_shapes", [](const py::bytes& bytes, bool check_type, bool strict_mode, bool data_prop,
+                                         shape_inference::FunctionInferenceStats* function_stats, int num_threads) {
     ModelProto proto{};
     ParseProtoFromPyBytes(&proto, bytes);
     ShapeInferenceOptions options {check_type, strict_mode == true ? 1 : 0, data_prop};
     shape_inference::InferShapes(proto,
                                  OpSchemaRegistry::Instance(),
-                                 options);
+                                 options,
+                                 function_stats,
+                                 num_threads);
     std::string out;
     proto.SerializeToString(&out);
     return py::bytes(out);
+  }, "bytes"_a, "check_type"_a = false, "strict_mode"_a = false, "data_prop"_a = false, "function_stats"_a = nullptr,
+     "num_threads"_a = 1);
+
+  shape_inference.def("infer_value_infos", [](const py::bytes& bytes, bool check_type, bool strict_mode, bool data_prop) {
+    ModelProto proto{};
+    ParseProtoFromPyBytes(&proto, bytes);
+    ShapeInferenceOptions options {check_type, strict_mode == true ? 1 : 0, data_prop};
+    shape_inference::InferShapes(proto,
+                                 OpSchemaRegistry::Instance(),
+                                 options);
+    // Only the value infos of the main graph are returned, as a GraphProto
+    GraphProto value_infos;
+    value_infos.mutable_value_info()->Swap(proto.mutable_graph()->mutable_value_info());
+    std::string out;
+    value_infos.SerializeToString(&out);
+    return py::bytes(out);
   }, "bytes"_a, "check_type"_a = false, "strict_mode"_a = false, "data_prop"_a = false);
 
+  shape_inference.def(
+      "infer_shapes_incremental",
+      [](const py::bytes& bytes,
+         const std::vector<int>& changed_nodes,
+         bool check_type,
+         bool strict_mode,
+         bool data_prop) {
+        ModelProto proto{};
+        ParseProtoFromPyBytes(&proto, bytes);
+        ShapeInferenceOptions options{check_type, strict_mode == true ? 1 : 0, data_prop};
+        shape_inference::InferShapesIncrementally(proto, changed_nodes, OpSchemaRegistry::Instance(), options);
+        std::string out;
+        proto.SerializeToString(&out);
+        return py::bytes(out);
+      },
+      "bytes"_a,
+      "changed_nodes"_a,
+      "check_type"_a = false,
+      "strict_mode"_a = false,
+      "data_prop"_a = false);
+
   shape_inference.def(
       "infer_shapes_path",
       [](const std::string& model_path, const std::string& output_path, bool check_type, bool strict_mode, bool data_prop)  -> void {
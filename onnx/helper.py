@@ -214,8 +214,11 @@ def set_model_props(model, dict_value):  # type: (ModelProto, Dict[Text, Text])
 
 
 def split_complex_to_pairs(ca):  # type: (Sequence[np.complex64]) -> Sequence[int]
-    return [(ca[i // 2].real if (i % 2 == 0) else ca[i // 2].imag)
-            for i in range(len(ca) * 2)]
+    arr = np.asarray(ca)
+    if arr.dtype != np.complex64:
+        arr = arr.astype(np.complex128)
+    # Reinterpret each complex value as its (real, imag) pair
+    return cast(Sequence[int], np.ascontiguousarray(arr.ravel()).view(arr.real.dtype).tolist())
 
 
 def make_tensor(
@@ -260,7 +263,10 @@ def make_tensor(
         # floa16/bfloat16 are stored as uint16
         elif (data_type == TensorProto.FLOAT16
                 or data_type == TensorProto.BFLOAT16):
-            vals = np.array(vals).astype(np.float16).view(dtype=np.uint16).flatten().tolist()
+            vals = np.asarray(vals, dtype=np.float16).ravel().view(dtype=np.uint16).tolist()
+        elif type(vals) is np.ndarray:
+            # Extending a repeated field from a list avoids boxing numpy scalars
+            vals = vals.tolist()
         field = mapping.STORAGE_TENSOR_TYPE_TO_FIELD[
             mapping.TENSOR_TYPE_TO_STORAGE_TENSOR_TYPE[data_type]]
         getattr(tensor, field).extend(vals)
@@ -16,5 +16,5 @@ def check_sparse_tensor(bytes: bytes, checker_context: CheckerContext) -> None:
 def check_attribute(bytes: bytes, checker_context: CheckerContext) -> None: ...
 def check_node(bytes: bytes, checker_context: CheckerContext) -> None: ...
 def check_graph(bytes: bytes, checker_context: CheckerContext) -> None: ...
-def check_model(bytes: bytes) -> None: ...
-def check_model_path(path: Text) -> None: ...
+def check_model(bytes: bytes, num_threads: int = ..., skip_tensor_data: bool = ..., full_check: bool = ...) -> None: ...
+def check_model_path(path: Text, num_threads: int = ..., skip_tensor_data: bool = ..., full_check: bool = ...) -> None: ...
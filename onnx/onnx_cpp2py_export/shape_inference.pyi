@@ -1,9 +1,17 @@
-from typing import Text
+from typing import Optional, Sequence, Text
 
 
 class InferenceError(Exception):
     ...
 
-def infer_shapes(b: bytes, check_type: bool, strict_mode: bool, data_prop: bool) -> bytes: ...
+class FunctionInferenceStats:
+    hits: int
+    misses: int
+
+def infer_shapes(b: bytes, check_type: bool, strict_mode: bool, data_prop: bool, function_stats: Optional[FunctionInferenceStats] = ..., num_threads: int = ...) -> bytes: ...
+
+def infer_value_infos(b: bytes, check_type: bool, strict_mode: bool, data_prop: bool) -> bytes: ...
+
+def infer_shapes_incremental(b: bytes, changed_nodes: Sequence[int], check_type: bool, strict_mode: bool, data_prop: bool) -> bytes: ...
 
 def infer_shapes_path(model_path: Text, output_path: Text, check_type: bool, strict_mode: bool, data_prop: bool) -> None: ...
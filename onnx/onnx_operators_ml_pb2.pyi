@@ -0,0 +1,67 @@
+# @generated by generate_proto_mypy_stubs.py.  Do not edit!
+from google.protobuf.message import (
+    Message,
+)
+
+from typing import (
+    Iterable,
+    Optional as OptionalType,
+    Text,
+)
+
+from onnx.onnx_ml_pb2 import (
+    FunctionProto,
+    OperatorStatus,
+)
+
+from google.protobuf.internal.containers import (
+    RepeatedCompositeFieldContainer,
+)
+
+class OperatorProto(Message):
+    op_type = ... # type: Text
+    since_version = ... # type: int
+    status = ... # type: OperatorStatus
+    doc_string = ... # type: Text
+    
+    def __init__(self,
+        op_type : OptionalType[Text] = None,
+        since_version : OptionalType[int] = None,
+        status : OptionalType[OperatorStatus] = None,
+        doc_string : OptionalType[Text] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> OperatorProto: ...
+    def MergeFrom(self, other_msg: Message) -> None: ...
+    def CopyFrom(self, other_msg: Message) -> None: ...
+
+class OperatorSetProto(Message):
+    magic = ... # type: Text
+    ir_version = ... # type: int
+    ir_version_prerelease = ... # type: Text
+    ir_build_metadata = ... # type: Text
+    domain = ... # type: Text
+    opset_version = ... # type: int
+    doc_string = ... # type: Text
+    
+    @property
+    def operator(self) -> RepeatedCompositeFieldContainer[OperatorProto]: ...
+    
+    @property
+    def functions(self) -> RepeatedCompositeFieldContainer[FunctionProto]: ...
+    
+    def __init__(self,
+        magic : OptionalType[Text] = None,
+        ir_version : OptionalType[int] = None,
+        ir_version_prerelease : OptionalType[Text] = None,
+        ir_build_metadata : OptionalType[Text] = None,
+        domain : OptionalType[Text] = None,
+        opset_version : OptionalType[int] = None,
+        doc_string : OptionalType[Text] = None,
+        operator : OptionalType[Iterable[OperatorProto]] = None,
+        functions : OptionalType[Iterable[FunctionProto]] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> OperatorSetProto: ...
+    def MergeFrom(self, other_msg: Message) -> None: ...
+    def CopyFrom(self, other_msg: Message) -> None: ...
@@ -11,8 +11,9 @@ from __future__ import unicode_literals
 
 import onnx
 import onnx.onnx_cpp2py_export.shape_inference as C
-from onnx import ModelProto
-from typing import Text, Union
+from onnx import ModelProto, GraphProto, ValueInfoProto
+from onnx._serialization import _serialize_with_tensor_stubs, _stub_only, _tensor_header, _unread_initializers
+from typing import List, Optional, Sequence, Text, Union
 
 """Apply shape inference to the provided ModelProto.
 
@@ -26,19 +27,25 @@ bool check_type: Checks the type-equality for input and output
 bool strict_mode: Stricter shape inference, it will throw errors if any;
     Otherwise, simply stop if any error
 bool data_prop: Enables data propagation for limited operators to perform shape computation
+FunctionInferenceStats function_stats: If given, set to the number of function calls whose
+    output types were reused from a call with the same input types and attributes (hits),
+    and of function calls inferred (misses)
+int num_threads: Number of threads inferring independent subgraphs, such as the branches of If,
+    and independent function calls, or 0 for one per core. 1 infers serially. The inferred types
+    are the same, but the names generated for unknown dimensions may differ
 
 Arguments:
-    input (Union[ModelProto, Text, bytes], bool, bool, bool) -> ModelProto
+    input (Union[ModelProto, Text, bytes], bool, bool, bool, Optional[FunctionInferenceStats], int) -> ModelProto
 
 Return:
     return (ModelProto) model with inferred shape information
 """
 
 
-def infer_shapes(model, check_type=False, strict_mode=False, data_prop=False):  # type: (Union[ModelProto, bytes], bool, bool, bool) -> ModelProto
+def infer_shapes(model, check_type=False, strict_mode=False, data_prop=False, function_stats=None, num_threads=1):  # type: (Union[ModelProto, bytes], bool, bool, bool, Optional[C.FunctionInferenceStats], int) -> ModelProto
     if isinstance(model, (ModelProto, bytes)):
         model_str = model if isinstance(model, bytes) else model.SerializeToString()
-        inferred_model_str = C.infer_shapes(model_str, check_type, strict_mode, data_prop)
+        inferred_model_str = C.infer_shapes(model_str, check_type, strict_mode, data_prop, function_stats, num_threads)
         return onnx.load_from_string(inferred_model_str)
     elif isinstance(model, str):
         raise TypeError('infer_shapes only accepts ModelProto or bytes,'
@@ -48,6 +55,47 @@ def infer_shapes(model, check_type=False, strict_mode=False, data_prop=False):
                          'incorrect type: {}'.format(type(model)))
 
 
+def infer_value_infos(model, check_type=False, strict_mode=False, data_prop=False):  # type: (Union[ModelProto, bytes], bool, bool, bool) -> List[ValueInfoProto]
+    """
+    Apply shape inference as infer_shapes does, but return only the value_info of the main
+    graph, existing and inferred, instead of the whole inferred model. Large initializers of a
+    ModelProto are passed to shape inference without their data, but for the INT32 and INT64
+    ones a node consumes, as shape inference may read them, such as the shape input of a Reshape.
+    """
+    if isinstance(model, (ModelProto, bytes)):
+        if isinstance(model, bytes):
+            model_str = model
+        else:
+            unread = _unread_initializers(model)
+            if unread:
+                model_str = _serialize_with_tensor_stubs(model, _stub_only(unread, _tensor_header))
+            else:
+                model_str = model.SerializeToString()
+        value_infos = GraphProto()
+        value_infos.ParseFromString(C.infer_value_infos(model_str, check_type, strict_mode, data_prop))
+        return list(value_infos.value_info)
+    else:
+        raise TypeError('infer_value_infos only accepts ModelProto or bytes, '
+                        'incorrect type: {}'.format(type(model)))
+
+
+def infer_shapes_incremental(model, changed_nodes, check_type=False, strict_mode=False, data_prop=False):  # type: (Union[ModelProto, bytes], Sequence[int], bool, bool, bool) -> ModelProto
+    """
+    Apply shape inference to a model already inferred and then edited, inferring only the
+    nodes of the main graph given by their index in changed_nodes and the nodes downstream of them.
+    The types in value_info are used for the outputs of the other nodes. The value_info entries
+    of the outputs inferred again are replaced, and in the subgraphs of the nodes inferred again,
+    the value_info entries and the shapes of the outputs. The other arguments are as for infer_shapes.
+    """
+    if isinstance(model, (ModelProto, bytes)):
+        model_str = model if isinstance(model, bytes) else model.SerializeToString()
+        inferred_model_str = C.infer_shapes_incremental(model_str, list(changed_nodes), check_type, strict_mode, data_prop)
+        return onnx.load_from_string(inferred_model_str)
+    else:
+        raise TypeError('infer_shapes_incremental only accepts ModelProto or bytes, '
+                        'incorrect type: {}'.format(type(model)))
+
+
 def infer_shapes_path(model_path, output_path='', check_type=False, strict_mode=False, data_prop=False):  # type: (Text, Text, bool, bool, bool) -> None
     """
     Take model path for shape_inference same as infer_shape; it support >2GB models
@@ -68,3 +116,4 @@ def infer_shapes_path(model_path, output_path='', check_type=False, strict_mode=
 
 
 InferenceError = C.InferenceError
+FunctionInferenceStats = C.FunctionInferenceStats
@@ -4,6 +4,10 @@
 
 #pragma once
 
+#include <cstdint>
+#include <exception>
+#include <memory>
+
 #include "onnx/defs/function.h"
 #include "onnx/defs/schema.h"
 #include "onnx/proto_utils.h"
@@ -80,6 +84,114 @@ class SymbolTableImpl : public SymbolTable {
   }
 };
 
+// Records the symbols created by an inference run on another thread under temporary names,
+// so that they can be created in the shared symbol table later, in the order in which a
+// serial inference run would have created them.
+class DeferredSymbolTable : public SymbolTable {
+ public:
+  explicit DeferredSymbolTable(SymbolTable* parent) : parent_{parent} {}
+
+  void addFromGraph(const GraphProto& g) override {
+    parent_->addFromGraph(g);
+  }
+
+  std::string createNew(const std::string& symbol_prefix) override {
+    std::string symbol =
+        "\001deferred" + to_string(reinterpret_cast<uintptr_t>(this)) + '_' + to_string(symbols_.size());
+    symbols_.emplace_back(symbol, symbol_prefix);
+    return symbol;
+  }
+
+  // Creates the recorded symbols in the parent table.
+  // Returns the symbol created for each temporary name
+  std::unordered_map<std::string, std::string> commit() {
+    std::unordered_map<std::string, std::string> symbols;
+    for (const auto& symbol : symbols_) {
+      symbols[symbol.first] = parent_->createNew(symbol.second);
+    }
+    symbols_.clear();
+    return symbols;
+  }
+
+ private:
+  SymbolTable* parent_;
+  // Temporary name and prefix of each symbol, in creation order
+  std::vector<std::pair<std::string, std::string>> symbols_;
+};
+
+struct FunctionInferenceStats {
+  // Number of function calls whose output types were taken from the cache
+  size_t hits = 0;
+  // Number of function calls inferred, including those that cannot be cached because of
+  // constant input data or data propagation
+  size_t misses = 0;
+};
+
+// Caches the output types inferred for the calls of functions during an inference run,
+// by function, input types and attribute values. A function is identified by the
+// address of its FunctionProto, so a cache must not outlive the inference run.
+class FunctionInferenceCache {
+ public:
+  FunctionInferenceCache() = default;
+
+  // Creates a cache for a part of the inference run on another thread. It finds the entries
+  // of parent too, which must not change meanwhile, and keeps its own until merged into parent.
+  explicit FunctionInferenceCache(const FunctionInferenceCache* parent) : parent_{parent} {}
+
+  // Returns the output types cached for key, or nullptr if there are none
+  const std::vector<TypeProto>* find(const std::string& key) {
+    const auto* output_types = lookup(key);
+    if (!output_types) {
+      ++stats_.misses;
+      return nullptr;
+    }
+    ++stats_.hits;
+    return output_types;
+  }
+
+  // Counts a call that is inferred without a lookup, as it cannot be cached
+  void countUncached() {
+    ++stats_.misses;
+  }
+
+  // Whether output types are cached for key, without counting a hit or a miss
+  bool contains(const std::string& key) const {
+    return lookup(key) != nullptr;
+  }
+
+  void insert(const std::string& key, std::vector<TypeProto> output_types) {
+    entries_[key] = std::move(output_types);
+  }
+
+  // Adds the entries and stats of a cache created with this one as parent
+  void merge(FunctionInferenceCache& cache) {
+    for (auto& entry : cache.entries_) {
+      entries_.emplace(entry.first, std::move(entry.second));
+    }
+    cache.entries_.clear();
+    stats_.hits += cache.stats_.hits;
+    stats_.misses += cache.stats_.misses;
+    cache.stats_ = FunctionInferenceStats{};
+  }
+
+  const FunctionInferenceStats& stats() const {
+    return stats_;
+  }
+
+ private:
+  const std::vector<TypeProto>* lookup(const std::string& key) const {
+    auto iter = entries_.find(key);
+    if (iter != entries_.end()) {
+      return &iter->second;
+    }
+    return parent_ ? parent_->lookup(key) : nullptr;
+  }
+
+  const FunctionInferenceCache* parent_ = nullptr;
+  std::unordered_map<std::string, std::vector<TypeProto>> entries_;
+  FunctionInferenceStats stats_;
+};
+
 struct GraphInferenceContext {
   GraphInferenceContext(
       const std::unordered_map<std::string, TypeProto*>&
@@ -88,13 +200,17 @@ struct GraphInferenceContext {
       SymbolTable* symbol_table_in = nullptr,
       const ISchemaRegistry* schema_registry_in = OpSchemaRegistry::Instance(),
       const int ir_version_in = IR_VERSION,
-      const ModelLocalFunctionsMap& model_local_functions_in = {})
+      const ModelLocalFunctionsMap& model_local_functions_in = {},
+      FunctionInferenceCache* function_cache_in = nullptr,
+      int num_threads_in = 1)
       : outer_scope_value_types_by_name{&outer_scope_value_types_by_name_in},
         opset_imports{opset_imports_in},
         symbol_table{symbol_table_in},
         schema_registry{schema_registry_in},
         ir_version{ir_version_in},
-        model_local_functions{model_local_functions_in} {}
+        model_local_functions{model_local_functions_in},
+        function_cache{function_cache_in},
+        num_threads{num_threads_in} {}
 
   const std::unordered_map<std::string, TypeProto*>* outer_scope_value_types_by_name;
   const std::unordered_map<std::string, int> opset_imports;
@@ -102,6 +218,8 @@ struct GraphInferenceContext {
   const ISchemaRegistry* schema_registry;
   const int ir_version;
   const ModelLocalFunctionsMap& model_local_functions;
+  FunctionInferenceCache* function_cache;
+  const int num_threads;
 };
 
 class GraphInferencerImpl : public GraphInferencer {
@@ -117,9 +235,28 @@ class GraphInferencerImpl : public GraphInferencer {
     return context_->symbol_table;
   }
 
+  // Infers the graphs of inferencers, which take no inputs, on num_threads threads ahead of
+  // the doInferencing calls without inputs that will return their results. The graphs are
+  // inferred on copies. A copy, with the symbols and function cache entries created for it,
+  // takes the place of the graph when doInferencing asks for it, so the graphs a serial
+  // inference would not have reached are left as they are.
+  static void prefetchInferencing(const std::vector<GraphInferencerImpl*>& inferencers, int num_threads);
+
  private:
+  std::vector<const TypeProto*> inferGraph(
+      GraphProto* g,
+      SymbolTable* symbol_table,
+      FunctionInferenceCache* function_cache,
+      const std::vector<const TypeProto*>& input_types,
+      int num_threads);
+
   GraphProto* g_;
   GraphInferenceContext* context_;
+  // Result of prefetchInferencing, if doInferencing has not asked for it yet
+  std::unique_ptr<GraphProto> prefetched_graph_;
+  std::unique_ptr<DeferredSymbolTable> prefetched_symbols_;
+  std::unique_ptr<FunctionInferenceCache> prefetched_function_cache_;
+  std::exception_ptr prefetched_error_;
 };
 
 struct InferenceContextImpl : public InferenceContext {
@@ -435,9 +572,31 @@ void mergeShapesAndTypes(const TypeProto_Sequence& inferredType, TypeProto_Tenso
 
 void mergeShapesAndTypes(const TypeProto& inferredType, TypeProto* existingType);
 
+///
+/// The calls of functions with the same input types and attribute values are inferred once.
+/// If function_stats is not null, it is set to the hits and misses of the cache of their results.
+/// num_threads is the number of threads inferring independent subgraphs and function calls,
+/// or 0 for one per core. 1 infers serially.
+///
 void InferShapes(
     ModelProto& m,
     const ISchemaRegistry* schema_registry = OpSchemaRegistry::Instance(),
+    const ShapeInferenceOptions& options = {},
+    FunctionInferenceStats* function_stats = nullptr,
+    int num_threads = 1
+    );
+
+///
+/// Infers the types of the outputs of the changed nodes of the main graph, given by their
+/// index, and of the nodes downstream of them. The other nodes are not inferred again: the
+/// types in value_info are used for their outputs. The value_info entries of the outputs
+/// inferred again are replaced, and in the subgraphs of the nodes inferred again, the
+/// value_info entries and the shapes of the outputs.
+///
+void InferShapesIncrementally(
+    ModelProto& m,
+    const std::vector<int>& changed_nodes,
+    const ISchemaRegistry* schema_registry = OpSchemaRegistry::Instance(),
     const ShapeInferenceOptions& options = {}
     );
 
@@ -471,7 +630,8 @@ void InferShapeForFunctionNode(
     const ShapeInferenceOptions& options = {},
     const ModelLocalFunctionsMap& model_local_functions_map = {},
     SymbolTable* symbolTable = nullptr,
-    std::unordered_map<std::string, TensorShapeProto>* generatedShapeDataByName = nullptr);
+    std::unordered_map<std::string, TensorShapeProto>* generatedShapeDataByName = nullptr,
+    FunctionInferenceCache* function_cache = nullptr);
 
 ///
 /// ModelLocalFunctionsMap is a map of function id -> model local function proto
@@ -485,7 +645,8 @@ void InferShapeForFunctionNode(
     const ShapeInferenceOptions& options = {},
     const ModelLocalFunctionsMap& model_local_functions_map = {},
     SymbolTable* symbolTable = nullptr,
-    std::unordered_map<std::string, TensorShapeProto>* generated_shape_data_by_name = nullptr);
+    std::unordered_map<std::string, TensorShapeProto>* generated_shape_data_by_name = nullptr,
+    FunctionInferenceCache* function_cache = nullptr);
 
 std::string GetErrorWithNodeInfo(NodeProto n, std::runtime_error err);
 
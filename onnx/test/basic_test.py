@@ -7,11 +7,14 @@ from __future__ import unicode_literals
 
 from onnx import AttributeProto, NodeProto, GraphProto, ModelProto, TensorProto, IR_VERSION
 
+import asyncio
 import io
+import mmap
 import onnx
 import os
 import tempfile
 import unittest
+from unittest import mock
 
 from onnx import helper
 
@@ -61,6 +64,91 @@ class TestBasicFunctions(unittest.TestCase):
         finally:
             os.remove(fi.name)
 
+    def test_load_model_from_buffer(self):  # type: () -> None
+        proto = self._simple_model()
+        proto_string = onnx._serialize(proto)
+
+        for buffer in [bytearray(proto_string), memoryview(proto_string)]:
+            self.assertEqual(onnx.load_model_from_string(buffer), proto)
+        self.assertEqual(onnx.load_tensor_from_string(memoryview(onnx._serialize(self._simple_tensor()))),
+                         self._simple_tensor())
+        self.assertRaises(ValueError, onnx.load_model_from_string, 'not a buffer')
+
+        try:
+            fi = tempfile.NamedTemporaryFile(delete=False)
+            fi.write(proto_string)
+            fi.close()
+            with open(fi.name, 'rb') as readable:
+                mapped = mmap.mmap(readable.fileno(), 0, access=mmap.ACCESS_READ)
+                self.assertEqual(onnx.load_model_from_string(mapped), proto)
+                mapped.close()
+        finally:
+            os.remove(fi.name)
+
+    def test_load_empty_model_file(self):  # type: () -> None
+        try:
+            fi = tempfile.NamedTemporaryFile(delete=False)
+            fi.close()
+            self.assertEqual(onnx.load_model(fi.name), ModelProto())
+        finally:
+            os.remove(fi.name)
+
+    def test_save_model_streams_same_bytes(self):  # type: () -> None
+        node = helper.make_node('Add', ['X', 'W'], ['Y'])
+        graph = helper.make_graph(
+            [node], 'test-graph',
+            [helper.make_tensor_value_info('X', TensorProto.FLOAT, [2, 3, 4])],
+            [helper.make_tensor_value_info('Y', TensorProto.FLOAT, [2, 3, 4])],
+            initializer=[self._simple_tensor(), helper.make_tensor('W', TensorProto.FLOAT, [1], [1.0])])
+        proto = helper.make_model(graph, producer_name='test', doc_string='doc')
+        helper.set_model_props(proto, {'key': 'value'})
+
+        class RecordingStream(io.BytesIO):
+            writes = 0
+
+            def write(self, data):  # type: ignore
+                self.writes += 1
+                return super(RecordingStream, self).write(data)
+
+        f = RecordingStream()
+        onnx.save_model(proto, f)
+        self.assertEqual(f.getvalue(), proto.SerializeToString())
+        self.assertEqual(f.writes, 1)
+
+        # Models with large initializers are written field by field
+        with mock.patch.object(onnx._serialization, '_STREAM_SIZE_THRESHOLD', 0):
+            f = RecordingStream()
+            onnx.save_model(proto, f)
+            self.assertEqual(f.getvalue(), proto.SerializeToString())
+            self.assertGreater(f.writes, 1)
+
+            # Models with unknown fields are still saved in full
+            proto.ParseFromString(proto.SerializeToString() + b'\xf8\x07\x01')
+            f = RecordingStream()
+            onnx.save_model(proto, f)
+            self.assertEqual(f.getvalue(), proto.SerializeToString())
+            self.assertEqual(f.writes, 1)
+
+    def test_save_and_load_model_async(self):  # type: () -> None
+        proto = self._simple_model()
+        try:
+            fi = tempfile.NamedTemporaryFile(delete=False)
+            fi.close()
+
+            async def save_and_load():  # type: () -> ModelProto
+                await onnx.save_model_async(proto, fi.name)
+                return await onnx.load_model_async(fi.name)
+
+            # asyncio.run() only exists since Python 3.7
+            loop = asyncio.new_event_loop()
+            try:
+                loaded_proto = loop.run_until_complete(save_and_load())
+            finally:
+                loop.close()
+            self.assertTrue(proto == loaded_proto)
+        finally:
+            os.remove(fi.name)
+
     def test_save_and_load_tensor(self):  # type: () -> None
         proto = self._simple_tensor()
         cls = TensorProto
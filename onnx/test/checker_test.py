@@ -4,11 +4,15 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
+import os
+import tempfile
 import unittest
+from unittest import mock
 
-from typing import Sequence, Text
+from typing import Any, List, Optional, Sequence, Text, cast
 import numpy as np
 
+import onnx
 from onnx import checker, helper, numpy_helper, shape_inference
 from onnx import TensorProto, GraphProto, SparseTensorProto
 import onnx.onnx_cpp2py_export.checker as C
@@ -226,6 +230,212 @@ class TestChecker(unittest.TestCase):
 
         checker.check_model(model.SerializeToString())
 
+    def _assert_same_check_result(self, model):  # type: (onnx.ModelProto) -> None
+        errors = []  # type: List[Optional[Text]]
+        for num_threads in (1, 4, 0):
+            try:
+                checker.check_model(model, num_threads=num_threads)
+                errors.append(None)
+            except checker.ValidationError as e:
+                errors.append(str(e))
+        self.assertEqual(errors[0], errors[1])
+        self.assertEqual(errors[0], errors[2])
+
+    def _make_chain_model(self, num_nodes):  # type: (int) -> onnx.ModelProto
+        nodes = []
+        initializers = []
+        for i in range(num_nodes):
+            initializers.append(numpy_helper.from_array(np.full((1, 2), i, dtype=np.float32), "W{}".format(i)))
+            nodes.append(helper.make_node("Add", ["X{}".format(i), "W{}".format(i)], ["X{}".format(i + 1)]))
+        graph = helper.make_graph(
+            nodes,
+            "test",
+            [helper.make_tensor_value_info("X0", TensorProto.FLOAT, [1, 2])],
+            [helper.make_tensor_value_info("X{}".format(num_nodes), TensorProto.FLOAT, [1, 2])],
+            initializer=initializers)
+        return helper.make_model(graph, producer_name='test')
+
+    def test_check_model_num_threads(self):  # type: () -> None
+        model = self._make_chain_model(200)
+        checker.check_model(model, num_threads=4)
+        checker.check_model(model, num_threads=0)
+
+        # The first error in graph order is reported, whichever thread finds it
+        invalid = self._make_chain_model(200)
+        invalid.graph.node[150].op_type = "NoSuchOp"
+        invalid.graph.node[170].input[0] = "undefined"
+        self._assert_same_check_result(invalid)
+        invalid.graph.node[50].input[0] = "undefined"
+        self._assert_same_check_result(invalid)
+        invalid.graph.node[50].output[0] = "X1"
+        self._assert_same_check_result(invalid)
+
+        invalid = self._make_chain_model(20)
+        invalid.graph.initializer[3].raw_data = b'\x00'
+        invalid.graph.initializer[5].name = "W4"
+        self._assert_same_check_result(invalid)
+        invalid.graph.initializer[2].name = ""
+        self._assert_same_check_result(invalid)
+
+    def test_check_model_num_threads_subgraph_scope(self):  # type: () -> None
+        def make_model(subgraph_input, subgraph_output):  # type: (Text, Text) -> onnx.ModelProto
+            subgraph = helper.make_graph(
+                [helper.make_node("Relu", [subgraph_input], [subgraph_output])],
+                "subgraph",
+                [],
+                [helper.make_tensor_value_info(subgraph_output, TensorProto.FLOAT, [1, 2])])
+            nodes = [
+                helper.make_node("If", ["cond"], ["Y"], then_branch=subgraph, else_branch=subgraph),
+                helper.make_node("Relu", ["X"], ["late"]),
+            ]
+            graph = helper.make_graph(
+                nodes,
+                "test",
+                [helper.make_tensor_value_info("cond", TensorProto.BOOL, []),
+                 helper.make_tensor_value_info("X", TensorProto.FLOAT, [1, 2])],
+                [helper.make_tensor_value_info("Y", TensorProto.FLOAT, [1, 2])])
+            return helper.make_model(graph, producer_name='test')
+
+        # A subgraph cannot use a name the outer graph defines after it
+        model = make_model("late", "Z")
+        self.assertRaises(checker.ValidationError, checker.check_model, model, num_threads=4)
+        self._assert_same_check_result(model)
+        # but it may define such a name itself
+        model = make_model("X", "late")
+        checker.check_model(model, num_threads=4)
+        self._assert_same_check_result(model)
+
+    def test_check_model_skip_tensor_data(self):  # type: () -> None
+        model = self._make_chain_model(3)
+        constant = helper.make_node("Constant", [], ["C"], value=numpy_helper.from_array(np.ones((2, 2), dtype=np.float32)))
+        model.graph.node.append(constant)
+        # Data stored in two fields at once is only caught when checking the data
+        model.graph.initializer[1].float_data.extend([1.0, 2.0])
+        self.assertRaises(checker.ValidationError, checker.check_model, model)
+        checker.check_model(model, skip_tensor_data=True)
+        checker.check_model(model.SerializeToString(), skip_tensor_data=True)
+
+        # The checker is passed the model without the data of its tensors
+        with mock.patch.object(C, "check_model", wraps=C.check_model) as check_model:
+            checker.check_model(model, skip_tensor_data=True)
+        stripped = onnx.load_model_from_string(check_model.call_args[0][0])
+        for tensor in list(stripped.graph.initializer) + [stripped.graph.node[3].attribute[0].t]:
+            self.assertFalse(tensor.HasField("raw_data"))
+            self.assertEqual(len(tensor.float_data), 0)
+        self.assertEqual(stripped.graph.initializer[1].dims, model.graph.initializer[1].dims)
+        self.assertEqual(stripped.graph.initializer[1].name, "W1")
+        self.assertEqual(len(model.graph.initializer[1].float_data), 2)
+
+        # Structural errors are still reported
+        model.graph.initializer[0].data_type = TensorProto.UNDEFINED
+        self.assertRaises(checker.ValidationError, checker.check_model, model, skip_tensor_data=True)
+
+    def _check_as_over_2gb(self, model, **kwargs):  # type: (onnx.ModelProto, **Any) -> bytes
+        """Checks model as if it were over 2GB, and returns the bytes passed to the C++ checker."""
+        with mock.patch.object(checker, "MAXIMUM_PROTOBUF", model.ByteSize() - 1), \
+                mock.patch.object(C, "check_model", wraps=C.check_model) as check_model:
+            checker.check_model(model, **kwargs)
+        return cast(bytes, check_model.call_args[0][0])
+
+    def test_check_model_in_memory(self):  # type: () -> None
+        def check_result(model):  # type: (onnx.ModelProto) -> Sequence[Text]
+            results = []
+            checks = [
+                lambda: C.check_model(model.SerializeToString()),
+                lambda: checker.check_model(model),
+                # Models over 2GB are passed to the checker with tensor placeholders
+                lambda: self._check_as_over_2gb(model),
+            ]
+            for check in checks:
+                try:
+                    check()
+                    results.append("")
+                except checker.ValidationError as e:
+                    results.append(str(e))
+            return results
+
+        model = self._make_chain_model(3)
+        model.graph.node.append(helper.make_node(
+            "Constant", [], ["C"], value=helper.make_tensor("c", TensorProto.INT64, [2], [1, 2])))
+        model.graph.sparse_initializer.extend([self.make_sparse([100], [13, 17, 19], [3], [9, 27, 81])])
+        model.graph.sparse_initializer[0].values.name = "S"
+        model.graph.initializer.extend([numpy_helper.from_array(np.zeros((0, 2), dtype=np.float32), "E")])
+        self.assertEqual(check_result(model), ["", "", ""])
+        self.assertLess(len(self._check_as_over_2gb(model)), model.ByteSize())
+
+        # The tensors passed to the checker give the same result as the original ones
+        invalid_tensors = [
+            lambda m: m.graph.initializer[0].ClearField("raw_data"),
+            lambda m: setattr(m.graph.initializer[0], "raw_data", b""),
+            lambda m: m.graph.initializer[1].float_data.append(1.0),
+            lambda m: setattr(m.graph.initializer[2], "data_type", TensorProto.STRING),
+            lambda m: setattr(m.graph.initializer[3], "raw_data", b"\0"),
+            lambda m: setattr(m.graph.node[3].attribute[0].t, "data_type", TensorProto.FLOAT),
+            lambda m: setattr(m.graph.node[3].attribute[0].t, "data_type", TensorProto.STRING),
+            lambda m: m.graph.sparse_initializer[0].indices.int64_data.__setitem__(2, 181),
+        ]
+        for invalidate in invalid_tensors:
+            invalid = onnx.ModelProto()
+            invalid.CopyFrom(model)
+            invalidate(invalid)
+            results = check_result(invalid)
+            self.assertNotEqual(results[0], "")
+            self.assertEqual(results[0], results[1])
+            self.assertEqual(results[0], results[2])
+
+    def test_check_model_full_check(self):  # type: () -> None
+        def make_model(shape):  # type: (Sequence[int]) -> onnx.ModelProto
+            graph = helper.make_graph(
+                [helper.make_node("Reshape", ["W", "shape"], ["Y"])],
+                "test",
+                [],
+                [helper.make_tensor_value_info("Y", TensorProto.FLOAT, [2048])],
+                initializer=[numpy_helper.from_array(np.ones((64, 32), dtype=np.float32), "W"),
+                             numpy_helper.from_array(np.array(shape, dtype=np.int64), "shape")])
+            return helper.make_model(graph, producer_name='test')
+
+        # Shape inference reads the data of the shape initializer, and not of W
+        model = make_model([2048])
+        checker.check_model(model, full_check=True)
+        checker.check_model(model, full_check=True, skip_tensor_data=True)
+        checker.check_model(model.SerializeToString(), full_check=True)
+        self.assertEqual(len(model.graph.value_info), 0)
+
+        invalid = make_model([1024, 2])
+        checker.check_model(invalid)
+        self.assertRaises(shape_inference.InferenceError, checker.check_model, invalid, full_check=True)
+        self.assertRaises(shape_inference.InferenceError, checker.check_model, invalid.SerializeToString(), full_check=True)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            model_path = os.path.join(temp_dir, "model.onnx")
+            onnx.save(model, model_path)
+            checker.check_model(model_path, full_check=True)
+            # The inferred model is not saved
+            self.assertEqual(len(onnx.load(model_path).graph.value_info), 0)
+            onnx.save(invalid, model_path)
+            self.assertRaises(shape_inference.InferenceError, checker.check_model, model_path, full_check=True)
+
+    def test_check_model_full_check_with_large_shape_data(self):  # type: () -> None
+        shape = [1] * 1023 + [1024]
+        graph = helper.make_graph(
+            [helper.make_node("Reshape", ["W", "shape"], ["Y"])],
+            "test",
+            [],
+            [helper.make_tensor_value_info("Y", TensorProto.FLOAT, shape)],
+            initializer=[numpy_helper.from_array(np.ones(1024, dtype=np.float32), "W"),
+                         numpy_helper.from_array(np.array(shape, dtype=np.int64), "shape"),
+                         numpy_helper.from_array(np.ones(1024, dtype=np.float32), "unused")])
+        model = helper.make_model(graph, producer_name='test')
+        checker.check_model(model, full_check=True)
+
+        # Over 2GB, the float initializers are stubbed, consumed or not, but the 1024
+        # element shape is passed whole, as shape inference reads it
+        for skip_tensor_data in (False, True):
+            stubbed = self._check_as_over_2gb(model, full_check=True, skip_tensor_data=skip_tensor_data)
+            initializers = onnx.load_model_from_string(stubbed).graph.initializer
+            self.assertLess(len(initializers[0].raw_data), 4096)
+            np.testing.assert_equal(numpy_helper.to_array(initializers[1]), shape)
+            self.assertLess(len(initializers[2].raw_data), 4096)
+
     def test_check_old_model(self):  # type: () -> None
         node = helper.make_node(
             "Pad", ["X"], ["Y"], paddings=(0, 0, 0, 0))
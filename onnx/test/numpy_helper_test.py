@@ -7,8 +7,10 @@ from __future__ import unicode_literals
 
 import numpy as np
 
-from onnx import numpy_helper
+from onnx import numpy_helper, helper, mapping, SequenceProto, TensorProto
+from typing import Any
 
+import tempfile
 import unittest
 
 
@@ -60,6 +62,23 @@ class TestNumpyHelper(unittest.TestCase):
         a_recover = numpy_helper.to_array(tensor_def)
         np.testing.assert_equal(a, a_recover)
 
+    def test_string_fixed_width(self):  # type: () -> None
+        expected = np.array([['Amy', 'Billy'], ['Cindy', '\u00e9t\u00e9']]).astype(object)
+        for a in (expected.astype(str), np.char.encode(expected.astype(str), 'utf-8')):
+            tensor_def = numpy_helper.from_array(a, "test")
+            self.assertEqual(tensor_def.data_type, TensorProto.STRING)
+            self.assertEqual(list(tensor_def.dims), [2, 2])
+            a_recover = numpy_helper.to_array(tensor_def)
+            self.assertEqual(a_recover.dtype, object)
+            np.testing.assert_equal(expected, a_recover)
+
+    def test_string_mixed_objects(self):  # type: () -> None
+        a = np.array(['Amy', b'Billy', 'Cindy'], dtype=object)
+        tensor_def = numpy_helper.from_array(a, "test")
+        self.assertEqual(list(tensor_def.string_data), [b'Amy', b'Billy', b'Cindy'])
+        self.assertRaises(NotImplementedError, numpy_helper.from_array,
+                          np.array(['Amy', 1], dtype=object))
+
     def test_bool(self):  # type: () -> None
         a = np.random.randint(2, size=(13, 37)).astype(bool)
         tensor_def = numpy_helper.from_array(a, "test")
@@ -76,6 +95,162 @@ class TestNumpyHelper(unittest.TestCase):
     def test_complex128(self):  # type: () -> None
         self._test_numpy_helper_float_type(np.complex128)
 
+    def test_big_endian_array(self):  # type: () -> None
+        a = np.arange(12, dtype='>i4').reshape(3, 4)
+        tensor_def = numpy_helper.from_array(a, "test")
+        self.assertEqual(tensor_def.data_type, TensorProto.INT32)
+        # Raw data is stored little-endian regardless of the input byte order
+        self.assertEqual(tensor_def.raw_data, a.astype('<i4').tobytes())
+        np.testing.assert_equal(numpy_helper.to_array(tensor_def), a)
+
+    def test_to_array_byteorder(self):  # type: () -> None
+        a = np.random.rand(3, 4).astype(np.float32)
+        tensor_def = numpy_helper.from_array(a, "test")
+        raw_data = tensor_def.raw_data
+        a_recover = numpy_helper.to_array(tensor_def)
+        self.assertEqual(a_recover.dtype, np.dtype('<f4'))
+        self.assertEqual(tensor_def.raw_data, raw_data)
+        a_native = numpy_helper.to_array(tensor_def, native_byteorder_copy=True)
+        self.assertTrue(a_native.dtype.isnative)
+        np.testing.assert_equal(a_native, a)
+
+    def _test_typed_field_roundtrip(self, a, data_type):  # type: (np.ndarray[Any], int) -> None
+        # make_tensor stores the values in the typed repeated field, not raw_data
+        tensor_def = helper.make_tensor("test", data_type, a.shape, a)
+        self.assertFalse(tensor_def.HasField("raw_data"))
+        a_recover = numpy_helper.to_array(tensor_def)
+        self.assertEqual(a.dtype, a_recover.dtype)
+        np.testing.assert_equal(a, a_recover)
+
+    def test_complex64_typed_field(self):  # type: () -> None
+        a = (np.random.rand(13, 37) + 1j * np.random.rand(13, 37)).astype(np.complex64)
+        self._test_typed_field_roundtrip(a, TensorProto.COMPLEX64)
+
+    def test_complex128_typed_field(self):  # type: () -> None
+        a = np.random.rand(13, 37) + 1j * np.random.rand(13, 37)
+        self._test_typed_field_roundtrip(a, TensorProto.COMPLEX128)
+
+    def test_float16_typed_field(self):  # type: () -> None
+        a = np.random.rand(13, 37).astype(np.float16)
+        self._test_typed_field_roundtrip(a, TensorProto.FLOAT16)
+
+    def test_int64_typed_field(self):  # type: () -> None
+        a = np.random.randint(-1000, 1000, size=(13, 37)).astype(np.int64)
+        self._test_typed_field_roundtrip(a, TensorProto.INT64)
+
+    def test_combine_pairs_to_complex(self):  # type: () -> None
+        np.testing.assert_equal(
+            numpy_helper.combine_pairs_to_complex([1, 2, 3, 4]),
+            np.array([1 + 2j, 3 + 4j]))
+        self.assertEqual(helper.split_complex_to_pairs([1 + 2j, 3 + 4j]), [1, 2, 3, 4])
+
+    def test_initializers_to_arrays(self):  # type: () -> None
+        expected = {
+            "raw": np.random.rand(3, 4).astype(np.float32),
+            "int64": np.arange(5, dtype=np.int64),
+            "fp16": np.random.rand(2, 3).astype(np.float16),
+            "complex": np.array([1 + 2j, 3 - 4j], dtype=np.complex64),
+            "int8": np.array([-128, 0, 127], dtype=np.int8),
+            "bool": np.array([True, False, True]),
+            "string": np.array(['a', 'bc'], dtype=object),
+        }
+        initializers = [
+            numpy_helper.from_array(expected["raw"], "raw"),
+            helper.make_tensor("int64", TensorProto.INT64, [5], expected["int64"]),
+            helper.make_tensor("fp16", TensorProto.FLOAT16, [2, 3], expected["fp16"]),
+            helper.make_tensor("complex", TensorProto.COMPLEX64, [2], expected["complex"]),
+            helper.make_tensor("int8", TensorProto.INT8, [3], expected["int8"]),
+            helper.make_tensor("bool", TensorProto.BOOL, [3], expected["bool"]),
+            numpy_helper.from_array(expected["string"], "string"),
+        ]
+        graph = helper.make_graph([], "test", [], [], initializer=initializers)
+        arrays = numpy_helper.initializers_to_arrays(helper.make_model(graph))
+        self.assertEqual(list(arrays.keys()), list(expected.keys()))
+        for name, a in expected.items():
+            self.assertEqual(a.dtype, arrays[name].dtype)
+            np.testing.assert_equal(a, arrays[name])
+        # Arrays from typed fields share one aligned arena
+        self.assertIs(arrays["int64"].base.base, arrays["fp16"].base.base)
+        self.assertEqual(arrays["fp16"].ctypes.data % numpy_helper._ARENA_ALIGNMENT, 0)
+
+    def test_from_arrays(self):  # type: () -> None
+        arrays = {
+            "float": np.random.rand(3, 4).astype(np.float32),
+            "transposed": np.arange(12, dtype=np.int32).reshape(3, 4).T,
+            "bool": np.array([True, False]),
+            "complex": np.array([1 + 2j, 3 - 4j]),
+            "scalar": np.array(7, dtype=np.int64),
+            "string": np.array(['a', 'bc']),
+        }
+        graph = helper.make_graph([], "test", [], [])
+        tensors = numpy_helper.from_arrays(arrays, graph)
+        self.assertEqual([t.name for t in tensors], list(arrays.keys()))
+        self.assertEqual([t.name for t in graph.initializer], list(arrays.keys()))
+        for tensor in tensors:
+            expected = numpy_helper.from_array(arrays[tensor.name], tensor.name)
+            self.assertEqual(tensor, expected)
+            np.testing.assert_equal(numpy_helper.to_array(tensor), arrays[tensor.name])
+        self.assertEqual(numpy_helper.from_arrays({}), [])
+
+    def test_sequence(self):  # type: () -> None
+        arrays = [np.random.rand(2, 3).astype(np.float32) for _ in range(4)]
+        sequence = numpy_helper.from_list(arrays, "test")
+        self.assertEqual(sequence.name, "test")
+        self.assertEqual(len(sequence.tensor_values), 4)
+        self.assertEqual(sequence.tensor_values[0], numpy_helper.from_array(arrays[0]))
+        for a, a_recover in zip(arrays, numpy_helper.to_list(sequence)):
+            np.testing.assert_equal(a, a_recover)
+        stacked = numpy_helper.to_list(sequence, stack=True)
+        self.assertIsInstance(stacked, np.ndarray)
+        np.testing.assert_equal(stacked, np.stack(arrays))
+        # A stacked array converts back to the same sequence
+        self.assertEqual(numpy_helper.from_list(stacked, "test"), sequence)
+
+    def test_sequence_stack_typed_fields(self):  # type: () -> None
+        for data_type, values in [(TensorProto.FLOAT, [[1.0, 2.0], [3.0, 4.0]]),
+                                  (TensorProto.COMPLEX128, [[1 + 2j, 3j], [4, 5 - 1j]]),
+                                  (TensorProto.INT64, [[1, 2], [3, 4]])]:
+            tensors = [helper.make_tensor("", data_type, [2], v) for v in values]
+            sequence = helper.make_sequence("test", SequenceProto.TENSOR, tensors)
+            stacked = numpy_helper.to_list(sequence, stack=True)
+            self.assertEqual(stacked.dtype, mapping.TENSOR_TYPE_TO_NP_TYPE[data_type])
+            np.testing.assert_equal(stacked, np.array(values))
+
+    def test_sequence_stack_mixed(self):  # type: () -> None
+        arrays = [np.array([1, 2]), np.array([1, 2, 3])]
+        stacked = numpy_helper.to_list(numpy_helper.from_list(arrays), stack=True)
+        self.assertIsInstance(stacked, list)
+        np.testing.assert_equal(stacked[1], arrays[1])
+        strings = [np.array(['a', 'b'], dtype=object), np.array(['c', 'd'], dtype=object)]
+        stacked = numpy_helper.to_list(numpy_helper.from_list(strings), stack=True)
+        np.testing.assert_equal(stacked, np.stack(strings))
+        self.assertRaises(TypeError, numpy_helper.from_list, [np.array([1]), [1]])
+        # Elements may be instances of subclasses of the type of the first one
+        with tempfile.TemporaryFile() as f:
+            mapped = np.memmap(f, dtype=np.int64, shape=(2,))
+            mapped[:] = [3, 4]
+            stacked = numpy_helper.to_list(numpy_helper.from_list([np.array([1, 2]), mapped]), stack=True)
+            np.testing.assert_equal(stacked, [[1, 2], [3, 4]])
+        np.testing.assert_equal(numpy_helper.to_list(numpy_helper.from_list([1, True])), [1, True])
+
+    def test_map(self):  # type: () -> None
+        d = {i: np.float32(i) / 2 for i in range(10)}
+        map = numpy_helper.from_dict(d, "test")
+        self.assertEqual(map.key_type, TensorProto.INT64)
+        self.assertEqual(list(map.keys), list(range(10)))
+        d_recover = numpy_helper.to_dict(map)
+        self.assertEqual(list(d_recover.keys()), list(d.keys()))
+        for key, value in d.items():
+            self.assertEqual(d_recover[key].shape, ())
+            self.assertEqual(d_recover[key], value)
+
+        map = numpy_helper.from_dict({'a': np.array([1, 2]), 'b': np.array([3])})
+        self.assertEqual(map.key_type, TensorProto.STRING)
+        d_recover = numpy_helper.to_dict(map)
+        np.testing.assert_equal(d_recover[b'a'], [1, 2])
+        np.testing.assert_equal(d_recover[b'b'], [3])
+        self.assertRaises(TypeError, numpy_helper.from_dict, {1: np.float32(1), 'a': np.float32(2)})
+
 
 if __name__ == '__main__':
     unittest.main()
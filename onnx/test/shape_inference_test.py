@@ -11,6 +11,7 @@ from onnx.helper import make_node, make_tensor, make_tensor_value_info, make_emp
 from typing import Sequence, Union, Text, Tuple, List, Any, Optional
 import onnx.shape_inference
 import unittest
+from unittest import mock
 import os
 import numpy as np
 
@@ -3976,6 +3977,191 @@ class TestShapeInference(unittest.TestCase):
             graph,
             [make_tensor_value_info('y', TensorProto.FLOAT, ('N', 'C', None, None))])  # type: ignore
 
+    def test_infer_shapes_incremental(self):  # type: () -> None
+        graph = helper.make_graph(
+            [make_node('Relu', ['x'], ['a']),
+             make_node('Transpose', ['a'], ['b'], perm=[1, 0]),
+             make_node('Relu', ['b'], ['c']),
+             make_node('Neg', ['x'], ['d']),
+             make_node('If', ['cond'], ['e'],
+                       then_branch=helper.make_graph([make_node('Relu', ['b'], ['then_out'])], 'then', [], [make_empty_tensor_value_info('then_out')]),
+                       else_branch=helper.make_graph([make_node('Relu', ['b'], ['else_out'])], 'else', [], [make_empty_tensor_value_info('else_out')]))],
+            'test',
+            [make_tensor_value_info('x', TensorProto.FLOAT, (2, 3)), make_tensor_value_info('cond', TensorProto.BOOL, ())],
+            [])
+        model = onnx.shape_inference.infer_shapes(helper.make_model(graph, producer_name='onnx-test'), strict_mode=True)
+        # Types of the nodes not inferred again are taken from value_info
+        value_info = {vi.name: vi for vi in model.graph.value_info}
+        value_info['a'].CopyFrom(make_tensor_value_info('a', TensorProto.FLOAT, (2, 'N')))
+
+        model.graph.node[1].CopyFrom(make_node('Identity', ['a'], ['b']))
+        inferred = onnx.shape_inference.infer_shapes_incremental(model, [1], strict_mode=True)
+        self._compare_value_infos(
+            {vi.name: vi for vi in inferred.graph.value_info}['a'].type,
+            make_tensor_value_info('a', TensorProto.FLOAT, (2, 'N')).type)
+        # The value infos downstream of the changed node are replaced
+        vis = [make_tensor_value_info('a', TensorProto.FLOAT, (2, 'N')),
+               make_tensor_value_info('b', TensorProto.FLOAT, (2, 'N')),
+               make_tensor_value_info('c', TensorProto.FLOAT, (2, 'N')),
+               make_tensor_value_info('d', TensorProto.FLOAT, (2, 3)),
+               make_tensor_value_info('e', TensorProto.FLOAT, (2, 'N'))]
+        inferred_vis = sorted(inferred.graph.value_info, key=lambda x: x.name)
+        self.assertEqual([vi.name for vi in inferred_vis], [vi.name for vi in vis])
+        for vi, inferred_vi in zip(vis, inferred_vis):
+            self._compare_value_infos(vi.type, inferred_vi.type)
+
+        self.assertRaises(onnx.shape_inference.InferenceError, onnx.shape_inference.infer_shapes_incremental, model, [5])
+
+    def test_infer_value_infos(self):  # type: () -> None
+        graph = helper.make_graph(
+            [make_node('Reshape', ['W', 'shape'], ['x']),
+             make_node('Relu', ['x'], ['y'])],
+            'test',
+            [],
+            [make_tensor_value_info('y', TensorProto.FLOAT, None)],
+            initializer=[numpy_helper.from_array(np.ones((64, 32), dtype=np.float32), 'W'),
+                         numpy_helper.from_array(np.array([32, -1], dtype=np.int64), 'shape')],
+            value_info=[make_tensor_value_info('W', TensorProto.FLOAT, (64, 32))])
+        model = helper.make_model(graph, producer_name='onnx-test')
+        value_infos = onnx.shape_inference.infer_value_infos(model, strict_mode=True)
+        self.assertEqual(value_infos, list(onnx.shape_inference.infer_shapes(model, strict_mode=True).graph.value_info))
+        self.assertEqual(value_infos, onnx.shape_inference.infer_value_infos(model.SerializeToString(), strict_mode=True))
+        self.assertEqual([vi.name for vi in value_infos], ['W', 'x'])
+        self._compare_value_infos(value_infos[1].type, make_tensor_value_info('x', TensorProto.FLOAT, (32, 64)).type)
+        self.assertEqual(len(model.graph.value_info), 1)
+
+    def test_infer_value_infos_with_large_shape_data(self):  # type: () -> None
+        shape = [1] * 1023 + [1024]
+        graph = helper.make_graph(
+            [make_node('Reshape', ['W', 'shape'], ['x']),
+             make_node('Relu', ['x'], ['y'])],
+            'test',
+            [],
+            [make_tensor_value_info('y', TensorProto.FLOAT, None)],
+            initializer=[numpy_helper.from_array(np.random.rand(1024).astype(np.float32), 'W'),
+                         numpy_helper.from_array(np.array(shape, dtype=np.int64), 'shape'),
+                         numpy_helper.from_array(np.ones(1024, dtype=np.float32), 'unused')])
+        model = helper.make_model(graph, producer_name='onnx-test')
+        with mock.patch.object(onnx.shape_inference.C, 'infer_value_infos',
+                               wraps=onnx.shape_inference.C.infer_value_infos) as infer_value_infos:
+            value_infos = onnx.shape_inference.infer_value_infos(model, strict_mode=True)
+        # Reshape reads the 1024 element shape, which is passed whole. The data of the float
+        # initializers, consumed or not, is not passed.
+        sent = infer_value_infos.call_args[0][0]
+        self.assertNotIn(model.graph.initializer[0].raw_data, sent)
+        initializers = onnx.load_model_from_string(sent).graph.initializer
+        self.assertEqual(initializers[0].dims, [1024])
+        self.assertFalse(initializers[0].HasField('raw_data'))
+        np.testing.assert_equal(numpy_helper.to_array(initializers[1]), shape)
+        self.assertFalse(initializers[2].HasField('raw_data'))
+        self.assertEqual(value_infos, onnx.shape_inference.infer_value_infos(model.SerializeToString(), strict_mode=True))
+        self.assertEqual([vi.name for vi in value_infos], ['x'])
+        self._compare_value_infos(value_infos[0].type, make_tensor_value_info('x', TensorProto.FLOAT, shape).type)
+
+    def test_function_inference_cache(self):  # type: () -> None
+        perm = onnx.AttributeProto()
+        perm.name = 'perm'
+        perm.ref_attr_name = 'perm'
+        perm.type = onnx.AttributeProto.INTS
+        transpose = make_node('Transpose', ['x'], ['t'])
+        transpose.attribute.extend([perm])
+        layer = onnx.FunctionProto()
+        layer.domain = 'local'
+        layer.name = 'layer'
+        layer.input.extend(['x'])
+        layer.output.extend(['y'])
+        layer.attribute.extend(['perm'])
+        layer.node.extend([transpose, make_node('Relu', ['t'], ['y'])])
+        layer.opset_import.extend([make_opsetid(ONNX_DOMAIN, 13)])
+        nonzero = onnx.FunctionProto()
+        nonzero.domain = 'local'
+        nonzero.name = 'nonzero'
+        nonzero.input.extend(['x'])
+        nonzero.output.extend(['y'])
+        nonzero.node.extend([make_node('NonZero', ['x'], ['y'])])
+        nonzero.opset_import.extend([make_opsetid(ONNX_DOMAIN, 13)])
+
+        nodes = [make_node('layer', ['x{}'.format(i)], ['x{}'.format(i + 1)], domain='local', perm=[1, 0, 2]) for i in range(10)]
+        nodes.append(make_node('layer', ['x10'], ['x11'], domain='local', perm=[2, 1, 0]))
+        nodes.extend([make_node('nonzero', ['x11'], ['n0'], domain='local'), make_node('nonzero', ['x11'], ['n1'], domain='local')])
+        graph = helper.make_graph(nodes, 'test', [make_tensor_value_info('x0', TensorProto.FLOAT, (2, 3, 4))], [])
+        model = helper.make_model(graph, producer_name='onnx-test',
+                                  opset_imports=[make_opsetid(ONNX_DOMAIN, 13), make_opsetid('local', 1)])
+        model.functions.extend([layer, nonzero])
+        stats = onnx.shape_inference.FunctionInferenceStats()
+        inferred = onnx.shape_inference.infer_shapes(model, strict_mode=True, function_stats=stats)
+        # The calls of layer with the same input type and perm are inferred once: the 10 first
+        # alternate between two input types. The outputs of nonzero get a new symbol at each
+        # call, so they are not cached
+        self.assertEqual(stats.hits, 8)
+        self.assertEqual(stats.misses, 5)
+        value_infos = {vi.name: vi for vi in inferred.graph.value_info}
+        shapes = {name: (3, 2, 4) if i % 2 == 0 else (2, 3, 4) for (i, name) in enumerate('x{}'.format(i) for i in range(1, 11))}
+        shapes['x11'] = (4, 3, 2)
+        for name, shape in shapes.items():
+            self._compare_value_infos(value_infos[name].type, make_tensor_value_info(name, TensorProto.FLOAT, shape).type)
+        self.assertNotEqual(value_infos['n0'].type.tensor_type.shape.dim[1].dim_param,
+                            value_infos['n1'].type.tensor_type.shape.dim[1].dim_param)
+
+        # Calls with constant input data, and all calls with data propagation, are inferred
+        # without a lookup and counted as misses
+        model.graph.initializer.extend([numpy_helper.from_array(np.ones((2, 3, 4), dtype=np.float32), 'c')])
+        model.graph.node.extend([make_node('layer', ['c'], ['c1'], domain='local', perm=[1, 0, 2])])
+        stats = onnx.shape_inference.FunctionInferenceStats()
+        onnx.shape_inference.infer_shapes(model, strict_mode=True, function_stats=stats)
+        self.assertEqual((stats.hits, stats.misses), (8, 6))
+        stats = onnx.shape_inference.FunctionInferenceStats()
+        onnx.shape_inference.infer_shapes(model, strict_mode=True, data_prop=True, function_stats=stats)
+        self.assertEqual((stats.hits, stats.misses), (0, 14))
+
+    def test_infer_shapes_parallel(self):  # type: () -> None
+        nonzero = onnx.FunctionProto()
+        nonzero.domain = 'local'
+        nonzero.name = 'nonzero'
+        nonzero.input.extend(['x'])
+        nonzero.output.extend(['y'])
+        nonzero.node.extend([make_node('NonZero', ['x'], ['t']), make_node('Transpose', ['t'], ['y'])])
+        nonzero.opset_import.extend([make_opsetid(ONNX_DOMAIN, 13)])
+
+        def make_branch(name, depth):  # type: (Text, int) -> GraphProto
+            nodes = [make_node('NonZero', ['x'], [name + '_n']), make_node('Transpose', [name + '_n'], [name + '_t'])]
+            if depth > 0:
+                nodes.append(make_node('If', ['cond'], [name + '_y'],
+                                       then_branch=make_branch(name + '_then', depth - 1),
+                                       else_branch=make_branch(name + '_else', depth - 1)))
+            else:
+                nodes.append(make_node('Identity', [name + '_t'], [name + '_y']))
+            return helper.make_graph(nodes, name, [], [make_tensor_value_info(name + '_y', TensorProto.INT64, None)])
+
+        nodes = [make_node('If', ['cond'], ['y'], then_branch=make_branch('then', 2), else_branch=make_branch('else', 2))]
+        nodes.extend(make_node('nonzero', ['x'], ['f{}'.format(i)], domain='local') for i in range(6))
+        nodes.append(make_node('Concat', ['f{}'.format(i) for i in range(6)], ['z'], axis=1))
+        graph = helper.make_graph(
+            nodes,
+            'test',
+            [make_tensor_value_info('cond', TensorProto.BOOL, ()), make_tensor_value_info('x', TensorProto.FLOAT, (2, 3))],
+            [make_tensor_value_info('y', TensorProto.INT64, None), make_tensor_value_info('z', TensorProto.INT64, None)])
+        model = helper.make_model(graph, producer_name='onnx-test',
+                                  opset_imports=[make_opsetid(ONNX_DOMAIN, 13), make_opsetid('local', 1)])
+        model.functions.extend([nonzero])
+
+        serial = onnx.shape_inference.infer_shapes(model, strict_mode=True)
+        for num_threads in (4, 0):
+            parallel = onnx.shape_inference.infer_shapes(model, strict_mode=True, num_threads=num_threads)
+            self.assertEqual(parallel, serial)
+        value_infos = {vi.name: vi for vi in serial.graph.value_info}
+        self.assertEqual(len({value_infos['f{}'.format(i)].type.tensor_type.shape.dim[0].dim_param for i in range(6)}), 6)
+
+        # The branch of If inferred first reports its error, as in a serial run
+        branches = {attr.name: attr.g for attr in model.graph.node[0].attribute}
+        branches['then_branch'].value_info.extend([make_tensor_value_info('then_t', TensorProto.INT64, (1, 2, 3))])
+        branches['else_branch'].value_info.extend([make_tensor_value_info('else_n', TensorProto.INT64, (1, 2, 3))])
+        with self.assertRaises(onnx.shape_inference.InferenceError) as serial_error:
+            onnx.shape_inference.infer_shapes(model, strict_mode=True)
+        with self.assertRaises(onnx.shape_inference.InferenceError) as parallel_error:
+            onnx.shape_inference.infer_shapes(model, strict_mode=True, num_threads=4)
+        self.assertEqual(str(parallel_error.exception), str(serial_error.exception))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,13 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import hashlib
+import io
 import tempfile
 import unittest
 import uuid
 
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import shutil
 
@@ -17,8 +21,10 @@ from onnx.external_data_helper import set_external_data
 from onnx.external_data_helper import convert_model_to_external_data
 from onnx.external_data_helper import convert_model_from_external_data
 from onnx.external_data_helper import load_external_data_for_model, load_external_data_for_tensor
+from onnx.external_data_helper import ExternalDataCache, ExternalDataInfo, load_external_data_range
+from onnx import external_data_helper, numpy_helper
 from onnx.numpy_helper import to_array, from_array
-from typing import Any, Tuple, Text, List
+from typing import Any, Tuple, Text, List, cast
 import pytest  # type: ignore
 import sys
 
@@ -112,6 +118,92 @@ class TestLoadExternalData(TestLoadExternalDataBase):
         attribute_tensor = new_model.graph.node[0].attribute[0].t
         self.assertTrue(np.allclose(to_array(attribute_tensor), self.attribute_value))
 
+    def test_load_model_async(self):  # type: () -> None
+        submitted = []  # type: List[Any]
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):  # type: ignore
+                submitted.append(fn)
+                return super(RecordingExecutor, self).submit(fn, *args, **kwargs)
+
+        # asyncio.run() only exists since Python 3.7
+        loop = asyncio.new_event_loop()
+        try:
+            with RecordingExecutor() as executor:
+                model = loop.run_until_complete(onnx.load_model_async(self.model_filename, executor=executor))
+        finally:
+            loop.close()
+        self.assertEqual(model, onnx.load_model(self.model_filename))
+        # Parsing, planning the reads, then one read per data file, all in the executor
+        self.assertEqual(len(submitted), 4)
+
+    def test_load_external_data_mmap(self):  # type: () -> None
+        model = onnx.load_model(self.model_filename, mmap=True)
+        initializer_tensor = model.graph.initializer[0]
+        self.assertFalse(initializer_tensor.HasField("raw_data"))
+        self.assertEqual(initializer_tensor.data_location, TensorProto.EXTERNAL)
+
+        initializer_array = to_array(initializer_tensor, self.temp_dir, mmap=True)
+        self.assertIsInstance(initializer_array, np.memmap)
+        self.assertFalse(initializer_array.flags.writeable)
+        self.assertTrue(np.allclose(initializer_array, self.initializer_value))
+
+        attribute_tensor = model.graph.node[0].attribute[0].t
+        self.assertTrue(np.allclose(to_array(attribute_tensor, self.temp_dir, mmap=True), self.attribute_value))
+        # The directory of the data is not recorded in the model
+        serialized = model.SerializeToString()
+        self.assertNotIn(self.temp_dir.encode(), serialized)
+        checker.check_model(model, base_dir=self.temp_dir)
+        self.assertEqual(model.SerializeToString(), serialized)
+        # The directory is passed explicitly, so it applies to copies of the model alike
+        copied = ModelProto()
+        copied.CopyFrom(model)
+        checker.check_model(copied, base_dir=self.temp_dir)
+        self.assertRaises(checker.ValidationError, checker.check_model, copied)
+        # Without mmap the data is read into raw_data as before
+        self.assertTrue(np.allclose(to_array(attribute_tensor, self.temp_dir), self.attribute_value))
+
+    def test_save_external_data_loaded_with_mmap(self):  # type: () -> None
+        model = onnx.load_model(self.model_filename, mmap=True)
+
+        temp_dir = os.path.join(self.temp_dir, "save_copy")
+        os.mkdir(temp_dir)
+        new_model_filename = os.path.join(temp_dir, 'model.onnx')
+        onnx.save_model(model, new_model_filename, base_dir=self.temp_dir)
+
+        new_model = onnx.load_model(new_model_filename)
+        initializer_tensor = new_model.graph.initializer[0]
+        self.assertTrue(np.allclose(to_array(initializer_tensor), self.initializer_value))
+
+        attribute_tensor = new_model.graph.node[0].attribute[0].t
+        self.assertTrue(np.allclose(to_array(attribute_tensor), self.attribute_value))
+
+    def test_save_model_loaded_with_mmap_as_after_load(self):  # type: () -> None
+        model = onnx.load_model(self.model_filename, mmap=True)
+        new_model_filename = os.path.join(self.temp_dir, 'copy.onnx')
+        onnx.save_model(model, new_model_filename, save_as_external_data=True, location='new.bin', size_threshold=0,
+                        base_dir=self.temp_dir)
+        self.assertTrue(os.path.isfile(os.path.join(self.temp_dir, 'new.bin')))
+        new_model = onnx.load_model(new_model_filename)
+        self.assertTrue(np.allclose(to_array(new_model.graph.initializer[0]), self.initializer_value))
+
+        # Saved without external data, the tensors are embedded
+        model = onnx.load_model(self.model_filename, mmap=True)
+        stream = io.BytesIO()
+        onnx.save_model(model, stream, base_dir=self.temp_dir)
+        new_model = onnx.load_model_from_string(stream.getvalue())
+        self.assertNotIn(self.temp_dir.encode(), stream.getvalue())
+        self.assertFalse(external_data_helper.uses_external_data(new_model.graph.initializer[0]))
+        self.assertTrue(np.allclose(to_array(new_model.graph.initializer[0]), self.initializer_value))
+
+    def test_initializers_to_arrays(self):  # type: () -> None
+        model = onnx.load_model(self.model_filename, load_external_data=False)
+        arrays = numpy_helper.initializers_to_arrays(model, self.temp_dir)
+        self.assertEqual(list(arrays.keys()), ["input_value"])
+        np.testing.assert_equal(arrays["input_value"], self.initializer_value)
+        # The model itself is left untouched
+        self.assertFalse(model.graph.initializer[0].HasField("raw_data"))
+
 
 class TestLoadExternalDataSingleFile(TestLoadExternalDataBase):
 
@@ -429,6 +521,12 @@ class TestExternalDataToArray(unittest.TestCase):
         model = helper.make_model(graph_def, producer_name='onnx-example')
         return model
 
+    def create_many_tensors_model(self, shapes):  # type: (List[Tuple[int, ...]]) -> Tuple[ModelProto, List[np.ndarray]]
+        values = [np.random.rand(*shape).astype(np.float32) for shape in shapes]
+        initializers = [from_array(value, 'w{}'.format(i)) for (i, value) in enumerate(values)]
+        graph = helper.make_graph([], 'many-tensors', [], [], initializer=initializers)
+        return helper.make_model(graph), values
+
     def test_check_model(self):  # type: () -> None
         checker.check_model(self.model)
 
@@ -453,6 +551,143 @@ class TestExternalDataToArray(unittest.TestCase):
         loaded_large_data = to_array(model.graph.initializer[0], self.temp_dir)
         self.assertTrue(np.allclose(loaded_large_data, self.large_data))
 
+    def test_to_array_with_external_data_cache(self):  # type: () -> None
+        onnx.save_model(self.model,
+                        self.model_file_path,
+                        save_as_external_data=True,
+                        all_tensors_to_one_file=False,
+                        size_threshold=0)
+        model = onnx.load(self.model_file_path, load_external_data=False)
+        cache = ExternalDataCache(max_bytes=self.large_data.nbytes)
+
+        large_tensor = model.graph.initializer[0]
+        self.assertTrue(np.allclose(to_array(large_tensor, self.temp_dir, cache=cache), self.large_data))
+        self.assertFalse(large_tensor.HasField("raw_data"))
+        self.assertEqual(cache.size, self.large_data.nbytes)
+
+        # Loading another tensor evicts the least recently used one
+        small_tensor = model.graph.initializer[1]
+        self.assertTrue(np.allclose(to_array(small_tensor, self.temp_dir, cache=cache), self.small_data))
+        self.assertFalse(small_tensor.HasField("raw_data"))
+        self.assertEqual(cache.size, np.array(self.small_data, np.int64).nbytes)
+
+        cache.clear()
+        self.assertEqual(cache.size, 0)
+
+    def test_load_external_data_for_model_with_many_tensors(self):  # type: () -> None
+        model, values = self.create_many_tensors_model([(i + 1, 300) for i in range(20)])
+        onnx.save_model(model, self.model_file_path,
+                        save_as_external_data=True, all_tensors_to_one_file=True, size_threshold=0)
+
+        model = onnx.load_model(self.model_file_path, load_external_data=False)
+        load_external_data_for_model(model, self.temp_dir, num_threads=4)
+        for (tensor, value) in zip(model.graph.initializer, values):
+            self.assertEqual(tensor.data_location, TensorProto.DEFAULT)
+            np.testing.assert_equal(to_array(tensor), value)
+
+    def test_save_model_writes_tensors_contiguously(self):  # type: () -> None
+        model, values = self.create_many_tensors_model([(i + 1, 10) for i in range(5)])
+        onnx.save_model(model, self.model_file_path, save_as_external_data=True,
+                        all_tensors_to_one_file=True, location='weights.bin', size_threshold=0)
+
+        model = onnx.load_model(self.model_file_path, load_external_data=False)
+        offset = 0
+        for (tensor, value) in zip(model.graph.initializer, values):
+            info = ExternalDataInfo(tensor)
+            self.assertEqual(info.offset, offset)
+            self.assertEqual(info.length, value.nbytes)
+            offset += value.nbytes
+        self.assertEqual(os.path.getsize(os.path.join(self.temp_dir, 'weights.bin')), offset)
+
+    def test_save_model_with_aligned_external_data(self):  # type: () -> None
+        model, values = self.create_many_tensors_model([(i + 1, 10) for i in range(5)])
+        onnx.save_model(model, self.model_file_path, save_as_external_data=True,
+                        all_tensors_to_one_file=True, size_threshold=0, align=4096)
+
+        model = onnx.load_model(self.model_file_path, mmap=True)
+        for (tensor, value) in zip(model.graph.initializer, values):
+            self.assertEqual(cast(int, ExternalDataInfo(tensor).offset) % 4096, 0)
+            np.testing.assert_equal(to_array(tensor, self.temp_dir, mmap=True), value)
+
+    def test_save_model_with_deduplicated_external_data(self):  # type: () -> None
+        value = np.random.rand(10, 10).astype(np.float32)
+        other_value = value + 1
+        initializers = [from_array(value, 'a'), from_array(other_value, 'b'), from_array(value, 'c')]
+        graph = helper.make_graph([], 'duplicates', [], [], initializer=initializers)
+        onnx.save_model(helper.make_model(graph), self.model_file_path, save_as_external_data=True,
+                        location='weights.bin', size_threshold=0, deduplicate=True)
+        self.assertEqual(os.path.getsize(os.path.join(self.temp_dir, 'weights.bin')), 2 * value.nbytes)
+
+        model = onnx.load_model(self.model_file_path, load_external_data=False)
+        a, b, c = [ExternalDataInfo(tensor) for tensor in model.graph.initializer]
+        self.assertEqual((a.location, a.offset), (c.location, c.offset))
+        self.assertNotEqual(a.offset, b.offset)
+
+        load_external_data_for_model(model, self.temp_dir)
+        for (tensor, expected) in zip(model.graph.initializer, [value, other_value, value]):
+            np.testing.assert_equal(to_array(tensor), expected)
+
+    def test_save_model_with_sharded_external_data(self):  # type: () -> None
+        model, values = self.create_many_tensors_model([(10, 10) for i in range(5)])
+        onnx.save_model(model, self.model_file_path, save_as_external_data=True,
+                        location='weights.bin', size_threshold=0, max_shard_size=2 * values[0].nbytes)
+
+        shards = ['weights.bin-{:05d}-of-00003'.format(i + 1) for i in range(3)]
+        for shard in shards:
+            self.assertTrue(Path.isfile(os.path.join(self.temp_dir, shard)))
+
+        model = onnx.load_model(self.model_file_path, load_external_data=False)
+        locations = [ExternalDataInfo(tensor).location for tensor in model.graph.initializer]
+        self.assertEqual(locations, [shards[0], shards[0], shards[1], shards[1], shards[2]])
+
+        load_external_data_for_model(model, self.temp_dir)
+        for (tensor, value) in zip(model.graph.initializer, values):
+            np.testing.assert_equal(to_array(tensor), value)
+
+    def test_load_external_data_for_model_with_checksum(self):  # type: () -> None
+        onnx.save_model(self.model, self.model_file_path, save_as_external_data=True,
+                        location='weights.bin', size_threshold=0)
+        model = onnx.load_model(self.model_file_path, load_external_data=False)
+        info = ExternalDataInfo(model.graph.initializer[0])
+        self.assertEqual(info.checksum, hashlib.sha1(self.large_data.tobytes()).hexdigest())
+
+        load_external_data_for_model(model, self.temp_dir, verify=True)
+        self.assertTrue(np.allclose(to_array(model.graph.initializer[0]), self.large_data))
+
+        with open(os.path.join(self.temp_dir, 'weights.bin'), 'r+b') as data_file:
+            data_file.seek(cast(int, info.offset))
+            data_file.write(b'\xff' * 4)
+        model = onnx.load_model(self.model_file_path, load_external_data=False)
+        self.assertRaises(ValueError, load_external_data_for_model, model, self.temp_dir, verify=True)
+
+    def test_save_model_with_compressed_external_data(self):  # type: () -> None
+        for compression in ['zlib', 'lzma']:
+            onnx.save_model(self.create_test_model(), self.model_file_path, save_as_external_data=True,
+                            location=compression + '.bin', size_threshold=0, compression=compression,
+                            compression_chunk_size=4096)
+            model = onnx.load_model(self.model_file_path, load_external_data=False)
+            tensor = model.graph.initializer[0]
+            info = ExternalDataInfo(tensor)
+            self.assertEqual(info.compression, compression)
+            self.assertEqual(info.chunk_size, 4096)
+            chunks = cast(List[int], info.chunks)
+            self.assertEqual(len(chunks), -(-self.large_data.nbytes // 4096))
+            self.assertEqual(sum(chunks), info.length)
+
+            raw_data = self.large_data.tobytes()
+            self.assertEqual(load_external_data_range(tensor, self.temp_dir, 5000, 13000), raw_data[5000:13000])
+            self.assertRaises(ValueError, to_array, tensor, self.temp_dir, mmap=True)
+
+            model = onnx.load_model(self.model_file_path)
+            self.assertTrue(np.allclose(to_array(model.graph.initializer[0]), self.large_data))
+            self.assertTrue(np.allclose(to_array(model.graph.initializer[1]), self.small_data))
+
+    def test_load_compressed_external_data_with_mmap(self):  # type: () -> None
+        onnx.save_model(self.create_test_model(), self.model_file_path, save_as_external_data=True,
+                        location='zlib.bin', size_threshold=0, compression='zlib')
+        with self.assertRaisesRegex(ValueError, 'is compressed and cannot be memory-mapped'):
+            onnx.load_model(self.model_file_path, mmap=True)
+
     def test_save_model_with_external_data_multiple_times(self):  # type: () -> None
         # Test onnx.save should respectively handle typical tensor and external tensor properly
         # 1st save: save two tensors which have raw_data
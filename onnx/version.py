@@ -0,0 +1,9 @@
+# This file is generated by setup.py. DO NOT EDIT!
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+version = '1.10.2'
+git_version = '5b3aabecaa1677ff9be2b64b28fc4027f6abb019'